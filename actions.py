@@ -4,7 +4,7 @@ from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Optional
 
-from domain import PipelineItem
+from domain import NoteEntry, PipelineItem, format_notes
 
 
 class Action(Enum):
@@ -63,19 +63,22 @@ def apply_action(
 
 def append_note(
     item: PipelineItem, note_text: str, now: Optional[datetime] = None
-) -> PipelineItem:
+) -> Optional[NoteEntry]:
     """
-    Append a timestamped note. No manual "on xx/xx/xxxx" needed.
+    Make a timestamped note entry for item (None for blank text); queue
+    it with repository.queue_append_note. No manual "on xx/xx/xxxx"
+    needed. If the item's notes are loaded the entry is added to them.
     """
-    if not note_text.strip():
-        return item
+    text = note_text.strip()
+    if not text:
+        return None
     if now is None:
         now = datetime.utcnow()
-    timestamp = now.replace(microsecond=0).isoformat()
-    prefix = f"[{timestamp}] "
-    if item.notes:
-        item.notes = item.notes + "\n\n" + prefix + note_text.strip()
-    else:
-        item.notes = prefix + note_text.strip()
+    entry = NoteEntry(item.id, now.replace(microsecond=0), text)
+    if item.notes is not None:
+        formatted = format_notes([entry])
+        item.notes = (
+            item.notes + "\n\n" + formatted if item.notes else formatted
+        )
     item.updated_at = now
-    return item
+    return entry
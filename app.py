@@ -2,22 +2,39 @@
 RecToDo entry point.
 """
 
-import sys
-
-from PySide6.QtWidgets import QApplication
+from startup import get_startup_report  # first: starts the startup clock
 
-from main_window import MainWindow
-from theme import apply_theme, ThemeMode
+import os
+import sys
 
 
 def main():
     """Launch the RecToDo Qt application."""
+    startup = get_startup_report()
+    # Qt and the window's modules; the storage backend (gspread, Google
+    # auth) is imported later on the I/O thread.
+    with startup.phase("import"):
+        from PySide6.QtCore import QTimer
+        from PySide6.QtWidgets import QApplication
+
+        from main_window import MainWindow
+        from theme import apply_theme, ThemeMode
+
     app = QApplication(sys.argv)
     apply_theme(app, ThemeMode.DARK)
 
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    # Runs once the events queued by show(), the first paint among
+    # them, have been handled.
+    QTimer.singleShot(0, lambda: startup.mark("first paint"))
+    exit_code = app.exec()
+
+    if os.environ.get("RECTODO_SHEETS_STATS"):
+        from repository import format_call_stats
+
+        print(format_call_stats())
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
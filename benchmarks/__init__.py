@@ -0,0 +1,5 @@
+"""
+Offline benchmarks for RecToDo. Run from the repository root, e.g.
+``python -m benchmarks.bench_search``; ``python -m benchmarks.suite``
+runs the full suite and saves the results as JSON.
+"""
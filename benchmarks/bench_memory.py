@@ -0,0 +1,57 @@
+"""
+Bytes per PipelineItem at 100k rows: a plain (dict-backed, uninterned)
+dataclass vs. the slotted, interned PipelineItem.
+
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from domain import pipeline_item_from_sheet
+
+from .generator import make_sheet
+from .legacy import legacy_item_from_sheet
+
+ROWS = 100_000
+
+
+def make_rows(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """
+    Generated sheet records as gspread returns them (fresh strings per
+    cell), without notes: list loads leave them out.
+    """
+    header, rows = make_sheet(n, seed)
+    records = [dict(zip(header, row), notes="") for row in rows]
+    # A JSON round trip gives every cell its own string object.
+    return json.loads(json.dumps(records))
+
+
+def retained_bytes(parse: Callable[[Dict[str, Any]], Any], n: int) -> int:
+    """Memory still held by n parsed items once the raw rows are gone."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    rows = make_rows(n)
+    items = [parse(r) for r in rows]
+    del rows
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del items
+    return used
+
+
+def main() -> None:
+    before = retained_bytes(legacy_item_from_sheet, ROWS)
+    after = retained_bytes(pipeline_item_from_sheet, ROWS)
+    print(f"{ROWS} rows")
+    print(f"  dict-backed, uninterned: {before / ROWS:8.0f} bytes/item")
+    print(f"  slotted, interned:       {after / ROWS:8.0f} bytes/item")
+    print(f"  saved:                   {(before - after) / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Row parsing at 100k rows: dict records through the original parser vs.
+raw value rows through domain.RowParser.
+
+    python -m benchmarks.bench_parse
+"""
+
+import time
+
+from domain import RowParser
+
+from .generator import make_sheet
+from .legacy import legacy_item_from_sheet
+
+ROWS = 100_000
+
+
+def main() -> None:
+    header, values = make_sheet(ROWS)
+    # Some rows without stamps, as in hand-edited sheets.
+    created = header.index("created_at")
+    for row in values[::10]:
+        row[created] = ""
+    records = [dict(zip(header, row)) for row in values]
+
+    start = time.perf_counter()
+    old = [legacy_item_from_sheet(r) for r in records]
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = RowParser(header).parse_all(values)
+    after = time.perf_counter() - start
+
+    assert [i.next_check_at for i in old] == [i.next_check_at for i in new]
+    assert [i.updated_at for i in old] == [i.updated_at for i in new]
+
+    print(f"{ROWS} rows")
+    print(f"  dict rows, original parser: {before * 1000:8.0f} ms")
+    print(f"  value rows, RowParser:      {after * 1000:8.0f} ms")
+    print(f"  speedup:                    {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
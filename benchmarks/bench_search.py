@@ -0,0 +1,64 @@
+"""
+Trigram index vs. the linear substring scan, at 1k / 10k / 100k items.
+
+    python -m benchmarks.bench_search
+"""
+
+import time
+from typing import List
+
+from domain import PipelineItem
+from search_index import TrigramIndex
+
+from .generator import SIZES, make_items
+
+QUERIES = ("ann", "smith", "engineer", "acme ltd", "zzq")
+
+
+def scan(items: List[PipelineItem], query: str) -> List[str]:
+    """The search MainWindow._filtered_items used to run."""
+    out = []
+    for i in items:
+        haystack = " ".join(
+            [i.candidate_name or "", i.client or "", i.role or ""]
+        ).lower()
+        if query in haystack:
+            out.append(i.id)
+    return out
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(
+        f"{'items':>8} {'query':<10} {'hits':>7} {'scan ms':>9} "
+        f"{'index ms':>9} {'speedup':>8}"
+    )
+    for n in SIZES:
+        items = make_items(n)
+        index = TrigramIndex()
+        start = time.perf_counter()
+        for i in items:
+            index.add(i)
+        build = time.perf_counter() - start
+        for q in QUERIES:
+            hits = index.search(q)
+            assert set(hits) == set(scan(items, q)), q
+            t_scan = _best_of(lambda: scan(items, q))
+            t_index = _best_of(lambda: index.search(q))
+            print(
+                f"{n:>8} {q:<10} {len(hits):>7} {t_scan * 1000:>9.2f} "
+                f"{t_index * 1000:>9.2f} {t_scan / t_index:>7.1f}x"
+            )
+        print(f"{n:>8} (items indexed in {build * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Seeded generator of synthetic pipeline tabs for the benchmarks (and the
+fake backend); every benchmark builds its rows here.
+
+Rows look like the real sheet: a few owners with uneven shares, mostly
+active candidates with some snoozed, finished and archived ones,
+next-check dates spread around TODAY (some missing), and notes on a
+minority of rows. The same seed always gives the same sheet.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+from domain import SHEET_COLUMNS, PipelineItem, RowParser
+
+SIZES = (1_000, 10_000, 100_000)
+
+# The date every synthetic sheet (and the benchmarks' context) is built
+# around, so results do not drift with the calendar.
+TODAY = date(2025, 3, 15)
+
+FIRST = ["Anna", "Ben", "Chloe", "Daniel", "Ella", "Finn", "Grace", "Hugo"]
+LAST = ["Smith", "Jones", "Taylor", "Brown", "Wilson", "Evans", "Thomas"]
+CLIENTS = ["Acme Ltd", "Globex", "Initech", "Umbrella", "Hooli", "Stark"]
+ROLES = ["Engineer", "Analyst", "Designer", "Manager", "Consultant"]
+OWNERS = (("Kerem", 5), ("Aylin", 3), ("Deniz", 2))
+STATUSES = (("ACTIVE", 60), ("SNOOZED", 20), ("DONE", 15), ("", 5))
+STAGES = ("sent", "feedback requested", "interview", "offer", "on hold")
+ACTIONS = ("", "SPOKE", "EMAILED", "NA_CALL_TOMORROW", "PREPARED")
+
+
+def _weighted(rng: random.Random, choices: Tuple[Tuple[str, int], ...]):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def _day(today: date, offset: int) -> str:
+    return (today + timedelta(days=offset)).isoformat()
+
+
+def _stamp(rng: random.Random, today: date) -> str:
+    moment = datetime.combine(today, datetime.min.time()) - timedelta(
+        minutes=rng.randint(0, 90 * 24 * 60)
+    )
+    return moment.isoformat()
+
+
+def _notes(rng: random.Random, today: date) -> str:
+    if rng.random() > 0.3:
+        return ""
+    return "\n\n".join(
+        f"[{_stamp(rng, today)}] {rng.choice(ACTIONS[1:]).lower()} "
+        f"re {rng.choice(ROLES).lower()} role"
+        for _ in range(rng.randint(1, 5))
+    )
+
+
+def make_sheet(
+    n: int, seed: int = 1, today: date = TODAY
+) -> Tuple[List[str], List[List[str]]]:
+    """
+    (header, rows) as get_values() returns them for an n-row tab, with
+    dates around today.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        next_check = (
+            "" if rng.random() < 0.1 else _day(today, rng.randint(-10, 14))
+        )
+        last_action = rng.choice(ACTIONS)
+        rows.append(
+            [
+                f"{i:08d}-{rng.getrandbits(64):016x}",
+                _weighted(rng, OWNERS),
+                f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+                rng.choice(CLIENTS),
+                f"{rng.choice(['Senior ', 'Junior ', ''])}"
+                f"{rng.choice(ROLES)}",
+                rng.choice(STAGES),
+                _day(today, -rng.randint(10, 60)),
+                last_action,
+                _day(today, -rng.randint(0, 10)) if last_action else "",
+                next_check,
+                _weighted(rng, STATUSES),
+                _notes(rng, today),
+                _stamp(rng, today),
+                _stamp(rng, today),
+                "TRUE" if rng.random() < 0.05 else "FALSE",
+            ]
+        )
+    return list(SHEET_COLUMNS), rows
+
+
+def make_items(n: int, seed: int = 1) -> List[PipelineItem]:
+    """The same sheet as make_sheet, parsed."""
+    header, rows = make_sheet(n, seed)
+    return RowParser(header).parse_all(rows)
@@ -0,0 +1,78 @@
+"""
+The original row parser, kept as the baseline for the benchmarks: a
+dict-backed dataclass, strptime per format, utcnow() per missing stamp.
+"""
+
+from dataclasses import fields, make_dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from domain import PipelineItem
+
+# PipelineItem as it was: same fields, per-instance __dict__.
+LegacyItem = make_dataclass(
+    "LegacyItem", [(f.name, f.type) for f in fields(PipelineItem)]
+)
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value is None:
+        return False
+    s = str(value).strip().upper()
+    return s in {"TRUE", "1", "YES", "Y"}
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    s = str(value).strip()
+    if not s:
+        return None
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        return None
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    s = str(value).strip()
+    if not s:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_item_from_sheet(row: Dict[str, Any]) -> Any:
+    return LegacyItem(
+        id=str(row.get("id") or ""),
+        owner=str(row.get("owner") or ""),
+        candidate_name=str(row.get("candidate_name") or ""),
+        client=str(row.get("client") or ""),
+        role=str(row.get("role") or ""),
+        stage=str(row.get("stage") or ""),
+        sent_at=_parse_date(row.get("sent_at")),
+        last_action=str(row.get("last_action") or "") or None,
+        last_action_at=_parse_date(row.get("last_action_at")),
+        next_check_at=_parse_date(row.get("next_check_at")),
+        status=str(row.get("status") or "ACTIVE"),
+        notes=str(row.get("notes") or ""),
+        created_at=_parse_datetime(row.get("created_at")) or datetime.utcnow(),
+        updated_at=_parse_datetime(row.get("updated_at")) or datetime.utcnow(),
+        archived=_parse_bool(row.get("archived")),
+    )
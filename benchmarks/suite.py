@@ -0,0 +1,311 @@
+"""
+Offline benchmark suite: parsing, filtering, KPIs, name lookup, search
+and the table model, over synthetic sheets of 1k / 10k / 100k rows.
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --sizes 1000 10000 --out before.json
+    python -m benchmarks.suite --compare before.json
+
+Each case reports the best and median wall time over --repeat runs and
+the peak memory allocated by one more run under tracemalloc. Results are
+saved as JSON (--out); --compare prints the time ratio against a saved
+run and exits with status 1 if any case got slower than --threshold.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from data_loader import kpi_counts
+from domain import (
+    EvaluationContext,
+    PipelineItem,
+    RowParser,
+    filter_active,
+    filter_visible,
+    pipeline_item_from_sheet,
+)
+from pipeline_columns import PipelineColumns
+from search_index import TrigramIndex
+from utils import find_candidate_by_name
+
+from .bench_search import QUERIES, scan
+from .generator import SIZES, TODAY, make_sheet
+
+SEED = 1
+SCREEN_ROWS = 40  # rows a table view shows at once
+
+
+@dataclass
+class Fixture:
+    """One synthetic sheet, in every shape the cases start from."""
+
+    size: int
+    header: List[str]
+    rows: List[List[str]]
+    records: List[Dict[str, str]]
+    items: List[PipelineItem]
+
+
+def make_fixture(size: int, seed: int = SEED) -> Fixture:
+    header, rows = make_sheet(size, seed)
+    return Fixture(
+        size=size,
+        header=header,
+        rows=rows,
+        records=[dict(zip(header, r)) for r in rows],
+        items=RowParser(header).parse_all(rows),
+    )
+
+
+def _context() -> EvaluationContext:
+    # A fresh context per run: tiers are memoized per context.
+    return EvaluationContext(TODAY)
+
+
+# ---- Cases: each takes a fixture and returns the callable to time ----
+
+
+def case_parse_records(fx: Fixture) -> Callable[[], Any]:
+    return lambda: [pipeline_item_from_sheet(r) for r in fx.records]
+
+
+def case_parse_values(fx: Fixture) -> Callable[[], Any]:
+    return lambda: RowParser(fx.header).parse_all(fx.rows)
+
+
+def case_filter_active(fx: Fixture) -> Callable[[], Any]:
+    return lambda: filter_active(fx.items)
+
+
+def case_filter_visible(fx: Fixture) -> Callable[[], Any]:
+    return lambda: filter_visible(fx.items, _context())
+
+
+def case_kpi_counts(fx: Fixture) -> Callable[[], Any]:
+    return lambda: kpi_counts(fx.items, _context())
+
+
+def case_kpi_counts_columns(fx: Fixture) -> Callable[[], Any]:
+    columns = PipelineColumns()
+    for item in fx.items:
+        columns.add(item)
+    return lambda: columns.kpi_counts(_context())
+
+
+def case_find_candidate(fx: Fixture) -> Callable[[], Any]:
+    # A name that is not there: the duplicate check's usual, full pass.
+    return lambda: find_candidate_by_name(fx.items, "Kerem", "Nobody Here")
+
+
+def case_search_scan(fx: Fixture) -> Callable[[], Any]:
+    return lambda: [scan(fx.items, q) for q in QUERIES]
+
+
+def case_search_index(fx: Fixture) -> Callable[[], Any]:
+    index = TrigramIndex()
+    for item in fx.items:
+        index.add(item)
+    return lambda: [index.search(q) for q in QUERIES]
+
+
+_app = None
+
+
+def _table_model(fx: Fixture):
+    global _app
+    from PySide6.QtCore import QCoreApplication
+
+    from table_model import PipelineTableModel
+
+    if QCoreApplication.instance() is None:
+        _app = QCoreApplication([])
+    model = PipelineTableModel(fx.items)
+    model.set_context(_context())
+    return model
+
+
+def case_model_screen(fx: Fixture) -> Callable[[], Any]:
+    from PySide6.QtCore import Qt
+
+    model = _table_model(fx)
+    step = max(1, fx.size // SCREEN_ROWS)
+    cells = [
+        model.index(row, col)
+        for row in range(0, fx.size, step)[:SCREEN_ROWS]
+        for col in range(model.columnCount())
+    ]
+    roles = (Qt.DisplayRole, Qt.ForegroundRole, Qt.BackgroundRole)
+    days = [0]
+
+    def run():
+        # Another day drops the cached rows: a cold first paint.
+        days[0] += 1
+        model.set_context(EvaluationContext(TODAY + timedelta(days[0])))
+        return [model.data(i, r) for i in cells for r in roles]
+
+    return run
+
+
+def case_model_sort(fx: Fixture) -> Callable[[], Any]:
+    from table_model import SORT_ROLE
+
+    model = _table_model(fx)
+    column = [model.index(row, 5) for row in range(fx.size)]
+    days = [0]
+
+    def run():
+        # Sort keys of one whole column, as a header click asks for.
+        days[0] += 1
+        model.set_context(EvaluationContext(TODAY + timedelta(days[0])))
+        return [model.data(i, SORT_ROLE) for i in column]
+
+    return run
+
+
+CASES: Dict[str, Callable[[Fixture], Callable[[], Any]]] = {
+    "parse.pipeline_item_from_sheet": case_parse_records,
+    "parse.RowParser": case_parse_values,
+    "filter_active": case_filter_active,
+    "filter_visible": case_filter_visible,
+    "kpi_counts": case_kpi_counts,
+    "kpi_counts.columns": case_kpi_counts_columns,
+    "find_candidate_by_name": case_find_candidate,
+    "search.scan": case_search_scan,
+    "search.index": case_search_index,
+    "table_model.data.screen": case_model_screen,
+    "table_model.data.sort_column": case_model_sort,
+}
+
+
+# ---- Measuring ----
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    del result
+
+    return {
+        "best_ms": round(min(times) * 1000, 3),
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suite(
+    sizes: Tuple[int, ...], cases: List[str], repeat: int
+) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {c: {} for c in cases}
+    for size in sizes:
+        fx = make_fixture(size)
+        for name in cases:
+            stats = measure(CASES[name](fx), repeat)
+            results[name][str(size)] = stats
+            print(
+                f"{name:<32}{size:>8}{stats['best_ms']:>11.2f}"
+                f"{stats['median_ms']:>11.2f}{stats['peak_kib']:>12.1f}"
+            )
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": SEED,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Print best-time ratios; return the cases slower than threshold."""
+    slower = []
+    print(f"\nvs. {baseline['meta'].get('commit') or 'baseline'}")
+    for name, by_size in current["results"].items():
+        for size, stats in by_size.items():
+            old = baseline["results"].get(name, {}).get(size)
+            if not old or not old["best_ms"]:
+                continue
+            ratio = stats["best_ms"] / old["best_ms"]
+            flag = ""
+            if ratio > threshold:
+                flag = "  SLOWER"
+                slower.append(f"{name}@{size}")
+            print(f"{name:<32}{size:>8}{ratio:>10.2f}x{flag}")
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RecToDo benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument(
+        "--cases", nargs="+", choices=sorted(CASES), default=list(CASES)
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", metavar="BASELINE_JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio that counts as a regression (default 1.25)",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<32}{'rows':>8}{'best ms':>11}{'median ms':>11}"
+        f"{'peak KiB':>12}"
+    )
+    current = run_suite(tuple(args.sizes), args.cases, args.repeat)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2)
+    print(f"\nResults written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        slower = compare(current, baseline, args.threshold)
+        if slower:
+            print(f"\n{len(slower)} regression(s): {', '.join(slower)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
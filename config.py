@@ -26,3 +26,48 @@ TABLE_COLUMNS = [
     "Due in (days)",
     "Priority",
 ]
+
+# Delay before queued sheet writes are sent as one batch (milliseconds)
+WRITE_FLUSH_DELAY_MS = 2000
+
+# Writes sent per flush when draining a backlog (row ids)
+WRITE_BATCH_SIZE = 200
+
+# Offline: first retry after a failed sync, doubled per failure up to the
+# maximum (milliseconds)
+OFFLINE_RETRY_MIN_MS = 5_000
+OFFLINE_RETRY_MAX_MS = 5 * 60 * 1000
+
+# Scheduled resync from the sheet; local edits never need one
+# (milliseconds). It downloads rows changed since the last one, by
+# updated_at; every FULL_RESYNC_EVERY-th downloads every row, to pick up
+# hand edits (which leave updated_at alone) and removed rows.
+RESYNC_INTERVAL_MS = 5 * 60 * 1000
+FULL_RESYNC_EVERY = 6
+
+# Rows last synced longer ago than this are flagged as stale in the
+# window (milliseconds)
+STALE_DATA_AFTER_MS = 15 * 60 * 1000
+
+# Pause in typing before the search filter is applied (milliseconds)
+SEARCH_DEBOUNCE_MS = 150
+
+# Notes kept in memory, most recently opened first (candidates)
+NOTES_CACHE_SIZE = 200
+
+# Pause after selecting a row before its notes are prefetched (milliseconds)
+NOTES_PREFETCH_DELAY_MS = 300
+
+# Where the pipeline is stored: "sheets" (the shared Google spreadsheet),
+# "sqlite" (a local file, no Google account needed) or "fake" (in-memory,
+# for load testing). The RECTODO_BACKEND environment variable overrides it.
+STORAGE_BACKEND = "sheets"
+
+# File of the "sqlite" backend
+LOCAL_STORE_PATH = "rectodo_local.sqlite3"
+
+# The "fake" backend: generated rows, and the latency (milliseconds) and
+# share of calls failing with a quota error it simulates
+FAKE_SHEET_ROWS = 10_000
+FAKE_SHEET_LATENCY_MS = 300
+FAKE_SHEET_QUOTA_ERROR_RATE = 0.0
@@ -2,28 +2,227 @@
 Data loading and KPI calculations for RecToDo.
 """
 
-from typing import List
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
 
-from domain import PipelineItem, filter_active, pipeline_item_from_sheet
-from sheets_repo import get_pipeline_rows
+from domain import (
+    SHEET_COLUMNS,
+    EvaluationContext,
+    PipelineItem,
+    RowParser,
+    evaluation_context,
+    parse_flag,
+)
+from local_mirror import get_mirror
+from repository import PAGE_SIZE, get_repository, get_write_queue
+from startup import get_startup_report
+
+
+# Statuses PipelineItem.is_active accepts
+ACTIVE_STATUSES = frozenset({"ACTIVE", "SNOOZED"})
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """
+    Which rows to load, tested on raw owner / status / archived cells
+    before any PipelineItem is built (predicate pushdown).
+
+    The default keeps active rows of every owner; for_owner() is the
+    single-recruiter view. owners=None / statuses=None mean "any".
+    """
+
+    owners: Optional[FrozenSet[str]] = None
+    statuses: Optional[FrozenSet[str]] = ACTIVE_STATUSES
+    include_archived: bool = False
+
+    @classmethod
+    def for_owner(cls, owner: str) -> "RowFilter":
+        return cls(owners=frozenset({owner}))
+
+    @property
+    def single_owner(self) -> Optional[str]:
+        """The owner, if the filter is for exactly one."""
+        if self.owners is not None and len(self.owners) == 1:
+            return next(iter(self.owners))
+        return None
+
+    def matcher(
+        self, header: Sequence[str]
+    ) -> Callable[[Sequence[str]], bool]:
+        """Predicate over raw value rows laid out as header."""
+        positions = {name: n for n, name in enumerate(header)}
+        owner_pos = positions.get("owner")
+        status_pos = positions.get("status")
+        archived_pos = positions.get("archived")
+        owners, statuses = self.owners, self.statuses
+        skip_archived = not self.include_archived and archived_pos is not None
+
+        def match(row: Sequence[str]) -> bool:
+            if owners is not None and (
+                owner_pos is None or row[owner_pos] not in owners
+            ):
+                return False
+            if statuses is not None:
+                # An empty status cell parses as ACTIVE.
+                status = row[status_pos] if status_pos is not None else ""
+                if (status or "ACTIVE") not in statuses:
+                    return False
+            if skip_archived and parse_flag(row[archived_pos]):
+                return False
+            return True
+
+        return match
+
+    def select(
+        self, header: Sequence[str], rows: Iterable[Sequence[str]]
+    ) -> List[PipelineItem]:
+        """Parse only the rows that pass the filter."""
+        match = self.matcher(header)
+        id_pos = header.index("id")
+        return RowParser(header).parse_all(
+            r for r in rows if r[id_pos] and match(r)
+        )
+
+
+def load_items(row_filter: RowFilter) -> List[PipelineItem]:
+    """Load the items passing row_filter from the local mirror."""
+    # The mirror narrows a single owner in SQL; the rest is pushed down
+    # to the raw tuples.
+    report = get_startup_report()
+    with report.phase("read mirror"):
+        values = get_mirror().values(row_filter.single_owner)
+    with report.phase("parse"):
+        return row_filter.select(SHEET_COLUMNS, values)
 
 
 def load_items_for_owner(owner: str) -> List[PipelineItem]:
-    """Load active items for a specific owner from Google Sheets."""
-    rows = get_pipeline_rows()
-    items = [pipeline_item_from_sheet(r) for r in rows]
-    return [i for i in filter_active(items) if i.owner == owner]
+    """Load active items for a specific owner from the local mirror."""
+    return load_items(RowFilter.for_owner(owner))
+
+
+def open_items_for_owner(owner: str) -> List[PipelineItem]:
+    """
+    First load at startup: open the backend (importing its client
+    library), the mirror and the write journal, then load owner's items
+    from the mirror. Nothing here touches the network; it runs on the
+    I/O thread so the window can paint in the meantime.
+    """
+    with get_startup_report().phase("import"):
+        get_repository()
+    get_write_queue()  # replays the journal
+    return load_items_for_owner(owner)
+
+
+def sync_mirror(full: bool = False, owner: Optional[str] = None) -> int:
+    """
+    Pull backend changes into the local mirror; returns rows touched.
+
+    Only rows whose updated_at is at or after the last watermark are
+    downloaded (every row when full=True or on first sync), plus rows the
+    mirror does not have yet. With owner set the mirror is narrowed to
+    that owner's rows and nobody else's are downloaded. Rows with queued
+    local writes keep their local version; the write queue is what pushes
+    those, so flush it before calling this.
+    """
+    mirror = get_mirror()
+    since = None if full else mirror.watermark
+    known = set(mirror.ids())
+    with get_startup_report().phase("fetch"):
+        header, rows, scope_ids, newest = get_repository().changed_rows(
+            since, owner, known
+        )
+
+    pending = get_write_queue().pending_ids()
+    id_pos = header.index("id")
+    rows = [r for r in rows if r[id_pos] not in pending]
+    gone = [i for i in known if i not in scope_ids and i not in pending]
+
+    mirror.upsert_values(header, rows)
+    mirror.delete_ids(gone)
+    if newest:
+        mirror.watermark = newest
+    return len(rows) + len(gone)
+
+
+def sync_items(
+    row_filter: RowFilter, full: bool = False
+) -> List[PipelineItem]:
+    """Sync the mirror with the sheet, then load the filtered items."""
+    sync_mirror(full, row_filter.single_owner)
+    return load_items(row_filter)
+
+
+def sync_items_for_owner(owner: str, full: bool = False) -> List[PipelineItem]:
+    return sync_items(RowFilter.for_owner(owner), full)
+
+
+def stream_items(
+    row_filter: RowFilter, page_size: int = PAGE_SIZE
+) -> Iterator[List[PipelineItem]]:
+    """
+    Full read of the sheet (or of one owner's rows, for a single-owner
+    filter), page by page.
+
+    Each page is written to the mirror and the items passing row_filter
+    are yielded straight away, so the table can fill while the rest is
+    still downloading. Once all pages are in, rows that are not in the
+    sheet (or no longer in scope) are dropped from the mirror and the
+    watermark is moved forward.
+    """
+    mirror = get_mirror()
+    pending = get_write_queue().pending_ids()
+    seen: Set[str] = set(pending)
+    newest: Optional[str] = None
+
+    repository = get_repository()
+    header = repository.header()
+    id_pos = header.index("id")
+    stamp_pos = header.index("updated_at") if "updated_at" in header else None
+
+    report = get_startup_report()
+    pages = repository.iter_pages(page_size, row_filter.single_owner)
+    for rows in report.timed_iter("fetch", pages):
+        rows = [r for r in rows if r[id_pos] not in pending]
+        mirror.upsert_values(header, rows)
+        for r in rows:
+            seen.add(r[id_pos])
+            if stamp_pos is None:
+                continue
+            stamp = r[stamp_pos].replace(" ", "T")
+            if stamp and (newest is None or stamp > newest):
+                newest = stamp
+        with report.phase("parse"):
+            items = row_filter.select(header, rows)
+        yield items
+
+    mirror.delete_ids([i for i in mirror.ids() if i not in seen])
+    if newest:
+        mirror.watermark = newest
+
+
+def stream_items_for_owner(
+    owner: str, page_size: int = PAGE_SIZE
+) -> Iterator[List[PipelineItem]]:
+    return stream_items(RowFilter.for_owner(owner), page_size)
 
 
-def kpi_counts(items: List[PipelineItem]) -> tuple[int, int, int, int]:
+def kpi_counts(
+    items: List[PipelineItem], ctx: Optional[EvaluationContext] = None
+) -> tuple[int, int, int, int]:
     """Return counts for green/yellow/red/total items."""
-    green = yellow = red = 0
+    ctx = ctx or evaluation_context()
+    counts = {"green": 0, "yellow": 0, "red": 0, "none": 0}
     for i in items:
-        if i.priority == "green":
-            green += 1
-        elif i.priority == "yellow":
-            yellow += 1
-        elif i.priority == "red":
-            red += 1
+        counts[ctx.tier(i).priority] += 1
     total = len(items)
-    return green, yellow, red, total
+    return counts["green"], counts["yellow"], counts["red"], total
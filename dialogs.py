@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QInputDialog,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
     QVBoxLayout,
     QLineEdit,
@@ -63,22 +64,34 @@ class AddCandidateDialog(QDialog):
 
 
 class CandidateActionsDialog(QDialog):
-    """Dialog presenting action buttons for a candidate."""
+    """
+    Dialog presenting action buttons for a candidate.
+
+    Notes are shown once set_notes() is called (they are fetched when the
+    dialog opens). Adding a note waits for them, or for notes_failed():
+    notes are append-only, so a note can be added without them.
+    """
 
     def __init__(self, item: PipelineItem, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Update candidate")
-        self.resize(400, 250)
+        self.resize(400, 400)
         self.selected_action: Optional[Action] = None
         self.note_text: str = ""
         self.remove_requested: bool = False
 
         layout = QVBoxLayout(self)
 
-        header = QLabel(f"{item.candidate_name}\n{item.client} – {item.role}")
+        subtitle = f"{item.client} – {item.role}"
+        header = QLabel(f"{item.candidate_name}\n{subtitle}")
         header.setWordWrap(True)
         layout.addWidget(header)
 
+        self.notes_view = QPlainTextEdit()
+        self.notes_view.setReadOnly(True)
+        self.notes_view.setPlaceholderText("Loading notes…")
+        layout.addWidget(self.notes_view)
+
         # Action buttons
         row1 = QHBoxLayout()
         btn_spoke = QPushButton("✔ Spoke / update")
@@ -100,6 +113,8 @@ class CandidateActionsDialog(QDialog):
 
         row3 = QHBoxLayout()
         btn_note = QPushButton("📝 Add note…")
+        btn_note.setEnabled(False)  # until the notes are in (or failed)
+        self.btn_note = btn_note
         btn_done = QPushButton("🏁 Process finished")
         btn_remove = QPushButton("🗑 Remove candidate")
         btn_remove.setStyleSheet("background-color: #d9534f; color: white;")
@@ -131,6 +146,17 @@ class CandidateActionsDialog(QDialog):
         btn_note.clicked.connect(self._add_note)
         btn_remove.clicked.connect(self._request_remove)
 
+    def set_notes(self, notes: str) -> None:
+        self.notes_view.setPlaceholderText("No notes yet.")
+        self.notes_view.setPlainText(notes)
+        self.btn_note.setEnabled(True)
+
+    def notes_failed(self, message: str) -> None:
+        self.notes_view.setPlaceholderText(
+            f"Notes unavailable ({message}). New notes are still saved."
+        )
+        self.btn_note.setEnabled(True)
+
     def _choose_action(self, action: Action):
         self.selected_action = action
         self.accept()
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Optional, Dict, Any, List
-
-
-@dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+
+
+@dataclass(slots=True)
 class PipelineItem:
+    """
+    One pipeline row. Slotted (no per-instance __dict__); rows parsed by
+    pipeline_item_from_sheet share one copy of each categorical value.
+    """
+
     id: str
     owner: str
     candidate_name: str
@@ -18,19 +37,18 @@ class PipelineItem:
     last_action_at: Optional[date]
     next_check_at: Optional[date]
     status: str
-    notes: str
+    notes: Optional[str]  # None until loaded (list reads skip notes)
     created_at: datetime
     updated_at: datetime
     archived: bool
 
     # ---- Derived properties ----
+    # These evaluate against today's shared EvaluationContext; code that
+    # looks at many items should take one context and ask it directly.
 
     @property
     def days_until_next_check(self) -> Optional[int]:
-        if not self.next_check_at:
-            return None
-        today = date.today()
-        return (self.next_check_at - today).days
+        return evaluation_context().days_until(self)
 
     @property
     def priority(self) -> str:
@@ -38,19 +56,7 @@ class PipelineItem:
         Coarse traffic light: green / yellow / red / none.
         Used for KPIs & filters.
         """
-        if self.archived or self.status == "DONE":
-            return "none"
-
-        d = self.days_until_next_check
-        if d is None:
-            return "yellow"  # unknown = needs attention
-
-        if d >= 1:
-            return "green"
-        elif d == 0:
-            return "yellow"
-        else:
-            return "red"
+        return evaluation_context().tier(self).priority
 
     @property
     def priority_label(self) -> str:
@@ -58,23 +64,7 @@ class PipelineItem:
         Human label: Fresh / Upcoming / Due today / Overdue...
         Shown in the table.
         """
-        if self.archived or self.status == "DONE":
-            return "Done"
-
-        d = self.days_until_next_check
-        if d is None:
-            return "Needs check"
-
-        if d >= 2:
-            return "Fresh"
-        elif d == 1:
-            return "Upcoming"
-        elif d == 0:
-            return "Due today"
-        elif d >= -2:
-            return "Overdue"
-        else:
-            return "Very overdue"
+        return evaluation_context().tier(self).label
 
     @property
     def priority_color(self) -> str:
@@ -82,23 +72,7 @@ class PipelineItem:
         Hex colour for the FULL ROW background.
         Pastel / Excel-like, not aggressive.
         """
-        if self.archived or self.status == "DONE":
-            return "#f5f5f5"  # very light grey
-
-        d = self.days_until_next_check
-        if d is None:
-            return "#e0e0e0"  # neutral grey (needs check)
-
-        if d >= 2:
-            return "#c8e6c9"  # fresh – soft green
-        elif d == 1:
-            return "#dcedc8"  # upcoming – lighter green
-        elif d == 0:
-            return "#fff9c4"  # due today – pale yellow
-        elif d >= -2:
-            return "#ffe0b2"  # slightly overdue – soft orange
-        else:
-            return "#ffcdd2"  # very overdue – soft red
+        return evaluation_context().tier(self).color
 
     @property
     def is_active(self) -> bool:
@@ -112,13 +86,7 @@ class PipelineItem:
         ACTIVE => always visible
         SNOOZED => only when due or overdue
         """
-        if not self.is_active:
-            return False
-        if self.status == "ACTIVE":
-            return True
-        # SNOOZED: only show when due
-        d = self.days_until_next_check
-        return d is None or d <= 0
+        return evaluation_context().is_visible(self)
 
     @property
     def last_action_label(self) -> str:
@@ -140,16 +108,151 @@ class PipelineItem:
         return mapping.get(self.last_action, self.last_action)
 
 
+# ---- Evaluation against a fixed "today" ----
+
+
+class Tier(NamedTuple):
+    priority: str  # green / yellow / red / none
+    label: str
+    color: str  # row background
+
+
+_DONE_TIER = Tier("none", "Done", "#f5f5f5")  # very light grey
+_NO_DATE_TIER = Tier("yellow", "Needs check", "#e0e0e0")  # unknown = attention
+
+# Tier by days until next check, clamped to -3..2
+_TIERS_BY_OFFSET = (
+    Tier("red", "Very overdue", "#ffcdd2"),  # -3 or less – soft red
+    Tier("red", "Overdue", "#ffe0b2"),  # -2 – soft orange
+    Tier("red", "Overdue", "#ffe0b2"),  # -1
+    Tier("yellow", "Due today", "#fff9c4"),  # 0 – pale yellow
+    Tier("green", "Upcoming", "#dcedc8"),  # 1 – lighter green
+    Tier("green", "Fresh", "#c8e6c9"),  # 2 or more – soft green
+)
+_MIN_OFFSET = -3
+_MAX_OFFSET = 2
+
+
+class EvaluationContext:
+    """
+    Date-dependent views of items (days until next check, priority tier,
+    visibility) evaluated against one fixed "today".
+
+    Tiers are memoized on what they depend on (next check date, and
+    whether the item is done), so a row edited by hand in the sheet gets
+    the right tier too; a new day gets a new context, so the memo never
+    needs invalidating.
+    """
+
+    def __init__(self, today: Optional[date] = None):
+        self.today = today or date.today()
+        self._ordinal = self.today.toordinal()
+        self._tiers: Dict[Tuple[Optional[date], bool], Tier] = {}
+
+    def days_until(self, item: PipelineItem) -> Optional[int]:
+        if not item.next_check_at:
+            return None
+        return item.next_check_at.toordinal() - self._ordinal
+
+    def tier(self, item: PipelineItem) -> Tier:
+        key = (
+            item.next_check_at,
+            item.archived or item.status == "DONE",
+        )
+        tier = self._tiers.get(key)
+        if tier is None:
+            tier = self._tiers[key] = self._evaluate(item)
+        return tier
+
+    def _evaluate(self, item: PipelineItem) -> Tier:
+        if item.archived or item.status == "DONE":
+            return _DONE_TIER
+        d = self.days_until(item)
+        if d is None:
+            return _NO_DATE_TIER
+        d = min(max(d, _MIN_OFFSET), _MAX_OFFSET)
+        return _TIERS_BY_OFFSET[d - _MIN_OFFSET]
+
+    def priority(self, item: PipelineItem) -> str:
+        return self.tier(item).priority
+
+    def is_visible(self, item: PipelineItem) -> bool:
+        """
+        Should appear in the main list right now?
+        ACTIVE => always visible
+        SNOOZED => only when due or overdue
+        """
+        if not item.is_active:
+            return False
+        if item.status == "ACTIVE":
+            return True
+        d = self.days_until(item)
+        return d is None or d <= 0
+
+
+_context: Optional[EvaluationContext] = None
+
+
+def evaluation_context() -> EvaluationContext:
+    """
+    Today's shared context. Call once per refresh and pass it along; a
+    new context (with an empty memo) is started when the date changes.
+    """
+    global _context
+    today = date.today()
+    if _context is None or _context.today != today:
+        _context = EvaluationContext(today)
+    return _context
+
+
 # ---- Parsing helpers ----
 
 
+_TRUE_STRINGS = {"TRUE", "1", "YES", "Y"}
+
+
 def _parse_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return value
     if value is None:
         return False
     s = str(value).strip().upper()
-    return s in {"TRUE", "1", "YES", "Y"}
+    return s in _TRUE_STRINGS
+
+
+def parse_flag(cell: str) -> bool:
+    """A raw TRUE/FALSE sheet cell as a bool (same rule as _parse_bool)."""
+    return cell.strip().upper() in _TRUE_STRINGS
+
+
+# Sheets repeat the same date strings across many rows; parse each once.
+
+
+@lru_cache(maxsize=8192)
+def _date_from_str(s: str) -> Optional[date]:
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _datetime_from_str(s: str) -> Optional[datetime]:
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        # Covers both "YYYY-MM-DDTHH:MM:SS" and "YYYY-MM-DD HH:MM:SS".
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        # Everything else in the app is naive UTC.
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
 
 
 def _parse_date(value: Any) -> Optional[date]:
@@ -159,13 +262,7 @@ def _parse_date(value: Any) -> Optional[date]:
         return value
     if isinstance(value, datetime):
         return value.date()
-    s = str(value).strip()
-    if not s:
-        return None
-    try:
-        return date.fromisoformat(s)
-    except ValueError:
-        return None
+    return _date_from_str(str(value))
 
 
 def _parse_datetime(value: Any) -> Optional[datetime]:
@@ -175,40 +272,138 @@ def _parse_datetime(value: Any) -> Optional[datetime]:
         return value
     if isinstance(value, date):
         return datetime.combine(value, datetime.min.time())
-    s = str(value).strip()
-    if not s:
-        return None
-    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
-        try:
-            return datetime.strptime(s, fmt)
-        except ValueError:
-            continue
-    return None
+    return _datetime_from_str(str(value))
 
 
 # ---- Converters to/from Sheets rows ----
 
+# Header of the pipeline tab, in sheet order
+SHEET_COLUMNS = [
+    "id",
+    "owner",
+    "candidate_name",
+    "client",
+    "role",
+    "stage",
+    "sent_at",
+    "last_action",
+    "last_action_at",
+    "next_check_at",
+    "status",
+    "notes",
+    "created_at",
+    "updated_at",
+    "archived",
+]
+
+
+def _intern(value: Any) -> str:
+    # Categorical columns repeat a handful of values across every row.
+    return sys.intern(str(value or ""))
+
 
 def pipeline_item_from_sheet(row: Dict[str, Any]) -> PipelineItem:
     return PipelineItem(
         id=str(row.get("id") or ""),
-        owner=str(row.get("owner") or ""),
+        owner=_intern(row.get("owner")),
         candidate_name=str(row.get("candidate_name") or ""),
-        client=str(row.get("client") or ""),
-        role=str(row.get("role") or ""),
-        stage=str(row.get("stage") or ""),
+        client=_intern(row.get("client")),
+        role=_intern(row.get("role")),
+        stage=_intern(row.get("stage")),
         sent_at=_parse_date(row.get("sent_at")),
-        last_action=str(row.get("last_action") or "") or None,
+        last_action=_intern(row.get("last_action")) or None,
         last_action_at=_parse_date(row.get("last_action_at")),
         next_check_at=_parse_date(row.get("next_check_at")),
-        status=str(row.get("status") or "ACTIVE"),
-        notes=str(row.get("notes") or ""),
+        status=_intern(row.get("status") or "ACTIVE"),
+        # None (not loaded) when the row has no notes cell, as RowParser
+        notes=None if row.get("notes") is None else str(row["notes"]),
         created_at=_parse_datetime(row.get("created_at")) or datetime.utcnow(),
         updated_at=_parse_datetime(row.get("updated_at")) or datetime.utcnow(),
         archived=_parse_bool(row.get("archived")),
     )
 
 
+class _Memo(dict):
+    """dict that fills missing keys from fn (memo[key] is one lookup)."""
+
+    def __init__(self, fn: Callable[[str], Any]):
+        super().__init__()
+        self.fn = fn
+
+    def __missing__(self, key: str) -> Any:
+        value = self[key] = self.fn(key)
+        return value
+
+
+class RowParser:
+    """
+    Fast path from raw sheet values to PipelineItems.
+
+    Column positions are resolved from the header once; each row is then
+    a sequence of cell strings in header order (a get_values / batch_get
+    row, or a mirror tuple) picked apart with one itemgetter call. Date,
+    timestamp, flag and categorical cells are converted once per distinct
+    string for the parser's lifetime. Rows without created_at /
+    updated_at get the parser's `now`, taken once.
+    """
+
+    def __init__(self, header: Sequence[str], now: Optional[datetime] = None):
+        positions = {name: n for n, name in enumerate(header)}
+        missing = len(header)  # index of the padding cell
+        picks = [positions.get(c, missing) for c in SHEET_COLUMNS]
+        self._pick = itemgetter(*picks)
+        self._width = max(picks) + 1
+        self.now = now or datetime.utcnow()
+        self._dates = _Memo(_date_from_str)
+        self._stamps = _Memo(_datetime_from_str)
+        self._flags = _Memo(parse_flag)
+        self._categories = _Memo(sys.intern)
+
+    def parse(self, row: Sequence[str]) -> PipelineItem:
+        if len(row) < self._width:
+            row = tuple(row) + ("",) * (self._width - len(row))
+        (
+            id_,
+            owner,
+            candidate_name,
+            client,
+            role,
+            stage,
+            sent_at,
+            last_action,
+            last_action_at,
+            next_check_at,
+            status,
+            notes,
+            created_at,
+            updated_at,
+            archived,
+        ) = self._pick(row)
+        dates, stamps, cats = self._dates, self._stamps, self._categories
+        # Positional: PipelineItem's fields are in SHEET_COLUMNS order.
+        return PipelineItem(
+            id_,
+            cats[owner],
+            candidate_name,
+            cats[client],
+            cats[role],
+            cats[stage],
+            dates[sent_at],
+            cats[last_action] or None,
+            dates[last_action_at],
+            dates[next_check_at],
+            cats[status] or "ACTIVE",
+            notes,
+            stamps[created_at] or self.now,
+            stamps[updated_at] or self.now,
+            self._flags[archived],
+        )
+
+    def parse_all(self, rows: Iterable[Sequence[str]]) -> List[PipelineItem]:
+        parse = self.parse
+        return [parse(row) for row in rows]
+
+
 def pipeline_item_to_sheet(item: PipelineItem) -> Dict[str, Any]:
     def _date_to_str(d: Optional[date]) -> str:
         return d.isoformat() if d else ""
@@ -216,7 +411,7 @@ def pipeline_item_to_sheet(item: PipelineItem) -> Dict[str, Any]:
     def _dt_to_str(dt: Optional[datetime]) -> str:
         return dt.replace(microsecond=0).isoformat() if dt else ""
 
-    return {
+    row = {
         "id": item.id,
         "owner": item.owner,
         "candidate_name": item.candidate_name,
@@ -228,16 +423,85 @@ def pipeline_item_to_sheet(item: PipelineItem) -> Dict[str, Any]:
         "last_action_at": _date_to_str(item.last_action_at),
         "next_check_at": _date_to_str(item.next_check_at),
         "status": item.status,
-        "notes": item.notes,
         "created_at": _dt_to_str(item.created_at),
         "updated_at": _dt_to_str(item.updated_at),
         "archived": "TRUE" if item.archived else "FALSE",
     }
+    # No "notes": they are rows of the notes tab (NoteEntry). The
+    # pipeline's notes column is only read by migrate_notes.
+    return row
+
+
+# ---- Notes tab ----
+
+# Header of the notes tab: one row per note, only ever appended
+NOTE_COLUMNS = ["item_id", "created_at", "text"]
+
+# A note as append_note has always formatted it: "[2025-01-31T09:00:00] "
+_NOTE_STAMP = re.compile(r"\[(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)\] ")
+_NOTE_BREAK = re.compile(r"\n\n(?=\[\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\] )")
+
+
+@dataclass(slots=True)
+class NoteEntry:
+    """One note on a pipeline item; a row of the notes tab."""
+
+    item_id: str
+    created_at: Optional[datetime]  # None for undated text (migrated)
+    text: str
+
+
+def note_entry_to_sheet(entry: NoteEntry) -> List[str]:
+    stamp = entry.created_at
+    return [
+        entry.item_id,
+        stamp.replace(microsecond=0).isoformat() if stamp else "",
+        entry.text,
+    ]
+
+
+def note_entry_from_sheet(row: Sequence[Any]) -> NoteEntry:
+    cells = [str(c) for c in row[: len(NOTE_COLUMNS)]]
+    cells += [""] * (len(NOTE_COLUMNS) - len(cells))
+    item_id, created_at, text = cells
+    return NoteEntry(item_id, _datetime_from_str(created_at), text)
+
+
+def format_notes(entries: Iterable[NoteEntry]) -> str:
+    """Entries as one text, oldest first, in the old notes-cell format."""
+    parts = []
+    for entry in entries:
+        if entry.created_at is None:
+            parts.append(entry.text)
+        else:
+            stamp = entry.created_at.replace(microsecond=0).isoformat()
+            parts.append(f"[{stamp}] {entry.text}")
+    return "\n\n".join(parts)
+
+
+def split_notes(item_id: str, text: str) -> List[NoteEntry]:
+    """
+    Split a legacy notes cell into entries: one per "[timestamp] " note
+    that append_note wrote, plus any hand-typed text before the first
+    one as an undated entry.
+    """
+    entries = []
+    for part in _NOTE_BREAK.split(text.strip()):
+        match = _NOTE_STAMP.match(part)
+        if match:
+            stamp = _datetime_from_str(match.group(1))
+            entries.append(NoteEntry(item_id, stamp, part[match.end() :]))
+        elif part:
+            entries.append(NoteEntry(item_id, None, part))
+    return entries
 
 
 def filter_active(items: List[PipelineItem]) -> List[PipelineItem]:
     return [i for i in items if i.is_active]
 
 
-def filter_visible(items: List[PipelineItem]) -> List[PipelineItem]:
-    return [i for i in items if i.is_visible_now]
+def filter_visible(
+    items: List[PipelineItem], ctx: Optional[EvaluationContext] = None
+) -> List[PipelineItem]:
+    ctx = ctx or evaluation_context()
+    return [i for i in items if ctx.is_visible(i)]
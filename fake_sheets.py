@@ -0,0 +1,286 @@
+"""
+In-memory stand-in for the Google spreadsheet, for load testing and
+profiling RecToDo offline.
+
+    RECTODO_BACKEND=fake python app.py
+
+FakeWorksheet implements the gspread Worksheet calls sheets_repo makes
+over a plain grid of strings, so the whole Sheets code path (row index,
+batched reads and writes, conflict checks) runs unchanged. Every call
+sleeps for the configured latency (+/- 50%) and fails with a 429 quota
+error at the configured rate, as the real API does under load. The
+pipeline tab is filled with generated rows (benchmarks.generator) whose
+notes are already in the notes tab.
+"""
+
+import random
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import gspread
+from gspread.utils import a1_range_to_grid_range
+
+from config import (
+    FAKE_SHEET_LATENCY_MS,
+    FAKE_SHEET_QUOTA_ERROR_RATE,
+    FAKE_SHEET_ROWS,
+)
+from domain import NOTE_COLUMNS, note_entry_to_sheet, split_notes
+from sheets_repo import (
+    NOTES_TAB_NAME,
+    PIPELINE_TAB_NAME,
+    SheetsRepository,
+    SheetsSession,
+)
+
+
+class _ErrorResponse:
+    """Just enough of a requests.Response for gspread's APIError."""
+
+    status_code = 429
+    text = "Quota exceeded"
+
+    def json(self) -> Dict[str, Any]:
+        return {
+            "error": {
+                "code": 429,
+                "message": "Quota exceeded for quota metric 'Read "
+                "requests' (simulated)",
+                "status": "RESOURCE_EXHAUSTED",
+            }
+        }
+
+
+def _trim_row(row: List[str]) -> List[str]:
+    end = len(row)
+    while end and row[end - 1] == "":
+        end -= 1
+    return row[:end]
+
+
+def _trim(block: List[List[str]]) -> List[List[str]]:
+    # The API leaves out trailing empty cells and rows.
+    rows = [_trim_row(row) for row in block]
+    while rows and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+class FakeSpreadsheet:
+    """A set of FakeWorksheets sharing one simulated connection."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        quota_error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.id = "fake-spreadsheet"
+        self.latency = latency  # seconds per call
+        self.quota_error_rate = quota_error_rate
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._worksheets: Dict[str, "FakeWorksheet"] = {}
+
+    def call(self) -> None:
+        """Simulate one API round trip: wait, then maybe fail."""
+        with self._lock:
+            self.calls += 1
+            delay = self.latency * self._rng.uniform(0.5, 1.5)
+            fail = self._rng.random() < self.quota_error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise gspread.exceptions.APIError(_ErrorResponse())
+
+    def worksheet(self, title: str) -> "FakeWorksheet":
+        self.call()
+        try:
+            return self._worksheets[title]
+        except KeyError:
+            raise gspread.WorksheetNotFound(title) from None
+
+    def add_worksheet(
+        self, title: str, rows: int = 1, cols: int = 1
+    ) -> "FakeWorksheet":
+        self.call()
+        return self.add(title, [])
+
+    def add(self, title: str, grid: List[List[str]]) -> "FakeWorksheet":
+        """Add a tab without a simulated call (for setting up)."""
+        worksheet = FakeWorksheet(self, title, len(self._worksheets), grid)
+        self._worksheets[title] = worksheet
+        return worksheet
+
+    def batch_update(self, body: Dict[str, Any]) -> None:
+        self.call()
+        by_id = {ws.id: ws for ws in self._worksheets.values()}
+        for request in body["requests"]:
+            target = request["deleteDimension"]["range"]
+            grid = by_id[target["sheetId"]].grid
+            del grid[target["startIndex"] : target["endIndex"]]
+
+
+class FakeWorksheet:
+    """One tab: a list of rows of cell strings, row 1 being the header."""
+
+    def __init__(
+        self,
+        spreadsheet: FakeSpreadsheet,
+        title: str,
+        sheet_id: int,
+        grid: List[List[str]],
+    ):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.grid = grid
+
+    def _block(self, a1: str) -> List[List[str]]:
+        r = a1_range_to_grid_range(a1.split("!")[-1])
+        top, bottom = r.get("startRowIndex", 0), r.get("endRowIndex")
+        left, right = r.get("startColumnIndex", 0), r.get("endColumnIndex")
+        return _trim([row[left:right] for row in self.grid[top:bottom]])
+
+    def _write(self, a1: str, values: List[List[Any]]) -> None:
+        r = a1_range_to_grid_range(a1.split("!")[-1])
+        top, left = r.get("startRowIndex", 0), r.get("startColumnIndex", 0)
+        for dr, cells in enumerate(values):
+            while len(self.grid) <= top + dr:
+                self.grid.append([])
+            row = self.grid[top + dr]
+            if len(row) < left + len(cells):
+                row.extend([""] * (left + len(cells) - len(row)))
+            row[left : left + len(cells)] = [str(v) for v in cells]
+
+    # ---- Reads ----
+
+    def get_values(self, range_name: Optional[str] = None, **_) -> List:
+        self.spreadsheet.call()
+        if range_name is None:
+            return _trim([list(row) for row in self.grid])
+        return self._block(range_name)
+
+    def batch_get(self, ranges: List[str], **_) -> List[List[List[str]]]:
+        self.spreadsheet.call()
+        return [self._block(a1) for a1 in ranges]
+
+    def row_values(self, row: int) -> List[str]:
+        self.spreadsheet.call()
+        return _trim_row(self.grid[row - 1]) if row <= len(self.grid) else []
+
+    def col_values(self, col: int) -> List[str]:
+        self.spreadsheet.call()
+        return _trim_row(
+            [r[col - 1] if len(r) >= col else "" for r in self.grid]
+        )
+
+    # ---- Writes ----
+
+    def update(self, values: List[List[Any]], range_name: str, **_) -> None:
+        self.spreadsheet.call()
+        self._write(range_name, values)
+
+    def batch_update(self, data: List[Dict[str, Any]], **_) -> None:
+        self.spreadsheet.call()
+        for entry in data:
+            self._write(entry["range"], entry["values"])
+
+    def batch_clear(self, ranges: List[str]) -> None:
+        self.spreadsheet.call()
+        for a1 in ranges:
+            r = a1_range_to_grid_range(a1)
+            top, bottom = r.get("startRowIndex", 0), r.get("endRowIndex")
+            left = r.get("startColumnIndex", 0)
+            right = r.get("endColumnIndex")
+            for row in self.grid[top:bottom]:
+                end = len(row) if right is None else min(right, len(row))
+                row[left:end] = [""] * max(0, end - left)
+
+    def append_rows(self, values: List[List[Any]], **_) -> None:
+        self.spreadsheet.call()
+        # Appended after the last row holding any value, as the API does.
+        end = len(self.grid)
+        while end and not any(self.grid[end - 1]):
+            end -= 1
+        del self.grid[end:]
+        self.grid.extend([str(v) for v in row] for row in values)
+
+    def delete_rows(self, start: int, end: Optional[int] = None) -> None:
+        self.spreadsheet.call()
+        del self.grid[start - 1 : end or start]
+
+
+class _FakeClient:
+    def __init__(self, spreadsheet: FakeSpreadsheet):
+        self._spreadsheet = spreadsheet
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self._spreadsheet.call()
+        return self._spreadsheet
+
+
+class FakeSheetsSession(SheetsSession):
+    """A SheetsSession on a FakeSpreadsheet: no credentials, no key file."""
+
+    def __init__(self, spreadsheet: FakeSpreadsheet):
+        super().__init__()
+        self.spreadsheet = spreadsheet
+
+    def client(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                with self.timed("authorize"):
+                    self._client = _FakeClient(self.spreadsheet)
+            return self._client
+
+    def _open_spreadsheet(self, client: Any) -> Any:
+        with self.timed("open_by_key"):
+            return client.open_by_key(self.spreadsheet.id)
+
+
+def generated_spreadsheet(
+    rows: int,
+    seed: int = 1,
+    latency: float = 0.0,
+    quota_error_rate: float = 0.0,
+) -> FakeSpreadsheet:
+    """A FakeSpreadsheet whose pipeline tab holds rows generated rows."""
+    from benchmarks.generator import make_sheet
+
+    header, values = make_sheet(rows, seed, today=date.today())
+    notes_pos = header.index("notes")
+    notes = [list(NOTE_COLUMNS)]
+    for row in values:
+        for entry in split_notes(row[0], row[notes_pos]):
+            notes.append(note_entry_to_sheet(entry))
+        row[notes_pos] = ""
+
+    spreadsheet = FakeSpreadsheet(latency, quota_error_rate, seed)
+    spreadsheet.add(PIPELINE_TAB_NAME, [header] + values)
+    spreadsheet.add(NOTES_TAB_NAME, notes)
+    return spreadsheet
+
+
+class FakeSheetsRepository(SheetsRepository):
+    """SheetsRepository over a generated FakeSpreadsheet (see module)."""
+
+    name = "fake"
+    title = "the fake sheet"
+    mirror_path = "rectodo_mirror.fake.sqlite3"
+    journal_path = "rectodo_journal.fake.sqlite3"
+
+    def __init__(
+        self,
+        rows: int = FAKE_SHEET_ROWS,
+        latency_ms: float = FAKE_SHEET_LATENCY_MS,
+        quota_error_rate: float = FAKE_SHEET_QUOTA_ERROR_RATE,
+        seed: int = 1,
+    ):
+        self.spreadsheet = generated_spreadsheet(
+            rows, seed, latency_ms / 1000, quota_error_rate
+        )
+        super().__init__(FakeSheetsSession(self.spreadsheet))
@@ -0,0 +1,179 @@
+"""
+Local SQLite mirror of the pipeline tab for RecToDo.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from domain import SHEET_COLUMNS
+
+MIRROR_PATH = "rectodo_mirror.sqlite3"
+
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO pipeline ({', '.join(SHEET_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in SHEET_COLUMNS)})"
+)
+
+
+class LocalMirror:
+    """
+    Copy of the pipeline tab's rows, stored as sheet-formatted strings.
+    Cells that were never downloaded (notes, see repository.LAZY_COLUMNS)
+    are NULL.
+
+    The app reads from here at startup so the window never waits on the
+    network; data_loader.sync_mirror keeps it in step with the sheet.
+    """
+
+    def __init__(self, path: str = MIRROR_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            columns = ", ".join(
+                f"{c} TEXT PRIMARY KEY" if c == "id" else f"{c} TEXT"
+                for c in SHEET_COLUMNS
+            )
+            conn.execute(f"CREATE TABLE IF NOT EXISTS pipeline ({columns})")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS pipeline_owner "
+                "ON pipeline (owner)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta "
+                "(key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call: the mirror is used from
+        # both the GUI thread and the sheet I/O thread.
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    # ---- Rows ----
+
+    def values(self, owner: Optional[str] = None) -> List[Tuple[str, ...]]:
+        """
+        Mirrored rows as tuples in SHEET_COLUMNS order (for RowParser),
+        optionally for one owner only.
+        """
+        sql = f"SELECT {', '.join(SHEET_COLUMNS)} FROM pipeline"
+        params: tuple = ()
+        if owner is not None:
+            sql += " WHERE owner = ?"
+            params = (owner,)
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def ids(self) -> List[str]:
+        with self._connect() as conn:
+            return [r[0] for r in conn.execute("SELECT id FROM pipeline")]
+
+    def upsert_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        with self._connect() as conn:
+            self._upsert(conn, rows)
+
+    def upsert_values(
+        self, header: Sequence[str], rows: Iterable[Sequence[str]]
+    ) -> None:
+        """Upsert raw value rows laid out as header."""
+        with self._connect() as conn:
+            self._upsert_values(conn, header, rows)
+
+    def delete_ids(self, ids: Iterable[str]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM pipeline WHERE id = ?", [(i,) for i in ids]
+            )
+
+    def _upsert(
+        self, conn: sqlite3.Connection, rows: Iterable[Dict[str, Any]]
+    ) -> None:
+        conn.executemany(
+            _UPSERT_SQL,
+            [
+                tuple(
+                    None if row.get(c) is None else str(row[c])
+                    for c in SHEET_COLUMNS
+                )
+                for row in rows
+                if row.get("id")
+            ],
+        )
+
+    def _upsert_values(
+        self,
+        conn: sqlite3.Connection,
+        header: Sequence[str],
+        rows: Iterable[Sequence[str]],
+    ) -> None:
+        positions = {name: n for n, name in enumerate(header)}
+        if "id" not in positions:
+            return
+        id_pos = positions["id"]
+        missing = len(header)  # index of the padding cell
+        picks = [positions.get(c, missing) for c in SHEET_COLUMNS]
+        pick = itemgetter(*picks)
+        pad = ("",) if missing in picks else ()
+        conn.executemany(
+            _UPSERT_SQL,
+            [pick(tuple(r) + pad) for r in rows if r[id_pos]],
+        )
+
+    # ---- Sync state ----
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        with self._connect() as conn:
+            if value is None:
+                conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """Newest updated_at pulled from the sheet so far."""
+        return self.get_meta("watermark")
+
+    @watermark.setter
+    def watermark(self, value: Optional[str]) -> None:
+        self.set_meta("watermark", value)
+
+
+_mirror: Optional[LocalMirror] = None
+
+
+def get_mirror() -> LocalMirror:
+    global _mirror
+    if _mirror is None:
+        from repository import get_repository
+
+        # Each backend has its own mirror, so rows never cross over.
+        _mirror = LocalMirror(get_repository().mirror_path or MIRROR_PATH)
+    return _mirror
@@ -0,0 +1,260 @@
+"""
+SQLite storage backend for RecToDo, for teams that run without Google
+Sheets: the pipeline and its notes live in one local file (which can sit
+on a shared drive; SQLite locks it per write).
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from config import LOCAL_STORE_PATH
+from domain import (
+    NOTE_COLUMNS,
+    SHEET_COLUMNS,
+    NoteEntry,
+    format_notes,
+    note_entry_from_sheet,
+    note_entry_to_sheet,
+)
+from repository import (
+    LAZY_COLUMNS,
+    PAGE_SIZE,
+    PipelineRepository,
+    changed_cells,
+    conflicts,
+    normalise_stamp,
+)
+
+# Read lists select NULL in place of the lazy columns.
+_LIST_SELECT = ", ".join(
+    "NULL" if c in LAZY_COLUMNS else c for c in SHEET_COLUMNS
+)
+# Ids per "IN (...)" query (SQLite's default variable limit is 999)
+_IDS_PER_QUERY = 500
+
+
+def _chunks(ids: List[str]) -> Iterator[List[str]]:
+    for start in range(0, len(ids), _IDS_PER_QUERY):
+        yield ids[start : start + _IDS_PER_QUERY]
+
+
+def _placeholders(values: List[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class SQLiteRepository(PipelineRepository):
+    """
+    The pipeline as a table with the sheet's columns (cells stored as the
+    same strings), in insertion order, and notes as an append-only table
+    with the notes tab's columns.
+    """
+
+    name = "sqlite"
+    title = "the local store"
+    mirror_path = "rectodo_mirror.sqlite.sqlite3"
+    journal_path = "rectodo_journal.sqlite.sqlite3"
+
+    def __init__(self, path: str = LOCAL_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            columns = ", ".join(
+                f"{c} TEXT NOT NULL UNIQUE" if c == "id" else f"{c} TEXT"
+                for c in SHEET_COLUMNS
+            )
+            conn.execute(f"CREATE TABLE IF NOT EXISTS pipeline ({columns})")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS pipeline_owner "
+                "ON pipeline (owner)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS notes "
+                f"({', '.join(f'{c} TEXT' for c in NOTE_COLUMNS)})"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS notes_item ON notes (item_id)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call, as in local_mirror; the
+        # timeout covers another instance holding the write lock.
+        with self._lock:
+            conn = sqlite3.connect(self.path, timeout=10)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def is_transient(self, exc: Exception) -> bool:
+        # "database is locked" and an unreachable shared drive.
+        return isinstance(
+            exc, sqlite3.OperationalError
+        ) or super().is_transient(exc)
+
+    # ---- Reads ----
+
+    def header(self) -> List[str]:
+        return list(SHEET_COLUMNS)
+
+    def iter_pages(
+        self, page_size: int = PAGE_SIZE, owner: Optional[str] = None
+    ) -> Iterator[List[List[Optional[str]]]]:
+        sql = f"SELECT {_LIST_SELECT} FROM pipeline"
+        params: tuple = ()
+        if owner is not None:
+            sql += " WHERE owner = ?"
+            params = (owner,)
+        with self._connect() as conn:
+            rows = conn.execute(sql + " ORDER BY rowid", params).fetchall()
+        # Paged after the read: the connection is not held while the
+        # caller works through the pages.
+        for start in range(0, len(rows), page_size):
+            yield [list(r) for r in rows[start : start + page_size]]
+
+    def changed_rows(
+        self,
+        since: Optional[str],
+        owner: Optional[str] = None,
+        known_ids: Optional[Set[str]] = None,
+    ) -> Tuple[List[str], List[List[Optional[str]]], Set[str], Optional[str]]:
+        sql = "SELECT id, updated_at FROM pipeline"
+        params: tuple = ()
+        if owner is not None:
+            sql += " WHERE owner = ?"
+            params = (owner,)
+        with self._connect() as conn:
+            stamps = {
+                row_id: normalise_stamp(stamp or "")
+                for row_id, stamp in conn.execute(sql, params)
+            }
+            changed = [
+                row_id
+                for row_id, stamp in stamps.items()
+                if since is None
+                or not stamp
+                or stamp >= since
+                or (known_ids is not None and row_id not in known_ids)
+            ]
+            rows = []
+            for chunk in _chunks(changed):
+                rows.extend(
+                    list(r)
+                    for r in conn.execute(
+                        f"SELECT {_LIST_SELECT} FROM pipeline "
+                        f"WHERE id IN ({_placeholders(chunk)})",
+                        chunk,
+                    )
+                )
+        newest = max((s for s in stamps.values() if s), default=None)
+        return self.header(), rows, set(stamps), newest
+
+    def notes(self, ids: Iterable[str]) -> Dict[str, str]:
+        ids = list(ids)
+        entries: Dict[str, List[NoteEntry]] = {}
+        with self._connect() as conn:
+            for chunk in _chunks(sorted(set(ids))):
+                for cells in conn.execute(
+                    f"SELECT {', '.join(NOTE_COLUMNS)} FROM notes "
+                    f"WHERE item_id IN ({_placeholders(chunk)}) "
+                    "ORDER BY rowid",
+                    chunk,
+                ):
+                    entry = note_entry_from_sheet(list(cells))
+                    entries.setdefault(entry.item_id, []).append(entry)
+        return {i: format_notes(entries.get(i, [])) for i in ids}
+
+    # ---- Writes ----
+
+    def write_updates(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        bases: Dict[str, Dict[str, Any]],
+    ) -> Tuple[List[str], List[str]]:
+        missing: List[str] = []
+        conflicted: List[str] = []
+        with self._connect() as conn:
+            for row_id, row in updates.items():
+                found = conn.execute(
+                    "SELECT updated_at FROM pipeline WHERE id = ?", (row_id,)
+                ).fetchone()
+                if found is None:
+                    missing.append(row_id)
+                    continue
+                base = bases.get(row_id)
+                if conflicts(base, row, found[0] or ""):
+                    conflicted.append(row_id)
+                    continue
+                cells = {
+                    c: v
+                    for c, v in changed_cells(row, base).items()
+                    if c in SHEET_COLUMNS and c != "id"
+                }
+                if cells:
+                    assignments = ", ".join(f"{c} = ?" for c in cells)
+                    conn.execute(
+                        f"UPDATE pipeline SET {assignments} WHERE id = ?",
+                        [*map(str, cells.values()), row_id],
+                    )
+        return missing, conflicted
+
+    def write_appends(
+        self, appends: Dict[str, Dict[str, Any]], dedupe: bool = False
+    ) -> None:
+        # INSERT OR REPLACE never adds an id twice, dedupe or not.
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO pipeline "
+                f"({', '.join(SHEET_COLUMNS)}) "
+                f"VALUES ({_placeholders(SHEET_COLUMNS)})",
+                [
+                    tuple(str(row.get(c, "")) for c in SHEET_COLUMNS)
+                    for row in appends.values()
+                ],
+            )
+
+    def write_notes(
+        self, entries: List[NoteEntry], dedupe: bool = False
+    ) -> None:
+        values = [note_entry_to_sheet(entry) for entry in entries]
+        with self._connect() as conn:
+            if dedupe:
+                ids = sorted({entry.item_id for entry in entries})
+                seen = set()
+                for chunk in _chunks(ids):
+                    seen.update(
+                        conn.execute(
+                            f"SELECT {', '.join(NOTE_COLUMNS)} FROM notes "
+                            f"WHERE item_id IN ({_placeholders(chunk)})",
+                            chunk,
+                        )
+                    )
+                values = [v for v in values if tuple(v) not in seen]
+            conn.executemany(
+                f"INSERT INTO notes ({', '.join(NOTE_COLUMNS)}) "
+                f"VALUES ({_placeholders(NOTE_COLUMNS)})",
+                values,
+            )
+
+    def write_deletes(self, ids: List[str]) -> List[str]:
+        missing = []
+        with self._connect() as conn:
+            for row_id in ids:
+                cursor = conn.execute(
+                    "DELETE FROM pipeline WHERE id = ?", (row_id,)
+                )
+                if not cursor.rowcount:
+                    missing.append(row_id)
+        return missing
@@ -2,11 +2,13 @@
 Main application window for RecToDo.
 """
 
+import copy
+import time
 import uuid
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtCore import Qt, QModelIndex, QTimer
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
@@ -25,18 +27,54 @@ from PySide6.QtWidgets import (
 )
 
 from actions import apply_action, append_note
-from config import CURRENT_OWNER
-from data_loader import kpi_counts, load_items_for_owner
+from config import (
+    CURRENT_OWNER,
+    FULL_RESYNC_EVERY,
+    NOTES_CACHE_SIZE,
+    NOTES_PREFETCH_DELAY_MS,
+    OFFLINE_RETRY_MAX_MS,
+    OFFLINE_RETRY_MIN_MS,
+    RESYNC_INTERVAL_MS,
+    SEARCH_DEBOUNCE_MS,
+    STALE_DATA_AFTER_MS,
+    WRITE_BATCH_SIZE,
+    WRITE_FLUSH_DELAY_MS,
+)
+from data_loader import (
+    open_items_for_owner,
+    stream_items_for_owner,
+    sync_items_for_owner,
+)
 from dialogs import AddCandidateDialog, CandidateActionsDialog
-from domain import PipelineItem, pipeline_item_to_sheet
-from sheets_repo import (
-    append_pipeline_row,
-    delete_pipeline_row,
-    update_pipeline_row,
+from domain import (
+    NoteEntry,
+    PipelineItem,
+    evaluation_context,
+    format_notes,
+    pipeline_item_from_sheet,
+    pipeline_item_to_sheet,
+)
+from local_mirror import LocalMirror, get_mirror
+from notes_cache import NotesCache
+from pipeline_snapshot import read_snapshot, write_snapshot
+from pipeline_store import PipelineStore
+from repository import (
+    FlushError,
+    PipelineRepository,
+    configured_backend,
+    flush_pending_writes,
+    get_repository,
+    get_write_queue,
+    queue_append_note,
+    queue_append_row,
+    queue_delete_row,
+    queue_update_row,
 )
-from table_model import PipelineTableModel
+from startup import get_startup_report
+from table_model import PipelineFilterProxy, PipelineTableModel
 from theme import apply_theme, ThemeMode
 from utils import find_candidate_by_name, merge_csv_field
+from workers import SheetIO
 
 
 class MainWindow(QMainWindow):
@@ -47,9 +85,19 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"RecToDo – {CURRENT_OWNER}'s Pipeline")
         self.resize(1200, 700)
 
-        self.all_items: List[PipelineItem] = load_items_for_owner(
-            CURRENT_OWNER
+        # First paint comes from the binary snapshot of the last session
+        # (no database, no network). The local mirror replaces it once
+        # _open_pipeline has opened the backend off the GUI thread.
+        self.startup = get_startup_report()
+        self.repository: Optional[PipelineRepository] = None
+        self.mirror: Optional[LocalMirror] = None
+        with self.startup.phase("read snapshot"):
+            snapshot = read_snapshot(CURRENT_OWNER, configured_backend())
+        self.store = PipelineStore(
+            CURRENT_OWNER, snapshot.items if snapshot else []
         )
+        # When the data shown was last synced with the backend
+        self._synced_at = snapshot.synced_at if snapshot else None
         self.view_mode = "my"  # "my" or "overdue"
 
         root = QWidget()
@@ -62,7 +110,104 @@ class MainWindow(QMainWindow):
         content_layout = self._build_content()
         main_layout.addLayout(content_layout)
 
+        # Sheet calls run on a background thread; the table is updated
+        # optimistically. Writes are journaled on disk first: while the
+        # backend is unreachable they wait there, and a write the backend
+        # rejects is rolled back.
+        self.io = SheetIO(self)
+        self._synced: Dict[str, Optional[PipelineItem]] = {}
+        self._flushing = False
+        self._resyncing = False
+        self._sync_notice = ""
+        self._conflicts_seen = 0
+        self._offline = False
+
+        # Notes are not part of the list load; they are fetched per row
+        # when a candidate is opened, or shortly after it is selected.
+        self.notes = NotesCache(NOTES_CACHE_SIZE)
+        self._notes_loading: Set[str] = set()
+        self._notes_waiters: Dict[str, List[Tuple]] = {}
+        self.notes_timer = QTimer(self)
+        self.notes_timer.setSingleShot(True)
+        self.notes_timer.setInterval(NOTES_PREFETCH_DELAY_MS)
+        self.notes_timer.timeout.connect(self._prefetch_notes)
+        self.table.selectionModel().currentRowChanged.connect(
+            self.notes_timer.start
+        )
+
+        # Writes are queued and sent in one batch shortly after the last
+        # change, so a run of quick actions costs a single round trip.
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(WRITE_FLUSH_DELAY_MS)
+        self.flush_timer.timeout.connect(self._flush_writes)
+        # Offline: retry with exponential backoff until a call succeeds.
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.setInterval(OFFLINE_RETRY_MIN_MS)
+        self.retry_timer.timeout.connect(self._resync)
+
+        # Local edits are applied to the store directly; resyncs only
+        # run on "Refresh" or on this schedule (see config).
+        self.resync_timer = QTimer(self)
+        self.resync_timer.setInterval(RESYNC_INTERVAL_MS)
+        self.resync_timer.timeout.connect(self._scheduled_resync)
+        self._resync_ticks = 0
+        # Due-in days, priorities and snoozes move at midnight.
+        self.day_timer = QTimer(self)
+        self.day_timer.setInterval(60 * 1000)
+        self.day_timer.timeout.connect(self._check_day_rollover)
+        self.day_timer.timeout.connect(self._update_freshness_label)
+        self.day_timer.start()
+
         self._refresh_view()
+        self._update_freshness_label()
+        if snapshot is not None:
+            self.startup.mark("snapshot shown")
+        self._set_opening(True)
+        QTimer.singleShot(0, self._open_pipeline)
+
+    # ---- Startup ----
+
+    def _open_pipeline(self) -> None:
+        """
+        Open the backend and load the mirrored rows on the I/O thread
+        (importing the backend's client library and parsing the rows
+        would otherwise hold up the first paint).
+        """
+        self.io.submit(
+            open_items_for_owner,
+            CURRENT_OWNER,
+            on_done=self._on_pipeline_opened,
+            on_error=self._on_open_failed,
+        )
+
+    def _on_pipeline_opened(self, items: List[PipelineItem]) -> None:
+        self.repository = get_repository()
+        self.mirror = get_mirror()
+        self.model.pending_tooltip = f"Saving to {self.repository.title}..."
+        self.store.reset(items)
+        # Writes left in the journal by the previous session (offline,
+        # or a crash) are pending again; the resync below sends them.
+        for item_id, row in get_write_queue().snapshots().items():
+            synced = pipeline_item_from_sheet(row) if row else None
+            self._mark_pending(item_id, synced)
+
+        self._set_opening(False)
+        self._refresh_view()
+        self._update_sync_label()
+        self.startup.mark("mirror rows shown")
+        self.resync_timer.start()
+        if len(self.store) or get_write_queue().pending_count():
+            self._resync()
+        else:
+            # Nothing mirrored yet: stream the sheet and fill as we go.
+            self._stream_load()
+
+    def _on_open_failed(self, exc: Exception) -> None:
+        self._set_opening(False)
+        self.status_label.setText(f"Could not open the pipeline: {exc}")
+        self.startup.finish()
 
     # ---- UI builders ----
 
@@ -76,6 +221,7 @@ class MainWindow(QMainWindow):
         self.btn_my = QPushButton("My pipeline")
         self.btn_overdue = QPushButton("Overdue only")
         self.btn_add = QPushButton("Add candidate")
+        self.btn_refresh = QPushButton("Refresh")
 
         self.btn_overdue.setCheckable(True)
 
@@ -83,6 +229,7 @@ class MainWindow(QMainWindow):
         sidebar.addWidget(self.btn_overdue)
         sidebar.addSpacing(20)
         sidebar.addWidget(self.btn_add)
+        sidebar.addWidget(self.btn_refresh)
 
         theme_row = QHBoxLayout()
         theme_label = QLabel("Theme")
@@ -102,6 +249,7 @@ class MainWindow(QMainWindow):
         self.btn_my.clicked.connect(self._set_view_my)
         self.btn_overdue.clicked.connect(self._toggle_overdue)
         self.btn_add.clicked.connect(self._add_candidate)
+        self.btn_refresh.clicked.connect(self._refresh)
 
         sidebar_frame = QFrame()
         sidebar_frame.setLayout(sidebar)
@@ -136,7 +284,12 @@ class MainWindow(QMainWindow):
         search_label = QLabel("Search:")
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Candidate, client, role...")
-        self.search_edit.textChanged.connect(self._refresh_view)
+        # Filter once typing pauses rather than on every keystroke.
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self._apply_search)
+        self.search_edit.textChanged.connect(self.search_timer.start)
         search_row.addWidget(search_label)
         search_row.addWidget(self.search_edit)
         content.addLayout(search_row)
@@ -146,7 +299,20 @@ class MainWindow(QMainWindow):
         self.status_label.setStyleSheet("color: #b08800;")
         content.addWidget(self.status_label)
 
+        # Sync state of the write queue
+        self.sync_label = QLabel()
+        content.addWidget(self.sync_label)
+
+        # Age of the rows shown (since the last sync with the backend)
+        self.freshness_label = QLabel()
+        content.addWidget(self.freshness_label)
+
+        self.model = PipelineTableModel([])
+        self.proxy = PipelineFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
         self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setSortingEnabled(True)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.doubleClicked.connect(
@@ -156,12 +322,20 @@ class MainWindow(QMainWindow):
 
         return content
 
+    def _set_opening(self, opening: bool) -> None:
+        # The rows shown (from the snapshot) can be browsed while the
+        # backend opens; changing them waits for it.
+        self.btn_add.setEnabled(not opening)
+        self.btn_refresh.setEnabled(not opening)
+        self.status_label.setText("Opening pipeline..." if opening else "")
+
     def _set_busy(self, busy: bool, message: str = "") -> None:
         app = QApplication.instance()
         controls = [
             self.btn_my,
             self.btn_overdue,
             self.btn_add,
+            self.btn_refresh,
             self.theme_slider,
             self.search_edit,
             self.table,
@@ -178,6 +352,350 @@ class MainWindow(QMainWindow):
         else:
             app.restoreOverrideCursor()
 
+    # ---- Write queue ----
+
+    def _mark_pending(
+        self, item_id: str, synced: Optional[PipelineItem]
+    ) -> None:
+        """
+        Remember the last synced state of item_id (None = not in the sheet
+        yet) so a failed write can be rolled back. Earlier snapshots win.
+        """
+        self._synced.setdefault(item_id, synced)
+
+    def _save_item(
+        self,
+        item: PipelineItem,
+        new: bool = False,
+        note: Optional[NoteEntry] = None,
+    ) -> None:
+        """Apply a local edit everywhere: store, mirror and write queue."""
+        row = pipeline_item_to_sheet(item)
+        if new:
+            queue_append_row(row)
+        else:
+            # Only cells changed since the last synced state are sent.
+            synced = self._synced.get(item.id)
+            base = pipeline_item_to_sheet(synced) if synced else None
+            queue_update_row(item.id, row, base)
+        if note is not None:
+            queue_append_note(note)
+        self.mirror.upsert_rows([row])
+        self.store.apply(item)
+
+    def _delete_item(self, item_id: str) -> None:
+        queue_delete_row(item_id)
+        self.mirror.delete_ids([item_id])
+        self.store.remove(item_id)
+
+    def _schedule_flush(self) -> None:
+        # While offline the retry timer probes the backend instead.
+        if not self._offline:
+            self.flush_timer.start()
+        self._update_sync_label()
+
+    def _flush_writes(self) -> None:
+        queue = get_write_queue()
+        if self._flushing or not queue.pending_count():
+            return
+
+        self._flushing = True
+        self.sync_label.setText(
+            f"Syncing {queue.pending_count()} change(s)..."
+        )
+        # A long backlog (e.g. after a day offline) drains in batches.
+        self.io.submit(
+            flush_pending_writes,
+            WRITE_BATCH_SIZE,
+            on_done=self._on_flush_done,
+            on_error=self._on_flush_failed,
+        )
+
+    def _on_flush_done(self, sent_ids: Set[str]) -> None:
+        self._flushing = False
+        self._sync_notice = ""
+        self._set_online()
+        self._clear_synced(sent_ids)
+        self._pull_conflicts()
+
+        if get_write_queue().pending_count():
+            if len(sent_ids) >= WRITE_BATCH_SIZE:
+                self._flush_writes()  # the next batch of a backlog
+            else:
+                self.flush_timer.start()
+        self._refresh_view()
+        self._update_sync_label()
+
+    def _on_flush_failed(self, exc: Exception) -> None:
+        self._flushing = False
+        if not isinstance(exc, FlushError):
+            exc = FlushError(exc, set(), get_write_queue().pending_ids())
+        self._clear_synced(exc.sent_ids)
+        self._pull_conflicts()
+
+        if self.repository.is_transient(exc.cause):
+            # Kept in the queue and the journal; sent once back online.
+            self._set_offline(exc.cause)
+            self._refresh_view()
+            self._update_sync_label()
+            return
+
+        get_write_queue().discard(exc.failed_ids)
+        self._rollback(exc.failed_ids)
+        self._sync_notice = (
+            f"Could not save {len(exc.failed_ids)} change(s), "
+            f"undone: {exc.cause}"
+        )
+        self._refresh_view()
+        self._update_sync_label()
+
+    def _set_offline(self, cause: Exception) -> None:
+        """Keep working locally and probe the backend with backoff."""
+        if self._offline and not self.retry_timer.isActive():
+            # Failed again: wait twice as long before the next try.
+            interval = min(
+                self.retry_timer.interval() * 2, OFFLINE_RETRY_MAX_MS
+            )
+            self.retry_timer.setInterval(interval)
+        self._offline = True
+        self.flush_timer.stop()
+        self.retry_timer.start()
+        self.status_label.setText(
+            f"Working offline ({cause}); retrying in "
+            f"{self.retry_timer.interval() // 1000} s"
+        )
+
+    def _set_online(self) -> None:
+        if not self._offline:
+            return
+        self._offline = False
+        self.retry_timer.stop()
+        self.retry_timer.setInterval(OFFLINE_RETRY_MIN_MS)
+        self.status_label.setText("")
+
+    def _pull_conflicts(self) -> None:
+        """
+        Edits skipped because someone else changed the row meanwhile are
+        no longer pending; a resync replaces them with the sheet's row.
+        """
+        conflicts = get_write_queue().conflicts
+        if len(conflicts) > self._conflicts_seen:
+            self._conflicts_seen = len(conflicts)
+            QTimer.singleShot(0, self._resync)
+
+    def _resync(self, full: bool = False) -> None:
+        """
+        Reconcile with the sheet in the background: push queued writes,
+        then pull changed rows into the mirror (all rows when full).
+        """
+        if self._resyncing:
+            return
+        self._resyncing = True
+        self.status_label.setText(f"Syncing with {self.repository.title}...")
+        # Same I/O thread, so the flush runs before the pull.
+        self.flush_timer.stop()
+        self._flush_writes()
+        self.io.submit(
+            sync_items_for_owner,
+            CURRENT_OWNER,
+            full,
+            on_done=self._on_resync_done,
+            on_error=self._on_resync_failed,
+        )
+
+    def _scheduled_resync(self) -> None:
+        self._resync_ticks += 1
+        self._resync(full=self._resync_ticks % FULL_RESYNC_EVERY == 0)
+
+    def _refresh(self) -> None:
+        if self.repository is None:
+            # Opening failed at startup: try again.
+            self._set_opening(True)
+            self._open_pipeline()
+        else:
+            self._resync(full=True)
+
+    def _stream_load(self) -> None:
+        if self._resyncing:
+            return
+        self._resyncing = True
+        self.status_label.setText(
+            f"Loading pipeline from {self.repository.title}..."
+        )
+        self.io.stream(
+            stream_items_for_owner,
+            CURRENT_OWNER,
+            on_item=self._on_page_loaded,
+            on_done=self._on_stream_done,
+            on_error=self._on_resync_failed,
+        )
+
+    def _on_page_loaded(self, items: List[PipelineItem]) -> None:
+        # Rows edited locally since the load started keep their state.
+        items = [i for i in items if i.id not in self._synced]
+        for item in items:
+            self.store.apply(item)
+        self.model.append_items(items)
+        self._update_kpis()
+        self.startup.mark("first rows shown")
+
+    def _on_stream_done(self, _result: None) -> None:
+        self._resyncing = False
+        self.status_label.setText("")
+        self._refresh_view()
+        self._on_synced()
+        self.startup.finish(self.repository.call_stats())
+
+    def _on_resync_done(self, items: List[PipelineItem]) -> None:
+        self._resyncing = False
+        self._set_online()
+        self.status_label.setText("")
+        # Rows with unsent edits keep their local state.
+        self.store.reset(items, keep_local=self._synced)
+        self._refresh_view()
+        self._on_synced()
+        self.startup.finish(self.repository.call_stats())
+
+    def _on_resync_failed(self, exc: Exception) -> None:
+        self._resyncing = False
+        if self.repository.is_transient(exc):
+            self._set_offline(exc)
+        else:
+            self.status_label.setText(f"Refresh failed: {exc}")
+        self.startup.finish(self.repository.call_stats())
+
+    # ---- Snapshot ----
+
+    def _on_synced(self) -> None:
+        self._synced_at = time.time()
+        self._update_freshness_label()
+        self._save_snapshot()
+
+    def _save_snapshot(self) -> None:
+        """Write the rows shown for the next launch's first paint."""
+        try:
+            write_snapshot(
+                self.store.items(),
+                CURRENT_OWNER,
+                configured_backend(),
+                self._synced_at,
+            )
+        except (OSError, ValueError, OverflowError):
+            pass  # a cache only; the next launch reads the mirror
+
+    def _update_freshness_label(self) -> None:
+        if self._synced_at is None:
+            self.freshness_label.setText("")
+            return
+        age = max(0, int(time.time() - self._synced_at))
+        if age < 60:
+            ago = "just now"
+        elif age < 3600:
+            ago = f"{age // 60} min ago"
+        elif age < 2 * 86400:
+            ago = f"{age // 3600} h ago"
+        else:
+            ago = f"{age // 86400} days ago"
+        stale = age * 1000 > STALE_DATA_AFTER_MS
+        self.freshness_label.setStyleSheet(
+            "color: #b08800;" if stale else "color: gray;"
+        )
+        self.freshness_label.setText(f"Last synced {ago}")
+
+    def _clear_synced(self, item_ids: Set[str]) -> None:
+        still_queued = get_write_queue().pending_ids()
+        for item_id in item_ids:
+            if item_id not in still_queued:
+                self._synced.pop(item_id, None)
+
+    def _rollback(self, item_ids: Set[str]) -> None:
+        """Put items back to their last synced state."""
+        for item_id in item_ids:
+            if item_id not in self._synced:
+                continue
+            synced = self._synced.pop(item_id)
+            if synced is None:
+                self.store.remove(item_id)
+                self.mirror.delete_ids([item_id])
+            else:
+                self.store.apply(synced)
+                self.mirror.upsert_rows([pipeline_item_to_sheet(synced)])
+
+    def _update_sync_label(self) -> None:
+        if self.repository is None:
+            return  # still opening
+        queue = get_write_queue()
+        pending = queue.pending_count()
+        if self._sync_notice:
+            self.sync_label.setStyleSheet("color: #d73a49;")
+            self.sync_label.setText(self._sync_notice)
+        elif pending and self._offline:
+            self.sync_label.setStyleSheet("color: #b08800;")
+            self.sync_label.setText(
+                f"Offline: {pending} change(s) saved on this computer, "
+                "will sync when the connection is back"
+            )
+        elif pending:
+            self.sync_label.setStyleSheet("color: #b08800;")
+            self.sync_label.setText(f"{pending} change(s) waiting to sync")
+        elif queue.conflicts:
+            self.sync_label.setStyleSheet("color: #d73a49;")
+            self.sync_label.setText(
+                f"{len(queue.conflicts)} change(s) not saved: "
+                "edited in the sheet by someone else"
+            )
+        elif queue.dropped:
+            self.sync_label.setStyleSheet("color: #d73a49;")
+            self.sync_label.setText(
+                f"{len(queue.dropped)} change(s) skipped: "
+                "row no longer in the sheet"
+            )
+        else:
+            self.sync_label.setStyleSheet("color: #22863a;")
+            self.sync_label.setText("All changes saved")
+
+    def closeEvent(self, event):
+        self.flush_timer.stop()
+        self._set_busy(True, "Saving changes...")
+        self.io.wait()
+        if self.repository is None:
+            # Closed before the pipeline was open: nothing was changed.
+            self._set_busy(False)
+            super().closeEvent(event)
+            return
+        self._save_snapshot()
+        queue = get_write_queue()
+        try:
+            if not self._offline:
+                flush_pending_writes()
+        except Exception as exc:
+            cause = exc.cause if isinstance(exc, FlushError) else exc
+            if not self.repository.is_transient(cause):
+                self._set_busy(False)
+                answer = QMessageBox.question(
+                    self,
+                    "Unsaved changes",
+                    f"{queue.pending_count()} change(s) could not be saved:"
+                    f"\n{exc}\n\nQuit anyway?",
+                )
+                if answer != QMessageBox.Yes:
+                    event.ignore()
+                    self._update_sync_label()
+                    return
+                super().closeEvent(event)
+                return
+        self._set_busy(False)
+        if queue.pending_count():
+            # Still in the journal: replayed on the next start.
+            QMessageBox.information(
+                self,
+                "Changes saved offline",
+                f"{queue.pending_count()} change(s) are saved on this "
+                f"computer and will be sent to {self.repository.title} "
+                "the next time RecToDo starts.",
+            )
+        super().closeEvent(event)
+
     # ---- Theme ----
 
     def _on_theme_slider_changed(self, value: int):
@@ -189,39 +707,35 @@ class MainWindow(QMainWindow):
 
     # ---- View helpers ----
 
-    def _filtered_items(self) -> List[PipelineItem]:
-        items = [i for i in self.all_items if i.is_visible_now]
-        if self.view_mode == "overdue":
-            items = [i for i in items if i.priority == "red"]
-
-        query = self.search_edit.text().strip().lower()
-        if query:
-
-            def matches(i: PipelineItem) -> bool:
-                haystack = " ".join(
-                    [i.candidate_name or "", i.client or "", i.role or ""]
-                ).lower()
-                return query in haystack
-
-            items = [i for i in items if matches(i)]
-
-        return items
-
     def _refresh_view(self):
-        items = self._filtered_items()
-        model = PipelineTableModel(items)
-        self.table.setModel(model)
-
-        g, y, r, total = kpi_counts(self.all_items)
+        # One "today" for the whole refresh: model, filter and KPIs agree.
+        ctx = evaluation_context()
+        if self.model.set_context(ctx):
+            self.proxy.refilter()
+        # Same model for the window's lifetime: only deltas are applied.
+        self.model.set_items(self.store.items(), pending_ids=self._synced)
+        self._update_kpis()
+
+    def _check_day_rollover(self) -> None:
+        if self.model.set_context(evaluation_context()):
+            self.proxy.refilter()
+            self._update_kpis()
+
+    def _update_kpis(self) -> None:
+        # The model holds exactly the store's items, column store included.
+        g, y, r, total = self.model.columns.kpi_counts(self.model.context)
         self.kpi_green.setText(f"🟢 Fresh\n{g}")
         self.kpi_yellow.setText(f"🟡 Follow-up\n{y}")
         self.kpi_red.setText(f"🔴 Overdue\n{r}")
         self.kpi_total.setText(f"Total\n{total}")
 
+    def _apply_search(self) -> None:
+        self.proxy.set_query(self.search_edit.text())
+
     def _set_view_my(self):
         self.view_mode = "my"
         self.btn_overdue.setChecked(False)
-        self._refresh_view()
+        self.proxy.set_view_mode(self.view_mode)
 
     def _toggle_overdue(self):
         if self.view_mode == "overdue":
@@ -230,19 +744,79 @@ class MainWindow(QMainWindow):
         else:
             self.view_mode = "overdue"
             self.btn_overdue.setChecked(True)
-        self._refresh_view()
+        self.proxy.set_view_mode(self.view_mode)
 
     def _get_selected_item(self) -> Optional[PipelineItem]:
         index = self.table.currentIndex()
         if not index.isValid():
             return None
-        model = self.table.model()
-        if not hasattr(model, "items"):
-            return None
-        row = index.row()
-        if row < 0 or row >= len(model.items):
-            return None
-        return model.items[row]
+        source = self.proxy.mapToSource(index)
+        return self.model.item_at(source.row())
+
+    # ---- Notes ----
+
+    def _prefetch_notes(self) -> None:
+        if self.repository is None:
+            return  # still opening
+        item = self._get_selected_item()
+        if item is not None:
+            self._load_notes(item)
+
+    def _load_notes(
+        self,
+        item: PipelineItem,
+        on_done: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Make sure item.notes is loaded; on_done gets the text."""
+        if item.notes is None:
+            item.notes = self.notes.get(item)
+        if item.notes is not None:
+            self.notes.put(item, item.notes)
+            if on_done is not None:
+                on_done(item.notes)
+            return
+
+        self._notes_waiters.setdefault(item.id, []).append(
+            (item, on_done, on_error)
+        )
+        if item.id in self._notes_loading:
+            return
+        self._notes_loading.add(item.id)
+        self.io.submit(
+            self.repository.notes,
+            [item.id],
+            on_done=lambda notes: self._on_notes_loaded(item.id, notes),
+            on_error=lambda exc: self._on_notes_failed(item.id, str(exc)),
+        )
+
+    def _on_notes_loaded(self, item_id: str, notes: Dict[str, str]) -> None:
+        self._notes_loading.discard(item_id)
+        text = notes.get(item_id)
+        if text is None:
+            self._on_notes_failed(item_id, "not found in the sheet")
+            return
+        # Notes added while the text was unavailable (e.g. offline) may
+        # not have reached the sheet yet.
+        for entry in get_write_queue().queued_notes(item_id):
+            formatted = format_notes([entry])
+            if formatted not in text:
+                text = text + "\n\n" + formatted if text else formatted
+        waiters = self._notes_waiters.pop(item_id, [])
+        current = self.store.get(item_id)
+        for item in [w[0] for w in waiters] + [current]:
+            if item is not None and item.notes is None:
+                item.notes = text
+                self.notes.put(item, text)
+        for _, on_done, _ in waiters:
+            if on_done is not None:
+                on_done(text)
+
+    def _on_notes_failed(self, item_id: str, message: str) -> None:
+        self._notes_loading.discard(item_id)
+        for _, _, on_error in self._notes_waiters.pop(item_id, []):
+            if on_error is not None:
+                on_error(message)
 
     # ---- Candidate actions ----
 
@@ -250,6 +824,8 @@ class MainWindow(QMainWindow):
         self._open_actions_for_selected()
 
     def _open_actions_for_selected(self):
+        if self.repository is None:
+            return  # still opening; the rows shown are the snapshot's
         item = self._get_selected_item()
         if item is None:
             QMessageBox.information(
@@ -260,39 +836,38 @@ class MainWindow(QMainWindow):
             return
 
         dlg = CandidateActionsDialog(item, self)
-        if dlg.exec() != QDialog.Accepted:
+        self._load_notes(item, dlg.set_notes, dlg.notes_failed)
+        result = dlg.exec()
+        # The dialog is gone; a late notes reply only fills the cache.
+        waiters = self._notes_waiters.pop(item.id, [])
+        if waiters:
+            self._notes_waiters[item.id] = [
+                (i, None, None) for i, _, _ in waiters
+            ]
+        if result != QDialog.Accepted:
             if dlg.note_text:
-                self._set_busy(True, "Saving note...")
-                append_note(item, dlg.note_text)
-                row_dict = pipeline_item_to_sheet(item)
-                update_pipeline_row(item.id, row_dict)
-                self.all_items = load_items_for_owner(CURRENT_OWNER)
+                self._mark_pending(item.id, copy.copy(item))
+                note = append_note(item, dlg.note_text)
+                self._save_item(item, note=note)
                 self._refresh_view()
-                self._set_busy(False)
+                self._schedule_flush()
             return
 
         if dlg.remove_requested:
-            self._set_busy(True, "Removing candidate...")
-            delete_pipeline_row(item.id)
-            self.all_items = load_items_for_owner(CURRENT_OWNER)
+            self._mark_pending(item.id, item)
+            self._delete_item(item.id)
             self._refresh_view()
-            self._set_busy(False)
+            self._schedule_flush()
             return
 
-        self._set_busy(True, "Updating candidate...")
-
+        self._mark_pending(item.id, copy.copy(item))
         if dlg.selected_action is not None:
             apply_action(item, dlg.selected_action)
 
-        if dlg.note_text:
-            append_note(item, dlg.note_text)
-
-        row_dict = pipeline_item_to_sheet(item)
-        update_pipeline_row(item.id, row_dict)
-
-        self.all_items = load_items_for_owner(CURRENT_OWNER)
+        note = append_note(item, dlg.note_text)
+        self._save_item(item, note=note)
         self._refresh_view()
-        self._set_busy(False)
+        self._schedule_flush()
 
     # ---- Add / update candidate ----
 
@@ -311,10 +886,11 @@ class MainWindow(QMainWindow):
             )
             return
 
-        self._set_busy(True, "Saving candidate...")
-
-        self.all_items = load_items_for_owner(CURRENT_OWNER)
-        existing = find_candidate_by_name(self.all_items, CURRENT_OWNER, name)
+        # The store already holds every local edit, queued or not, so the
+        # duplicate check needs no reload.
+        existing = find_candidate_by_name(
+            self.store.items(), CURRENT_OWNER, name
+        )
 
         now = datetime.utcnow()
         today = date.today()
@@ -337,17 +913,16 @@ class MainWindow(QMainWindow):
                 updated_at=now,
                 archived=False,
             )
-            row_dict = pipeline_item_to_sheet(new_item)
-            append_pipeline_row(row_dict)
-            self.all_items.append(new_item)
+            self._mark_pending(new_item.id, None)
+            self._save_item(new_item, new=True)
         else:
+            self._mark_pending(existing.id, copy.copy(existing))
             existing.client = merge_csv_field(existing.client, data["client"])
             existing.role = merge_csv_field(existing.role, data["role"])
             existing.stage = data["stage"] or existing.stage
             existing.updated_at = now
 
-            row_dict = pipeline_item_to_sheet(existing)
-            update_pipeline_row(existing.id, row_dict)
+            self._save_item(existing)
 
         self._refresh_view()
-        self._set_busy(False)
+        self._schedule_flush()
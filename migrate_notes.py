@@ -0,0 +1,34 @@
+"""
+Move existing notes out of the pipeline tab's notes cells into the
+append-only notes tab (one row per note).
+
+    python -m migrate_notes [--dry-run]
+
+Run it once, with RecToDo closed everywhere: cells are cleared after
+their entries are copied. Repeating the run is safe.
+"""
+
+import argparse
+
+from sheets_repo import SheetsRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move notes cells into the notes tab."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="report what would be moved without writing anything",
+    )
+    args = parser.parse_args()
+
+    repository = SheetsRepository()
+    appended, cleared = repository.migrate_legacy_notes(dry_run=args.dry_run)
+    verb = "Would move" if args.dry_run else "Moved"
+    print(f"{verb} {appended} note(s) out of {cleared} notes cell(s).")
+
+
+if __name__ == "__main__":
+    main()
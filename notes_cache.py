@@ -0,0 +1,43 @@
+"""
+Bounded cache of candidate notes for RecToDo.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+from domain import PipelineItem
+
+
+def _version(item: PipelineItem) -> Optional[datetime]:
+    # Sheet stamps have whole seconds; local edits don't until saved.
+    stamp = item.updated_at
+    return stamp.replace(microsecond=0) if stamp else None
+
+
+class NotesCache:
+    """
+    Least-recently-used map of item id -> notes text.
+
+    Entries remember the item's updated_at; every note append bumps it,
+    so a hit is only returned for the same version of the item.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[datetime], str]]" = (
+            OrderedDict()
+        )
+
+    def get(self, item: PipelineItem) -> Optional[str]:
+        entry = self._entries.get(item.id)
+        if entry is None or entry[0] != _version(item):
+            return None
+        self._entries.move_to_end(item.id)
+        return entry[1]
+
+    def put(self, item: PipelineItem, notes: str) -> None:
+        self._entries[item.id] = (_version(item), notes)
+        self._entries.move_to_end(item.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
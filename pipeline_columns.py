@@ -0,0 +1,185 @@
+"""
+Columnar (NumPy) view of pipeline items for vectorized filters and KPIs.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from domain import EvaluationContext, PipelineItem
+
+STATUS_CODES = {"ACTIVE": 0, "SNOOZED": 1, "DONE": 2}
+_OTHER_STATUS = 3
+
+_NO_DATE = np.iinfo(np.int32).min  # next_check ordinal of undated items
+
+# Column name -> (dtype, value of an empty slot)
+_COLUMNS = {
+    "live": (np.bool_, False),
+    "next_check": (np.int32, _NO_DATE),
+    "status": (np.int8, _OTHER_STATUS),
+    "archived": (np.bool_, False),
+    "owner": (np.int32, -1),
+    "stage": (np.int32, -1),
+}
+
+
+class _Codes:
+    """Small string <-> int vocabulary for a categorical column."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def clear(self) -> None:
+        self.codes.clear()
+        self.values.clear()
+
+
+class PipelineColumns:
+    """
+    One slot per item, holding the fields that decide visibility and
+    priority: next_check ordinal, status code, archived flag, owner code
+    and stage code.
+
+    Items are added, updated and removed by id, next to the item list;
+    freed slots are reused. Visibility, priority buckets, KPI counts and
+    the overdue view are then single array expressions evaluated against
+    an EvaluationContext, whatever the number of rows.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._size = 0  # slots in use or freed, from the front
+        self.owners = _Codes()
+        self.stages = _Codes()
+        self.version = 0
+        for name, (dtype, fill) in _COLUMNS.items():
+            setattr(self, name, np.full(capacity, fill, dtype=dtype))
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.live)
+        for name, (dtype, fill) in _COLUMNS.items():
+            new = np.full(capacity, fill, dtype=dtype)
+            new[: self._size] = getattr(self, name)[: self._size]
+            setattr(self, name, new)
+
+    def slot(self, item_id: str) -> Optional[int]:
+        return self._slots.get(item_id)
+
+    # ---- Maintenance ----
+
+    def add(self, item: PipelineItem) -> None:
+        """Store item's fields, in its existing slot if it has one."""
+        slot = self._slots.get(item.id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                if self._size == len(self.live):
+                    self._grow()
+                slot = self._size
+                self._size += 1
+            self._slots[item.id] = slot
+        self.live[slot] = True
+        next_check = item.next_check_at
+        self.next_check[slot] = (
+            next_check.toordinal() if next_check else _NO_DATE
+        )
+        self.status[slot] = STATUS_CODES.get(item.status, _OTHER_STATUS)
+        self.archived[slot] = item.archived
+        self.owner[slot] = self.owners.code(item.owner)
+        self.stage[slot] = self.stages.code(item.stage)
+        self.version += 1
+
+    update = add
+
+    def remove(self, item_id: str) -> None:
+        slot = self._slots.pop(item_id, None)
+        if slot is None:
+            return
+        self.live[slot] = False
+        self._free.append(slot)
+        self.version += 1
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._free.clear()
+        self.live[: self._size] = False
+        self._size = 0
+        self.owners.clear()
+        self.stages.clear()
+        self.version += 1
+
+    # ---- Masks (one entry per slot; dead slots are always False) ----
+
+    def _view(self, name: str) -> np.ndarray:
+        return getattr(self, name)[: self._size]
+
+    def owner_mask(self, owner: Optional[str]) -> np.ndarray:
+        live = self._view("live")
+        if owner is None:
+            return live
+        code = self.owners.codes.get(owner)
+        if code is None:
+            return np.zeros_like(live)
+        return live & (self._view("owner") == code)
+
+    def active_mask(self) -> np.ndarray:
+        status = self._view("status")
+        return (
+            self._view("live")
+            & ~self._view("archived")
+            & (
+                (status == STATUS_CODES["ACTIVE"])
+                | (status == STATUS_CODES["SNOOZED"])
+            )
+        )
+
+    def visible_mask(self, ctx: EvaluationContext) -> np.ndarray:
+        """Same rule as EvaluationContext.is_visible."""
+        next_check = self._view("next_check")
+        due = (next_check == _NO_DATE) | (next_check <= ctx.today.toordinal())
+        snoozed = self._view("status") == STATUS_CODES["SNOOZED"]
+        return self.active_mask() & (~snoozed | due)
+
+    def priority_masks(
+        self, ctx: EvaluationContext
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Green, yellow and red masks; same tiers as EvaluationContext."""
+        next_check = self._view("next_check")
+        undated = next_check == _NO_DATE
+        days = next_check.astype(np.int64) - ctx.today.toordinal()
+        open_ = (
+            self._view("live")
+            & ~self._view("archived")
+            & (self._view("status") != STATUS_CODES["DONE"])
+        )
+        green = open_ & ~undated & (days >= 1)
+        yellow = open_ & (undated | (days == 0))
+        red = open_ & ~undated & (days < 0)
+        return green, yellow, red
+
+    def overdue_mask(self, ctx: EvaluationContext) -> np.ndarray:
+        return self.priority_masks(ctx)[2]
+
+    def kpi_counts(
+        self, ctx: EvaluationContext, owner: Optional[str] = None
+    ) -> Tuple[int, int, int, int]:
+        """Green/yellow/red/total, like data_loader.kpi_counts."""
+        rows = self.owner_mask(owner)
+        green, yellow, red = self.priority_masks(ctx)
+        return (
+            int(np.count_nonzero(green & rows)),
+            int(np.count_nonzero(yellow & rows)),
+            int(np.count_nonzero(red & rows)),
+            int(np.count_nonzero(rows)),
+        )
@@ -0,0 +1,255 @@
+"""
+Binary snapshot of the owner's pipeline list for RecToDo.
+
+The window renders from this file on launch, before the backend (or its
+client library) is even imported. It is rewritten after every sync and
+on exit.
+
+Layout (little-endian, fixed; all sections start on an 8-byte boundary):
+
+    header      magic, schema version, row count, column count, time of
+                the last sync, owner, backend, CRC-32 of everything after
+                the header
+    directory   one entry per column: name, kind, dictionary size,
+                section offset and length
+    sections    one per column, by kind:
+                  text      uint32 offsets[rows + 1], then UTF-8 bytes
+                  category  uint32 codes[rows], then the dictionary as a
+                            text section (offsets[size + 1], bytes)
+                  date      int32 ordinals (0: no date)
+                  datetime  int64 microseconds since the Unix epoch
+                  flag      uint8
+
+Fixed-width columns are read in place from an mmap (numpy.frombuffer);
+only the strings are copied out. A file with another schema version, a
+bad checksum or for another owner / backend is ignored.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain import PipelineItem
+
+SNAPSHOT_PATH = "rectodo_snapshot.bin"
+
+MAGIC = b"RTSNAP\x00\x00"
+# Bump whenever the layout or the column set changes.
+SCHEMA_VERSION = 2
+
+_HEADER = struct.Struct("<8sIIId64s16sI")
+_ENTRY = struct.Struct("<16sB3xIQQ")
+
+_TEXT, _CATEGORY, _DATE, _DATETIME, _FLAG = range(1, 6)
+
+# Every PipelineItem field but notes, which list loads leave out
+COLUMNS: Dict[str, int] = {
+    "id": _TEXT,
+    "owner": _CATEGORY,
+    "candidate_name": _TEXT,
+    "client": _CATEGORY,
+    "role": _CATEGORY,
+    "stage": _CATEGORY,
+    "sent_at": _DATE,
+    "last_action": _CATEGORY,
+    "last_action_at": _DATE,
+    "next_check_at": _DATE,
+    "status": _CATEGORY,
+    "created_at": _DATETIME,
+    "updated_at": _DATETIME,
+    "archived": _FLAG,
+}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class Snapshot:
+    items: List[PipelineItem]
+    synced_at: Optional[float]  # Unix time of the last sync, if any
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+# ---- Writing ----
+
+
+def _text(values: Sequence[str]) -> bytes:
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets.tobytes() + b"".join(encoded)
+
+
+def _category(values: Sequence[str]) -> Tuple[bytes, int]:
+    codes: Dict[str, int] = {}
+    column = np.fromiter(
+        (codes.setdefault(v, len(codes)) for v in values),
+        dtype="<u4",
+        count=len(values),
+    )
+    return column.tobytes() + _text(list(codes)), len(codes)
+
+
+def _encode(name: str, kind: int, items: List[PipelineItem]):
+    values = [getattr(item, name) for item in items]
+    if kind == _TEXT:
+        return _text(values), 0
+    if kind == _CATEGORY:
+        return _category([v or "" for v in values])
+    if kind == _DATE:
+        return (
+            np.array(
+                [v.toordinal() if v else 0 for v in values], dtype="<i4"
+            ).tobytes(),
+            0,
+        )
+    if kind == _DATETIME:
+        return (
+            np.array(
+                [(v - _EPOCH) // timedelta(microseconds=1) for v in values],
+                dtype="<i8",
+            ).tobytes(),
+            0,
+        )
+    return np.array(values, dtype="u1").tobytes(), 0
+
+
+def write_snapshot(
+    items: List[PipelineItem],
+    owner: str,
+    backend: str,
+    synced_at: Optional[float],
+    path: str = SNAPSHOT_PATH,
+) -> None:
+    """
+    Write items as owner's snapshot for backend. The file is replaced
+    atomically, so a reader never sees half of it.
+    """
+    sections = [_encode(n, k, items) for n, k in COLUMNS.items()]
+
+    offset = _align(_HEADER.size + _ENTRY.size * len(COLUMNS))
+    directory = []
+    body = bytearray(offset - _HEADER.size)
+    for (name, kind), (data, size) in zip(COLUMNS.items(), sections):
+        directory.append(
+            _ENTRY.pack(name.encode(), kind, size, offset, len(data))
+        )
+        body += data + b"\x00" * (_align(len(data)) - len(data))
+        offset += _align(len(data))
+    body[: len(directory) * _ENTRY.size] = b"".join(directory)
+
+    header = _HEADER.pack(
+        MAGIC,
+        SCHEMA_VERSION,
+        len(items),
+        len(COLUMNS),
+        synced_at or 0.0,
+        owner.encode("utf-8"),
+        backend.encode("utf-8"),
+        zlib.crc32(body),
+    )
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp, path)
+
+
+# ---- Reading ----
+
+
+def _strings(buf: mmap.mmap, offset: int, count: int) -> List[str]:
+    offsets = np.frombuffer(buf, "<u4", count + 1, offset).tolist()
+    start = offset + 4 * (count + 1)
+    blob = buf[start : start + offsets[-1]]
+    return [blob[a:b].decode("utf-8") for a, b in zip(offsets, offsets[1:])]
+
+
+def _decode(buf: mmap.mmap, rows: int, offset: int, kind: int, size: int):
+    if kind == _TEXT:
+        return _strings(buf, offset, rows)
+    if kind == _CATEGORY:
+        codes = np.frombuffer(buf, "<u4", rows, offset).tolist()
+        start = offset + 4 * rows
+        values = [sys.intern(v) for v in _strings(buf, start, size)]
+        return [values[c] for c in codes]
+    if kind == _DATE:
+        ordinals = np.frombuffer(buf, "<i4", rows, offset).tolist()
+        dates: Dict[int, Optional[date]] = {0: None}
+        return [
+            (
+                dates[o]
+                if o in dates
+                else dates.setdefault(o, date.fromordinal(o))
+            )
+            for o in ordinals
+        ]
+    if kind == _DATETIME:
+        micros = np.frombuffer(buf, "<i8", rows, offset)
+        # numpy builds the datetime objects (naive, like the items').
+        return micros.astype("datetime64[us]").astype(object).tolist()
+    return [bool(v) for v in np.frombuffer(buf, "u1", rows, offset).tolist()]
+
+
+def _read(buf: mmap.mmap, owner: str, backend: str) -> Optional[Snapshot]:
+    if len(buf) < _HEADER.size:
+        return None
+    magic, version, rows, ncols, synced_at, own, back, crc = (
+        _HEADER.unpack_from(buf)
+    )
+    if (
+        magic != MAGIC
+        or version != SCHEMA_VERSION
+        or own.rstrip(b"\x00").decode("utf-8") != owner
+        or back.rstrip(b"\x00").decode("utf-8") != backend
+        or zlib.crc32(memoryview(buf)[_HEADER.size :]) != crc
+    ):
+        return None
+
+    columns = {}
+    for n in range(ncols):
+        name, kind, size, offset, _ = _ENTRY.unpack_from(
+            buf, _HEADER.size + n * _ENTRY.size
+        )
+        columns[name.rstrip(b"\x00").decode()] = (kind, size, offset)
+    for name, kind in COLUMNS.items():
+        if name not in columns or columns[name][0] != kind:
+            return None
+
+    values = {
+        name: _decode(buf, rows, offset, kind, size)
+        for name, (kind, size, offset) in columns.items()
+        if name in COLUMNS
+    }
+    values["notes"] = [None] * rows
+    values["last_action"] = [v or None for v in values["last_action"]]
+    items = [
+        PipelineItem(*row)
+        for row in zip(*(values[n] for n in PipelineItem.__slots__))
+    ]
+    return Snapshot(items, synced_at or None)
+
+
+def read_snapshot(
+    owner: str, backend: str, path: str = SNAPSHOT_PATH
+) -> Optional[Snapshot]:
+    """
+    owner's items as last written for backend, or None when there is no
+    usable snapshot (missing, damaged, older schema, someone else's).
+    """
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return _read(buf, owner, backend)
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
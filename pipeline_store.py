@@ -0,0 +1,71 @@
+"""
+In-memory pipeline store for RecToDo.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from domain import PipelineItem
+
+
+class PipelineStore:
+    """
+    The owner's active items, keyed by id.
+
+    Local mutations are applied here directly (insert / replace / remove),
+    so the window never needs to re-download the sheet to show a change it
+    made itself. reset() is the full resync path.
+    """
+
+    def __init__(self, owner: str, items: Iterable[PipelineItem] = ()):
+        self.owner = owner
+        self._items: Dict[str, PipelineItem] = {}
+        self.reset(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def items(self) -> List[PipelineItem]:
+        return list(self._items.values())
+
+    def get(self, item_id: str) -> Optional[PipelineItem]:
+        return self._items.get(item_id)
+
+    def _belongs(self, item: PipelineItem) -> bool:
+        # Same rule as load_items_for_owner.
+        return item.is_active and item.owner == self.owner
+
+    def apply(self, item: PipelineItem) -> None:
+        """
+        Insert or replace item by id. Items that no longer belong in the
+        list (finished, archived, other owner) are dropped, just as a
+        reload would drop them.
+        """
+        if self._belongs(item):
+            self._items[item.id] = item
+        else:
+            self._items.pop(item.id, None)
+
+    def remove(self, item_id: str) -> Optional[PipelineItem]:
+        item = self._items.pop(item_id, None)
+        return item
+
+    def reset(
+        self,
+        items: Iterable[PipelineItem],
+        keep_local: Iterable[str] = (),
+    ) -> None:
+        """
+        Replace the contents with freshly loaded items. Ids in keep_local
+        have unsent local changes and keep their local state (including
+        being absent after a local delete).
+        """
+        keep = set(keep_local)
+        fresh: Dict[str, PipelineItem] = {}
+        for item in items:
+            if item.id not in keep and self._belongs(item):
+                fresh[item.id] = item
+        for item_id in keep:
+            local = self._items.get(item_id)
+            if local is not None:
+                fresh[item_id] = local
+        self._items = fresh
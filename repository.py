@@ -0,0 +1,636 @@
+"""
+Storage backends for the RecToDo pipeline.
+
+The app reads and writes the pipeline through a PipelineRepository and
+never talks to a backend directly:
+
+    sheets  the shared Google spreadsheet (sheets_repo.SheetsRepository)
+    sqlite  a local SQLite file, for teams that run without Google
+            Sheets (local_repo.SQLiteRepository)
+    fake    an in-memory sheet with simulated latency and quota errors,
+            for load testing and profiling offline
+            (fake_sheets.FakeSheetsRepository)
+
+The backend is picked by config.STORAGE_BACKEND, or by the
+RECTODO_BACKEND environment variable when it is set.
+"""
+
+import os
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from config import STORAGE_BACKEND
+from domain import NoteEntry, note_entry_from_sheet, note_entry_to_sheet
+from write_journal import JOURNAL_PATH, WriteJournal
+
+# Rows per page when streaming the pipeline
+PAGE_SIZE = 500
+
+# Columns list reads skip; they come back as None. Notes are read per
+# item with PipelineRepository.notes().
+LAZY_COLUMNS = ("notes",)
+
+
+@dataclass
+class CallStats:
+    """Latency counters for one kind of backend call."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class PipelineRepository(ABC):
+    """
+    Where the pipeline rows and their notes are stored.
+
+    Rows travel as raw cell strings: lists laid out as header() for
+    reads, dicts keyed by column name for writes. The write methods are
+    the primitives WriteQueue batches into; each sends a whole batch.
+    """
+
+    # Short name of the backend, as in config.STORAGE_BACKEND
+    name = ""
+    # How the status bar refers to it ("Syncing with ...")
+    title = ""
+    # The local mirror of this backend's rows (None: the default one)
+    mirror_path: Optional[str] = None
+    # The journal of its unsent writes (None: the default one)
+    journal_path: Optional[str] = None
+
+    # ---- Reads ----
+
+    @abstractmethod
+    def header(self) -> List[str]:
+        """Column names, in the order read rows are laid out."""
+
+    @abstractmethod
+    def iter_pages(
+        self, page_size: int = PAGE_SIZE, owner: Optional[str] = None
+    ) -> Iterator[List[List[Optional[str]]]]:
+        """
+        Yield every row (only owner's, when given) in pages of at most
+        page_size. LAZY_COLUMNS come back as None.
+        """
+
+    @abstractmethod
+    def changed_rows(
+        self,
+        since: Optional[str],
+        owner: Optional[str] = None,
+        known_ids: Optional[Set[str]] = None,
+    ) -> Tuple[List[str], List[List[Optional[str]]], Set[str], Optional[str]]:
+        """
+        Delta read: the rows whose updated_at is at or after since (all
+        rows when since is None) plus any row whose id is not in
+        known_ids, only owner's when given. Returns (header, changed
+        rows with LAZY_COLUMNS None, every id in scope, newest
+        updated_at seen).
+        """
+
+    @abstractmethod
+    def notes(self, ids: Iterable[str]) -> Dict[str, str]:
+        """
+        The notes of each id formatted as one text (see
+        domain.format_notes; "" for an id without notes).
+        """
+
+    # ---- Writes ----
+
+    @abstractmethod
+    def write_updates(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        bases: Dict[str, Dict[str, Any]],
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Update existing rows by id. An update with a base (the row as
+        last read) writes only the cells that differ from it, and is
+        skipped if the stored updated_at no longer matches the base's.
+        Returns (ids not found, ids skipped as conflicts).
+        """
+
+    @abstractmethod
+    def write_appends(
+        self, appends: Dict[str, Dict[str, Any]], dedupe: bool = False
+    ) -> None:
+        """
+        Add new rows, in order. With dedupe, a row whose id is already
+        stored is overwritten rather than added twice; WriteQueue asks
+        for it when an earlier attempt may have got through.
+        """
+
+    @abstractmethod
+    def write_notes(
+        self, entries: List[NoteEntry], dedupe: bool = False
+    ) -> None:
+        """
+        Add note entries, in order. With dedupe, entries already stored
+        (same item, time and text) are skipped.
+        """
+
+    @abstractmethod
+    def write_deletes(self, ids: List[str]) -> List[str]:
+        """Delete rows by id. Returns the ids that were not found."""
+
+    # ---- Errors ----
+
+    def is_transient(self, exc: Exception) -> bool:
+        """
+        Whether exc means "offline or overloaded, try again later"
+        rather than a write that can never succeed. Other OSErrors (a
+        missing credentials file, say) are configuration errors.
+        """
+        return isinstance(
+            exc, (ConnectionError, TimeoutError, socket.gaierror)
+        )
+
+    # ---- Diagnostics ----
+
+    def call_stats(self) -> Dict[str, CallStats]:
+        """A snapshot of per-call latency stats (empty if not tracked)."""
+        return {}
+
+
+def normalise_stamp(value: str) -> str:
+    # Both "YYYY-MM-DDTHH:MM:SS" and "YYYY-MM-DD HH:MM:SS" occur.
+    return value.strip().replace(" ", "T")
+
+
+def conflicts(
+    base: Optional[Dict[str, Any]], row: Dict[str, Any], stored_stamp: str
+) -> bool:
+    """
+    Whether the stored updated_at no longer matches base's. A stored
+    stamp equal to row's own is this very update, stored by an earlier
+    attempt, so not a conflict: replaying an update is harmless. A blank
+    stored stamp (a row added by hand) has no version to compare.
+    """
+    if base is None:
+        return False
+    theirs = normalise_stamp(stored_stamp)
+    if not theirs:
+        return False
+    if theirs == normalise_stamp(str(row.get("updated_at") or "")):
+        return False
+    return theirs != normalise_stamp(str(base.get("updated_at") or ""))
+
+
+def changed_cells(
+    row: Dict[str, Any], base: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """The cells of row that differ from base (all of row without one)."""
+    if base is None:
+        return row
+    return {col: v for col, v in row.items() if base.get(col) != v}
+
+
+def open_repository(backend: str) -> PipelineRepository:
+    """A new repository for the named backend (see module docstring)."""
+    if backend == "sheets":
+        from sheets_repo import SheetsRepository
+
+        return SheetsRepository()
+    if backend == "sqlite":
+        from local_repo import SQLiteRepository
+
+        return SQLiteRepository()
+    if backend == "fake":
+        from fake_sheets import FakeSheetsRepository
+
+        return FakeSheetsRepository()
+    raise ValueError(f"Unknown storage backend: {backend!r}")
+
+
+_repository: Optional[PipelineRepository] = None
+_write_queue: Optional["WriteQueue"] = None
+
+
+def configured_backend() -> str:
+    """The name of the backend to use (see module docstring)."""
+    return os.environ.get("RECTODO_BACKEND") or STORAGE_BACKEND
+
+
+def get_repository() -> PipelineRepository:
+    global _repository
+    if _repository is None:
+        _repository = open_repository(configured_backend())
+    return _repository
+
+
+def format_call_stats() -> str:
+    """Return the repository's latency stats as a small text table."""
+    lines = [f"{'call':<16}{'count':>7}{'mean ms':>10}{'max ms':>10}"]
+    for name, s in sorted(get_repository().call_stats().items()):
+        lines.append(
+            f"{name:<16}{s.count:>7}{s.mean * 1000:>10.1f}"
+            f"{s.max * 1000:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+# ---- Write-behind queue ----
+
+
+class FlushError(Exception):
+    """A flush failed part-way; says which ids made it and which did not."""
+
+    def __init__(
+        self, cause: Exception, sent_ids: Set[str], failed_ids: Set[str]
+    ):
+        super().__init__(str(cause))
+        self.cause = cause
+        self.sent_ids = sent_ids
+        self.failed_ids: Set[str] = failed_ids
+
+
+class WriteQueue:
+    """
+    Collects pending row writes and sends them in as few calls as possible.
+
+    Repeated writes to the same id are merged (last one wins), an update
+    to a row that is still waiting to be appended is folded into the
+    append, and deleting such a row cancels both (and its notes). Note
+    entries are kept in order per item id. flush() then makes one call
+    per kind of write at most (for Sheets: one batch_update, one
+    append_rows per tab and one batched row delete).
+
+    An update may come with a base: the row as last synced, i.e. the
+    state the edit started from. Only cells that differ from it are
+    written, and if the stored updated_at no longer matches the base's
+    the update is skipped and its id recorded in `conflicts`; the row
+    someone else changed is not overwritten.
+
+    With a journal every mutation is recorded there before it is queued,
+    and acknowledged once the backend has it, so nothing queued is lost
+    to a crash or a failed flush. A new queue replays what its journal
+    still holds. Replays are safe to repeat: updates carry their own
+    updated_at, appends their row id, and notes that may already have
+    been stored are checked before they are written again.
+    """
+
+    def __init__(
+        self,
+        repository: PipelineRepository,
+        journal: Optional[WriteJournal] = None,
+    ):
+        self._repository = repository
+        self._journal = journal
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._updates: Dict[str, Dict[str, Any]] = {}
+        self._bases: Dict[str, Dict[str, Any]] = {}
+        self._appends: Dict[str, Dict[str, Any]] = {}
+        self._deletes: Set[str] = set()
+        self._notes: Dict[str, List[NoteEntry]] = {}
+        self._keys: Dict[str, List[str]] = {}  # journal keys per id
+        self._unsure: Set[str] = set()  # appends / notes maybe stored
+        self.last_error: Optional[Exception] = None
+        self.last_flush_at: Optional[float] = None
+        self.dropped: List[str] = []  # ids that vanished from the backend
+        self.conflicts: List[str] = []  # ids changed there meanwhile
+        self._sent: Set[str] = set()
+        self._written: Dict[str, Dict[str, Any]] = {}
+        if journal is not None:
+            self._replay(journal)
+
+    # ---- Enqueue ----
+
+    def update(
+        self,
+        row_id: str,
+        row: Dict[str, Any],
+        base: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        row_id = str(row_id)
+        with self._lock:
+            self._log("update", row_id, {"row": row, "base": base})
+            self._apply_update(row_id, row, base)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        row_id = str(row.get("id", ""))
+        with self._lock:
+            self._log("append", row_id, {"row": row})
+            self._apply_append(row_id, row)
+
+    def delete(self, row_id: str) -> None:
+        row_id = str(row_id)
+        with self._lock:
+            self._log("delete", row_id, {})
+            self._apply_delete(row_id)
+
+    def append_note(self, entry: NoteEntry) -> None:
+        with self._lock:
+            cells = note_entry_to_sheet(entry)
+            self._log("note", entry.item_id, {"cells": cells})
+            self._notes.setdefault(entry.item_id, []).append(entry)
+
+    def _log(self, kind: str, row_id: str, payload: Dict[str, Any]) -> None:
+        # Journal first: once this returns the mutation survives a crash.
+        if self._journal is not None:
+            key = self._journal.append(kind, row_id, payload)
+            self._keys.setdefault(row_id, []).append(key)
+
+    def _apply_update(
+        self,
+        row_id: str,
+        row: Dict[str, Any],
+        base: Optional[Dict[str, Any]],
+    ) -> None:
+        if row_id in self._appends:
+            self._appends[row_id] = row
+        else:
+            self._updates[row_id] = row
+            if base is not None:
+                # The first edit's base: later ones build on it.
+                self._bases.setdefault(row_id, base)
+
+    def _apply_append(self, row_id: str, row: Dict[str, Any]) -> None:
+        self._deletes.discard(row_id)
+        self._appends[row_id] = row
+
+    def _apply_delete(self, row_id: str) -> None:
+        self._updates.pop(row_id, None)
+        self._bases.pop(row_id, None)
+        if self._appends.pop(row_id, None) is None:
+            self._deletes.add(row_id)
+        else:
+            # Never stored: nothing left to send for this id.
+            self._notes.pop(row_id, None)
+            self._ack(self._keys.pop(row_id, []))
+
+    def _replay(self, journal: WriteJournal) -> None:
+        with self._lock:
+            for key, kind, row_id, payload in journal.records():
+                self._keys.setdefault(row_id, []).append(key)
+                if kind == "update":
+                    self._apply_update(row_id, payload["row"], payload["base"])
+                elif kind == "append":
+                    self._apply_append(row_id, payload["row"])
+                elif kind == "delete":
+                    self._apply_delete(row_id)
+                elif kind == "note":
+                    entry = note_entry_from_sheet(payload["cells"])
+                    self._notes.setdefault(row_id, []).append(entry)
+            # A previous session may have sent these before it stopped.
+            self._unsure.update(self._appends)
+            self._unsure.update(self._notes)
+
+    def _ack(self, keys: List[str]) -> None:
+        if self._journal is not None:
+            self._journal.ack(keys)
+
+    # ---- State ----
+
+    def pending_count(self) -> int:
+        return len(self.pending_ids())
+
+    def pending_ids(self) -> Set[str]:
+        with self._lock:
+            return (
+                set(self._updates)
+                | set(self._appends)
+                | self._deletes
+                | set(self._notes)
+            )
+
+    def queued_notes(self, row_id: str) -> List[NoteEntry]:
+        """Note entries for row_id that the backend does not have yet."""
+        with self._lock:
+            return list(self._notes.get(row_id, ()))
+
+    def snapshots(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        The last synced row of each queued update that has a base, and
+        None for each queued append (not stored yet): what a rollback
+        would go back to.
+        """
+        with self._lock:
+            rows: Dict[str, Optional[Dict[str, Any]]] = dict(self._bases)
+            rows.update((row_id, None) for row_id in self._appends)
+            return rows
+
+    # ---- Flush ----
+
+    def discard(self, row_ids: Iterable[str]) -> None:
+        """Forget queued writes for row_ids (e.g. after a rollback)."""
+        with self._lock:
+            for row_id in row_ids:
+                self._updates.pop(row_id, None)
+                self._bases.pop(row_id, None)
+                self._appends.pop(row_id, None)
+                self._deletes.discard(row_id)
+                self._notes.pop(row_id, None)
+                self._unsure.discard(row_id)
+                self._ack(self._keys.pop(row_id, []))
+
+    def flush(self, max_ids: Optional[int] = None) -> Set[str]:
+        """
+        Send everything queued so far, or the writes of the first max_ids
+        ids only (draining a long backlog in batches). Returns the ids
+        that were written. On failure the unsent part goes back into the
+        queue (newer writes for the same id win) and a FlushError is
+        raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                queued = [
+                    *self._updates,
+                    *self._appends,
+                    *self._notes,
+                    *self._deletes,
+                ]
+                taken = set(list(dict.fromkeys(queued))[:max_ids])
+                updates = _take(self._updates, taken)
+                bases = _take(self._bases, taken)
+                appends = _take(self._appends, taken)
+                notes = _take(self._notes, taken)
+                deletes = self._deletes & taken
+                self._deletes -= deletes
+                keys = {i: self._keys.pop(i, []) for i in taken}
+                unsure = self._unsure & taken
+                self._unsure -= unsure
+            if not taken:
+                return set()
+
+            self._sent = set()
+            self._written = {}
+            try:
+                if updates:
+                    self._send_updates(updates, bases)
+                    updates = {}
+                if appends:
+                    self._send_appends(appends, bool(unsure & set(appends)))
+                    appends = {}
+                if notes:
+                    self._send_notes(notes, bool(unsure & set(notes)))
+                    notes = {}
+                if deletes:
+                    self._send_deletes(deletes)
+                    deletes = set()
+            except Exception as exc:
+                failed = set(updates) | set(appends) | deletes | set(notes)
+                self._requeue(updates, bases, appends, deletes, notes)
+                with self._lock:
+                    pending = self.pending_ids()
+                    for row_id in failed:
+                        # Older keys first, like the writes themselves.
+                        merged = keys.pop(row_id) + self._keys.pop(row_id, [])
+                        if row_id in pending:
+                            self._keys[row_id] = merged
+                        else:
+                            keys[row_id] = merged  # cancelled meanwhile
+                    # The failed call may still have stored them.
+                    self._unsure.update(set(appends) | set(notes))
+                self._ack([k for ks in keys.values() for k in ks])
+                self._rebase()
+                self.last_error = exc
+                raise FlushError(exc, self._sent, failed) from exc
+
+            self._ack([k for ks in keys.values() for k in ks])
+            self._rebase()
+            self.last_error = None
+            self.last_flush_at = time.time()
+            return self._sent
+
+    def _rebase(self) -> None:
+        # Updates queued while a flush was running start from what that
+        # flush wrote, not from the state before it.
+        with self._lock:
+            for row_id, row in self._written.items():
+                if row_id in self._updates:
+                    self._bases[row_id] = row
+
+    def _send_updates(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        bases: Dict[str, Dict[str, Any]],
+    ) -> None:
+        missing, conflicted = self._repository.write_updates(updates, bases)
+        self.dropped.extend(missing)
+        self.conflicts.extend(conflicted)
+        skipped = set(missing) | set(conflicted)
+        self._written.update(
+            (row_id, row)
+            for row_id, row in updates.items()
+            if row_id not in skipped
+        )
+        self._sent.update(updates)
+
+    def _send_appends(
+        self, appends: Dict[str, Dict[str, Any]], dedupe: bool
+    ) -> None:
+        self._repository.write_appends(appends, dedupe)
+        self._written.update(appends)
+        self._sent.update(appends)
+
+    def _send_notes(
+        self, notes: Dict[str, List[NoteEntry]], dedupe: bool
+    ) -> None:
+        self._repository.write_notes(
+            [entry for entries in notes.values() for entry in entries],
+            dedupe,
+        )
+        self._sent.update(notes)
+
+    def _send_deletes(self, deletes: Set[str]) -> None:
+        self.dropped.extend(self._repository.write_deletes(sorted(deletes)))
+        self._sent.update(deletes)
+
+    def _requeue(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        bases: Dict[str, Dict[str, Any]],
+        appends: Dict[str, Dict[str, Any]],
+        deletes: Set[str],
+        notes: Dict[str, List[NoteEntry]],
+    ) -> None:
+        with self._lock:
+            for row_id, row in appends.items():
+                if row_id in self._deletes:
+                    # Removed again before it was ever stored.
+                    self._deletes.discard(row_id)
+                    continue
+                newer = self._updates.pop(row_id, None)
+                self._appends[row_id] = newer or self._appends.get(row_id, row)
+            for row_id, row in updates.items():
+                if row_id not in self._deletes:
+                    self._updates.setdefault(row_id, row)
+                    if row_id in bases:
+                        # Older than any base queued since.
+                        self._bases[row_id] = bases[row_id]
+            for row_id in deletes:
+                self._updates.pop(row_id, None)
+                self._deletes.add(row_id)
+            for row_id, entries in notes.items():
+                if row_id in appends and row_id not in self._appends:
+                    continue  # the row itself was cancelled above
+                # Older entries go first; they were queued first.
+                self._notes[row_id] = entries + self._notes.get(row_id, [])
+
+
+def _take(queued: Dict[str, Any], ids: Set[str]) -> Dict[str, Any]:
+    # Move the entries of ids out of queued, in queue order.
+    return {i: queued.pop(i) for i in [i for i in queued if i in ids]}
+
+
+def get_write_queue() -> WriteQueue:
+    global _write_queue
+    if _write_queue is None:
+        repository = get_repository()
+        journal = WriteJournal(repository.journal_path or JOURNAL_PATH)
+        _write_queue = WriteQueue(repository, journal)
+    return _write_queue
+
+
+def queue_append_row(row: Dict[str, Any]) -> None:
+    """Queue a new row; it is sent on the next flush."""
+    get_write_queue().append(row)
+
+
+def queue_update_row(
+    row_id: str,
+    row: Dict[str, Any],
+    base: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Queue an update for row_id; it is sent on the next flush. With base
+    (the row as last synced) only changed cells are written, and a row
+    changed in the backend meanwhile is left alone (see WriteQueue).
+    """
+    get_write_queue().update(row_id, row, base)
+
+
+def queue_append_note(entry: NoteEntry) -> None:
+    """Queue a note entry; it is sent on the next flush."""
+    get_write_queue().append_note(entry)
+
+
+def queue_delete_row(row_id: str) -> None:
+    """Queue a row delete; it is sent on the next flush."""
+    get_write_queue().delete(row_id)
+
+
+def flush_pending_writes(max_ids: Optional[int] = None) -> Set[str]:
+    """
+    Send queued writes now (those of the first max_ids ids, when given).
+    Returns the ids that were written.
+    """
+    return get_write_queue().flush(max_ids)
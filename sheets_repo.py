@@ -1,8 +1,45 @@
-from typing import List, Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
 import gspread
+import requests
+from google.auth.exceptions import TransportError
+from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
 from gspread.utils import rowcol_to_a1
 
+from domain import (
+    NOTE_COLUMNS,
+    NoteEntry,
+    format_notes,
+    note_entry_from_sheet,
+    note_entry_to_sheet,
+    split_notes,
+)
+from repository import (
+    LAZY_COLUMNS,
+    PAGE_SIZE,
+    CallStats,
+    PipelineRepository,
+    changed_cells,
+    conflicts,
+    normalise_stamp,
+)
+
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
@@ -10,84 +47,871 @@ SCOPES = [
 
 SPREADSHEET_NAME = "RecToDo"
 PIPELINE_TAB_NAME = "pipeline"
+NOTES_TAB_NAME = "notes"
 
+# Ranges per batch_get when fetching scattered rows
+MAX_RANGES_PER_GET = 200
 
-def _get_client():
-    creds = Credentials.from_service_account_file(
-        "service_account.json",
-        scopes=SCOPES,
-    )
-    return gspread.authorize(creds)
+SERVICE_ACCOUNT_FILE = "service_account.json"
+# Resolving a spreadsheet by name is a Drive search; remember the key.
+SPREADSHEET_KEY_FILE = ".spreadsheet_key"
 
 
-def get_pipeline_rows() -> List[Dict[str, Any]]:
+class RowIndex:
     """
-    Return all rows from the 'pipeline' tab as a list of dicts.
-    Keys come from the header row (id, owner, candidate_name, ...).
+    Maps row ids to 1-based sheet row numbers.
+
+    Built from one read of the id column and kept in step with appends
+    and deletes. Before a write the id cell of the target row is checked;
+    only a mismatch (someone else inserted/sorted/deleted rows) triggers
+    a rebuild.
     """
-    client = _get_client()
-    spreadsheet = client.open(SPREADSHEET_NAME)
-    worksheet = spreadsheet.worksheet(PIPELINE_TAB_NAME)
-    records = worksheet.get_all_records()  # list[dict]
-    return records
 
+    def __init__(self, timed: Callable[[str], ContextManager[None]]):
+        self._timed = timed
+        self.header: Optional[List[str]] = None
+        self.rows: Optional[Dict[str, int]] = None
+        self.last_row = 1  # header row
+
+    def clear(self) -> None:
+        self.header = None
+        self.rows = None
+        self.last_row = 1
+
+    def get_header(self, worksheet: gspread.Worksheet) -> List[str]:
+        if self.header is None:
+            with self._timed("row_values"):
+                self.header = worksheet.row_values(1)
+        return self.header
+
+    def id_col(self, worksheet: gspread.Worksheet) -> int:
+        header = self.get_header(worksheet)
+        if "id" not in header:
+            raise ValueError("Pipeline tab has no 'id' column")
+        return header.index("id") + 1
+
+    def load(self, ids: Iterable[str]) -> None:
+        """Fill the index from ids in sheet order (first data row = 2)."""
+        self.rows = {}
+        self.last_row = 1
+        for row_num, row_id in enumerate(ids, start=2):
+            if row_id:
+                self.rows.setdefault(row_id, row_num)
+                self.last_row = row_num
+
+    def rebuild(self, worksheet: gspread.Worksheet) -> None:
+        col = self.id_col(worksheet)
+        with self._timed("col_values"):
+            column = worksheet.col_values(col)
+        self.load(str(v) for v in column[1:])
+
+    def locate_many(
+        self, worksheet: gspread.Worksheet, row_ids: List[str]
+    ) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Return ({id: verified row}, [ids not in the sheet]).
+        All target id cells are checked with a single batch read.
+        """
+        found, missing, _ = self.read_many(worksheet, row_ids, [])
+        return found, missing
+
+    def read_many(
+        self,
+        worksheet: gspread.Worksheet,
+        row_ids: List[str],
+        cols: List[int],
+    ) -> Tuple[Dict[str, int], List[str], Dict[str, List[str]]]:
+        """
+        Like locate_many, plus the cells in cols (1-based) of each found
+        row: ({id: row}, [missing ids], {id: [cell per col]}). The cells
+        are read in the same batch_get that checks the id cells.
+        """
+        if self.rows is None:
+            self.rebuild(worksheet)
+        found = {rid: self.rows[rid] for rid in row_ids if rid in self.rows}
+        cells: Dict[str, List[str]] = {}
+        stale = len(found) != len(row_ids)
+        if not stale:
+            cells, moved = self._read_cells(worksheet, found, cols)
+            stale = bool(moved)
+        if stale:
+            self.rebuild(worksheet)
+            found = {
+                rid: self.rows[rid] for rid in row_ids if rid in self.rows
+            }
+            if cols:
+                cells, moved = self._read_cells(worksheet, found, cols)
+                for rid in moved:  # moved again since the rebuild
+                    del found[rid]
+        missing = [rid for rid in row_ids if rid not in found]
+        return found, missing, cells
+
+    def _read_cells(
+        self,
+        worksheet: gspread.Worksheet,
+        targets: Dict[str, int],
+        cols: List[int],
+    ) -> Tuple[Dict[str, List[str]], Set[str]]:
+        # ({id: cells in cols}, {ids whose id cell no longer matches}),
+        # one range per cell and at most MAX_RANGES_PER_GET per batch_get
+        if not targets:
+            return {}, set()
+        read = [self.id_col(worksheet)] + list(cols)
+        rows = list(targets.values())
+        per_get = max(1, MAX_RANGES_PER_GET // len(read))
+        values: List[Any] = []
+        for first in range(0, len(rows), per_get):
+            ranges = [
+                rowcol_to_a1(n, c)
+                for n in rows[first : first + per_get]
+                for c in read
+            ]
+            with self._timed("batch_get"):
+                values.extend(worksheet.batch_get(ranges))
+        cells: Dict[str, List[str]] = {}
+        moved: Set[str] = set()
+        for k, row_id in enumerate(targets):
+            row = [
+                str(v[0][0]) if v and v[0] else ""
+                for v in values[k * len(read) : (k + 1) * len(read)]
+            ]
+            if row[0] != row_id:
+                moved.add(row_id)
+            else:
+                cells[row_id] = row[1:]
+        return cells, moved
+
+    def on_append(self, row_id: str) -> None:
+        if self.rows is None:
+            return
+        self.last_row += 1
+        if row_id:
+            self.rows[row_id] = self.last_row
 
-def append_pipeline_row(row: Dict[str, Any]) -> None:
+    def on_delete(self, row_num: int) -> None:
+        if self.rows is None:
+            return
+        self.rows = {
+            rid: (n - 1 if n > row_num else n)
+            for rid, n in self.rows.items()
+            if n != row_num
+        }
+        self.last_row -= 1
+
+
+class NotesIndex:
     """
-    Append a single row (dict) to the pipeline tab.
-    The dict keys must match the header names in the sheet.
-    Missing keys will become empty cells.
+    Maps item ids to the row numbers of their entries in the notes tab.
+
+    The tab is append-only, so the index only grows: each read first
+    picks up the rows added since the previous one (a read of the
+    item_id column from last_row down). Fetched entries carry their
+    item_id, which is checked; a mismatch (rows deleted or sorted by
+    hand) triggers a rebuild.
     """
-    client = _get_client()
-    spreadsheet = client.open(SPREADSHEET_NAME)
-    worksheet = spreadsheet.worksheet(PIPELINE_TAB_NAME)
 
-    header = worksheet.row_values(1)
-    values = [row.get(col, "") for col in header]
-    worksheet.append_row(values)
+    def __init__(self, timed: Callable[[str], ContextManager[None]]):
+        self._timed = timed
+        self.rows: Dict[str, List[int]] = {}
+        self.last_row = 1  # header row
+
+    def clear(self) -> None:
+        self.rows = {}
+        self.last_row = 1
+
+    def refresh(self, worksheet: gspread.Worksheet) -> None:
+        # Start at the last known row: a range past the grid is an error.
+        with self._timed("get_values"):
+            block = worksheet.get_values(_column_range(1, self.last_row))
+        for row_num, cells in enumerate(block[1:], start=self.last_row + 1):
+            item_id = _first(cells)
+            if item_id:
+                self.rows.setdefault(item_id, []).append(row_num)
+        self.last_row = max(self.last_row, self.last_row + len(block) - 1)
+
+    def rebuild(self, worksheet: gspread.Worksheet) -> None:
+        self.clear()
+        self.refresh(worksheet)
 
 
-def update_pipeline_row(row_id: str, row: Dict[str, Any]) -> None:
+class SheetsSession:
     """
-    Update an existing row (matched by 'id' column) in the pipeline tab.
+    One authorised gspread client plus the pipeline worksheet handle.
+
+    Credentials are built once and refreshed in place when they expire;
+    the spreadsheet key is resolved once (and cached on disk) so later
+    opens skip the Drive search.
     """
-    client = _get_client()
-    spreadsheet = client.open(SPREADSHEET_NAME)
-    worksheet = spreadsheet.worksheet(PIPELINE_TAB_NAME)
-
-    # Fetch all existing data to find the row index
-    records = worksheet.get_all_records()
-    header = worksheet.row_values(1)
-
-    target_row_index = None  # 1-based index in sheet
-    for idx, rec in enumerate(records, start=2):  # data starts at row 2
-        if str(rec.get("id", "")) == str(row_id):
-            target_row_index = idx
-            break
-
-    if target_row_index is None:
-        raise ValueError(f"Row with id {row_id} not found in sheet")
-
-    values = [row.get(col, "") for col in header]
-    start = rowcol_to_a1(target_row_index, 1)
-    end = rowcol_to_a1(target_row_index, len(header))
-    worksheet.update(f"{start}:{end}", [values])
-
-
-def delete_pipeline_row(row_id: str) -> None:
-    """Delete a row (matched by 'id') from the pipeline tab."""
-    client = _get_client()
-    spreadsheet = client.open(SPREADSHEET_NAME)
-    worksheet = spreadsheet.worksheet(PIPELINE_TAB_NAME)
-
-    records = worksheet.get_all_records()
-    target_row_index = None  # 1-based index in sheet
-    for idx, rec in enumerate(records, start=2):  # data starts at row 2
-        if str(rec.get("id", "")) == str(row_id):
-            target_row_index = idx
-            break
-
-    if target_row_index is None:
-        raise ValueError(f"Row with id {row_id} not found in sheet")
-
-    worksheet.delete_rows(target_row_index)
+
+    def __init__(
+        self,
+        service_account_file: str = SERVICE_ACCOUNT_FILE,
+        spreadsheet_name: str = SPREADSHEET_NAME,
+        tab_name: str = PIPELINE_TAB_NAME,
+        notes_tab_name: str = NOTES_TAB_NAME,
+        key_file: str = SPREADSHEET_KEY_FILE,
+    ):
+        self.service_account_file = service_account_file
+        self.spreadsheet_name = spreadsheet_name
+        self.tab_name = tab_name
+        self.notes_tab_name = notes_tab_name
+        self.key_file = Path(key_file)
+
+        self._lock = threading.RLock()
+        self._creds: Optional[Credentials] = None
+        self._client: Optional[gspread.Client] = None
+        self._spreadsheet_key: Optional[str] = None
+        self._worksheet: Optional[gspread.Worksheet] = None
+        self._notes_worksheet: Optional[gspread.Worksheet] = None
+        self.stats: Dict[str, CallStats] = {}
+        self.index = RowIndex(self.timed)
+        self.notes_index = NotesIndex(self.timed)
+
+    # ---- Connection ----
+
+    def client(self) -> gspread.Client:
+        with self._lock:
+            if self._client is None:
+                with self.timed("authorize"):
+                    self._creds = Credentials.from_service_account_file(
+                        self.service_account_file,
+                        scopes=SCOPES,
+                    )
+                    self._client = gspread.authorize(self._creds)
+            elif self._creds is not None and not self._creds.valid:
+                with self.timed("refresh_token"):
+                    self._creds.refresh(Request())
+            return self._client
+
+    def worksheet(self) -> gspread.Worksheet:
+        """Return the cached pipeline worksheet, opening it on first use."""
+        with self._lock:
+            client = self.client()
+            if self._worksheet is None:
+                spreadsheet = self._open_spreadsheet(client)
+                with self.timed("worksheet"):
+                    self._worksheet = spreadsheet.worksheet(self.tab_name)
+            return self._worksheet
+
+    def notes_worksheet(self) -> gspread.Worksheet:
+        """Return the notes worksheet, adding the tab if it is missing."""
+        with self._lock:
+            if self._notes_worksheet is None:
+                spreadsheet = self.worksheet().spreadsheet
+                try:
+                    with self.timed("worksheet"):
+                        worksheet = spreadsheet.worksheet(self.notes_tab_name)
+                except gspread.WorksheetNotFound:
+                    with self.timed("add_worksheet"):
+                        worksheet = spreadsheet.add_worksheet(
+                            self.notes_tab_name,
+                            rows=1,
+                            cols=len(NOTE_COLUMNS),
+                        )
+                        worksheet.update([NOTE_COLUMNS], "A1")
+                self._notes_worksheet = worksheet
+            return self._notes_worksheet
+
+    def reset(self) -> None:
+        """Drop cached handles so the next call reconnects."""
+        with self._lock:
+            self._client = None
+            self._creds = None
+            self._worksheet = None
+            self._notes_worksheet = None
+            self.index.clear()
+            self.notes_index.clear()
+
+    def _open_spreadsheet(self, client: gspread.Client) -> gspread.Spreadsheet:
+        key = self._spreadsheet_key or self._read_cached_key()
+        if key:
+            try:
+                with self.timed("open_by_key"):
+                    spreadsheet = client.open_by_key(key)
+                self._spreadsheet_key = key
+                return spreadsheet
+            except (gspread.SpreadsheetNotFound, gspread.exceptions.APIError):
+                # Stale key (sheet deleted or access revoked): search again.
+                pass
+
+        with self.timed("open_by_name"):
+            spreadsheet = client.open(self.spreadsheet_name)
+        self._spreadsheet_key = spreadsheet.id
+        self._write_cached_key(spreadsheet.id)
+        return spreadsheet
+
+    def _read_cached_key(self) -> Optional[str]:
+        try:
+            return self.key_file.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def _write_cached_key(self, key: str) -> None:
+        try:
+            self.key_file.write_text(key, encoding="utf-8")
+        except OSError:
+            pass  # cache only; the in-memory key still applies
+
+    # ---- Latency stats ----
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stats = self.stats.setdefault(name, CallStats())
+                stats.count += 1
+                stats.total += elapsed
+                stats.max = max(stats.max, elapsed)
+
+
+def _pad(block: List[List[str]], width: int) -> List[List[str]]:
+    return [
+        r + [""] * (width - len(r)) if len(r) < width else r for r in block
+    ]
+
+
+def _column_range(col: int, first_row: int = 2) -> str:
+    letter = rowcol_to_a1(1, col)[:-1]
+    return f"{letter}{first_row}:{letter}"
+
+
+def _first(cells: List[Any]) -> str:
+    return str(cells[0]) if cells else ""
+
+
+def _row_ranges(row_nums: Iterable[int]) -> List[List[int]]:
+    # Ascending row numbers -> [first, last] of each contiguous run.
+    ranges: List[List[int]] = []
+    for row_num in row_nums:
+        if ranges and ranges[-1][1] == row_num - 1:
+            ranges[-1][1] = row_num
+        else:
+            ranges.append([row_num, row_num])
+    return ranges
+
+
+def _column_spans(
+    header: List[str], keep: Callable[[str], bool]
+) -> List[Tuple[int, int]]:
+    # 1-based [first, last] column runs of the columns to keep.
+    spans: List[Tuple[int, int]] = []
+    for col, name in enumerate(header, start=1):
+        if not keep(name):
+            continue
+        if spans and spans[-1][1] == col - 1:
+            spans[-1] = (spans[-1][0], col)
+        else:
+            spans.append((col, col))
+    return spans
+
+
+def _list_spans(header: List[str]) -> List[Tuple[int, int]]:
+    return _column_spans(header, lambda name: name not in LAZY_COLUMNS)
+
+
+def _span_ranges(
+    spans: List[Tuple[int, int]], start: int, end: int
+) -> List[str]:
+    return [
+        f"{rowcol_to_a1(start, first)}:{rowcol_to_a1(end, last)}"
+        for first, last in spans
+    ]
+
+
+def _stitch(
+    header: List[str], spans: List[Tuple[int, int]], blocks: List[Any]
+) -> List[List[Optional[str]]]:
+    """
+    Rebuild header-ordered rows from one block per column span. Columns
+    outside the spans are None (not read), cells past the data are "".
+    """
+    count = max((len(b) for b in blocks), default=0)
+    rows: List[List[Optional[str]]] = [
+        [None] * len(header) for _ in range(count)
+    ]
+    for (first, last), block in zip(spans, blocks):
+        width = last - first + 1
+        for row, cells in zip(rows, block):
+            row[first - 1 : last] = list(cells) + [""] * (width - len(cells))
+        for row in rows[len(block) :]:
+            row[first - 1 : last] = [""] * width
+    return rows
+
+
+def _stamp_col(header: List[str]) -> List[int]:
+    # The updated_at column as a read_many cols list (empty if absent).
+    return [header.index("updated_at") + 1] if "updated_at" in header else []
+
+
+def _conflicts(
+    base: Optional[Dict[str, Any]],
+    row: Dict[str, Any],
+    stamp_cells: List[str],
+) -> bool:
+    # stamp_cells is empty when the tab has no updated_at column.
+    return bool(stamp_cells) and conflicts(base, row, stamp_cells[0])
+
+
+def _row_updates(
+    header: List[str], row_num: int, row: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    batch_update entries writing the columns present in row, one range
+    per run of adjacent columns; columns missing from row are left as
+    they are in the sheet.
+    """
+    data = []
+    for first, last in _column_spans(header, row.__contains__):
+        values = [row[col] for col in header[first - 1 : last]]
+        start = rowcol_to_a1(row_num, first)
+        end = rowcol_to_a1(row_num, last)
+        data.append({"range": f"{start}:{end}", "values": [values]})
+    return data
+
+
+class SheetsRepository(PipelineRepository):
+    """The pipeline and notes tabs of the shared Google spreadsheet."""
+
+    name = "sheets"
+    title = "Google Sheets"
+
+    def __init__(self, session: Optional[SheetsSession] = None):
+        self.session = session or SheetsSession()
+
+    def is_transient(self, exc: Exception) -> bool:
+        if isinstance(exc, gspread.exceptions.APIError):
+            # Rate limited, or a server-side error.
+            return exc.code == 429 or exc.code >= 500
+        return isinstance(
+            exc,
+            (
+                TransportError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ),
+        ) or super().is_transient(exc)
+
+    def call_stats(self) -> Dict[str, CallStats]:
+        session = self.session
+        with session._lock:
+            return {
+                name: CallStats(s.count, s.total, s.max)
+                for name, s in session.stats.items()
+            }
+
+    # ---- Reads ----
+
+    def header(self) -> List[str]:
+        """Header row of the pipeline tab (cached by the row index)."""
+        return self.session.index.get_header(self.session.worksheet())
+
+    def get_pipeline_values(self) -> Tuple[List[str], List[List[str]]]:
+        """
+        Return (header, data rows) of the pipeline tab as raw cell
+        strings, read with one get_values call. Short rows are padded to
+        the header.
+        """
+        session = self.session
+        worksheet = session.worksheet()
+        with session.timed("get_values"):
+            grid = worksheet.get_values()
+        if not grid:
+            return [], []
+        header, rows = [str(h) for h in grid[0]], grid[1:]
+        rows = _pad(rows, len(header))
+        session.index.header = header
+        id_pos = header.index("id") if "id" in header else None
+        if id_pos is not None:
+            session.index.load(r[id_pos] for r in rows)
+        return header, rows
+
+    def _read_columns(
+        self,
+        worksheet: gspread.Worksheet,
+        header: List[str],
+        names: List[str],
+    ) -> List[List[str]]:
+        """
+        The data cells of the named columns, one batch_get for all of
+        them. Every list is as long as the id column (the first name).
+        """
+        with self.session.timed("batch_get"):
+            blocks = worksheet.batch_get(
+                [_column_range(header.index(n) + 1) for n in names]
+            )
+        columns = [[_first(c) for c in block] for block in blocks]
+        length = len(columns[0])
+        return [c[:length] + [""] * (length - len(c)) for c in columns]
+
+    def _fetch_rows(
+        self,
+        worksheet: gspread.Worksheet,
+        header: List[str],
+        row_nums: List[int],
+    ) -> List[List[Optional[str]]]:
+        """
+        The list columns of rows by row number (LAZY_COLUMNS come back
+        as None). One range per contiguous run and column span, at most
+        MAX_RANGES_PER_GET ranges per batch_get (each range is a URL
+        query parameter).
+        """
+        spans = _list_spans(header)
+        runs = _row_ranges(row_nums)
+        runs_per_get = max(1, MAX_RANGES_PER_GET // len(spans))
+        rows: List[List[Optional[str]]] = []
+        for first in range(0, len(runs), runs_per_get):
+            chunk = runs[first : first + runs_per_get]
+            ranges = [r for s, e in chunk for r in _span_ranges(spans, s, e)]
+            with self.session.timed("batch_get"):
+                blocks = worksheet.batch_get(ranges)
+            for n in range(len(chunk)):
+                rows.extend(
+                    _stitch(
+                        header,
+                        spans,
+                        blocks[n * len(spans) : (n + 1) * len(spans)],
+                    )
+                )
+        return rows
+
+    def _owner_row_nums(
+        self, worksheet: gspread.Worksheet, header: List[str], owner: str
+    ) -> List[int]:
+        """Row numbers of owner's rows, from the id and owner columns."""
+        if "owner" not in header:
+            raise ValueError("Pipeline tab has no 'owner' column")
+        ids, owners = self._read_columns(worksheet, header, ["id", "owner"])
+        self.session.index.load(ids)
+        return [
+            row_num
+            for row_num, (row_id, row_owner) in enumerate(zip(ids, owners), 2)
+            if row_id and row_owner == owner
+        ]
+
+    def iter_pages(
+        self,
+        page_size: int = PAGE_SIZE,
+        owner: Optional[str] = None,
+    ) -> Iterator[List[List[Optional[str]]]]:
+        """
+        Yield the pipeline tab as pages of raw value rows (cell strings
+        in header() order), one batch_get per page. LAZY_COLUMNS are not
+        downloaded and come back as None; see notes().
+
+        With owner set, only the id and owner columns are read in full;
+        the pages then hold just that owner's rows, fetched as contiguous
+        ranges, so the download grows with one pipeline rather than the
+        whole team's.
+
+        Only one page is held at a time, so memory is bounded by
+        page_size rather than by the size of the sheet.
+        """
+        session = self.session
+        worksheet = session.worksheet()
+        index = session.index
+        header = index.get_header(worksheet)
+        id_pos = index.id_col(worksheet) - 1
+
+        if owner is not None:
+            row_nums = self._owner_row_nums(worksheet, header, owner)
+            for start in range(0, len(row_nums), page_size):
+                page = self._fetch_rows(
+                    worksheet, header, row_nums[start : start + page_size]
+                )
+                if page:
+                    yield page
+            return
+
+        spans = _list_spans(header)
+        ids: List[str] = []
+        start = 2
+        while True:
+            end = start + page_size - 1
+            with session.timed("batch_get"):
+                blocks = worksheet.batch_get(_span_ranges(spans, start, end))
+            page = _stitch(header, spans, blocks)
+            if not page:
+                break
+            # Trailing blank rows are trimmed from a page, not the end
+            # of the tab: only an empty page is. Pad the ids so the row
+            # numbers of the next page stay right.
+            ids.extend(r[id_pos] for r in page)
+            ids.extend([""] * (page_size - len(page)))
+            yield page
+            start = end + 1
+
+        index.load(ids)
+
+    def changed_rows(
+        self,
+        since: Optional[str],
+        owner: Optional[str] = None,
+        known_ids: Optional[Set[str]] = None,
+    ) -> Tuple[List[str], List[List[Optional[str]]], Set[str], Optional[str]]:
+        """
+        Delta read of the pipeline tab.
+
+        Reads only the id and updated_at columns (plus owner, when owner
+        is given), then fetches with one batch_get the rows whose
+        updated_at is at or after `since` (all rows when since is None),
+        and any row whose id is not in known_ids. With owner set only
+        that owner's rows are considered. Returns (header, changed rows
+        as raw value rows with LAZY_COLUMNS None, every id in scope
+        currently in the sheet, newest updated_at seen).
+        """
+        session = self.session
+        worksheet = session.worksheet()
+        index = session.index
+        header = index.get_header(worksheet)
+        if "updated_at" not in header:
+            raise ValueError("Pipeline tab has no 'updated_at' column")
+        index.id_col(worksheet)  # checks the id column exists
+
+        if owner is None:
+            ids, stamps = self._read_columns(
+                worksheet, header, ["id", "updated_at"]
+            )
+            in_scope = [bool(i) for i in ids]
+        else:
+            if "owner" not in header:
+                raise ValueError("Pipeline tab has no 'owner' column")
+            ids, stamps, owners = self._read_columns(
+                worksheet, header, ["id", "updated_at", "owner"]
+            )
+            in_scope = [bool(i) and o == owner for i, o in zip(ids, owners)]
+        stamps = [normalise_stamp(s) for s in stamps]
+        index.load(ids)
+
+        changed = [
+            row_num
+            for row_num, (row_id, stamp, keep) in enumerate(
+                zip(ids, stamps, in_scope), start=2
+            )
+            if keep
+            and (
+                since is None
+                or not stamp
+                or stamp >= since
+                or (known_ids is not None and row_id not in known_ids)
+            )
+        ]
+        newest = max((s for s in stamps if s), default=None)
+        rows = self._fetch_rows(worksheet, header, changed)
+        scope_ids = {i for i, keep in zip(ids, in_scope) if keep}
+        return header, rows, scope_ids, newest
+
+    def _fetch_notes(
+        self,
+        worksheet: gspread.Worksheet,
+        index: NotesIndex,
+        ids: List[str],
+    ) -> Tuple[Dict[str, List[NoteEntry]], bool]:
+        """
+        The indexed entries of ids, oldest first, one batch_get per
+        MAX_RANGES_PER_GET row runs. Returns (entries, whether every
+        fetched row still belonged to the id the index expected).
+        """
+        expected = {n: i for i in set(ids) for n in index.rows.get(i, ())}
+        runs = _row_ranges(sorted(expected))
+        spans = [(1, len(NOTE_COLUMNS))]
+        entries: Dict[str, List[NoteEntry]] = {}
+        verified = True
+        for first in range(0, len(runs), MAX_RANGES_PER_GET):
+            chunk = runs[first : first + MAX_RANGES_PER_GET]
+            ranges = [r for s, e in chunk for r in _span_ranges(spans, s, e)]
+            with self.session.timed("batch_get"):
+                blocks = worksheet.batch_get(ranges)
+            for (start, end), block in zip(chunk, blocks):
+                for row_num, cells in zip(range(start, end + 1), block):
+                    entry = note_entry_from_sheet(cells)
+                    if entry.item_id != expected[row_num]:
+                        verified = False
+                        continue
+                    entries.setdefault(entry.item_id, []).append(entry)
+                if len(block) < end - start + 1:
+                    verified = False  # rows gone from the bottom
+        return entries, verified
+
+    def notes(self, ids: Iterable[str]) -> Dict[str, str]:
+        """
+        The notes of each id from the notes tab, formatted as one text
+        (see domain.format_notes; "" for an id without notes). Costs one
+        read of the rows appended since the previous call plus one
+        batch_get for the entries themselves.
+        """
+        worksheet = self.session.notes_worksheet()
+        index = self.session.notes_index
+        ids = list(ids)
+        index.refresh(worksheet)
+        entries, verified = self._fetch_notes(worksheet, index, ids)
+        if not verified:
+            index.rebuild(worksheet)
+            entries, _ = self._fetch_notes(worksheet, index, ids)
+        return {i: format_notes(entries.get(i, [])) for i in ids}
+
+    def migrate_legacy_notes(self, dry_run: bool = False) -> Tuple[int, int]:
+        """
+        Move the pipeline tab's notes cells into the notes tab: each cell
+        is split into entries (domain.split_notes), appended with one
+        append_rows, then cleared with one batch_clear. Entries already
+        in the notes tab are not appended again, so an interrupted run
+        can be repeated. Returns (entries appended, cells cleared); with
+        dry_run nothing is written.
+        """
+        session = self.session
+        header, rows = self.get_pipeline_values()
+        if "id" not in header or "notes" not in header:
+            return 0, 0
+        id_pos = header.index("id")
+        notes_pos = header.index("notes")
+
+        notes_worksheet = session.notes_worksheet()
+        with session.timed("get_values"):
+            existing = notes_worksheet.get_values()[1:]
+        seen = {
+            tuple(note_entry_to_sheet(note_entry_from_sheet(r)))
+            for r in existing
+        }
+        values: List[List[str]] = []
+        cells: List[str] = []
+        for row_num, row in enumerate(rows, start=2):
+            text = row[notes_pos]
+            if not row[id_pos] or not text.strip():
+                continue
+            for entry in split_notes(row[id_pos], text):
+                cells_ = note_entry_to_sheet(entry)
+                if tuple(cells_) not in seen:
+                    values.append(cells_)
+            cells.append(rowcol_to_a1(row_num, notes_pos + 1))
+
+        if not dry_run:
+            if values:
+                with session.timed("append_rows"):
+                    notes_worksheet.append_rows(values, table_range="A1")
+            if cells:
+                with session.timed("batch_clear"):
+                    session.worksheet().batch_clear(cells)
+        return len(values), len(cells)
+
+    # ---- Batched writes (see repository.WriteQueue) ----
+
+    def write_updates(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        bases: Dict[str, Dict[str, Any]],
+    ) -> Tuple[List[str], List[str]]:
+        session = self.session
+        worksheet = session.worksheet()
+        index = session.index
+        header = index.get_header(worksheet)
+
+        # The id check and the updated_at cells come in one batch_get.
+        rows, missing, cells = index.read_many(
+            worksheet, list(updates), _stamp_col(header)
+        )
+        conflicted = []
+        data = []
+        for row_id, row_num in rows.items():
+            base = bases.get(row_id)
+            if _conflicts(base, updates[row_id], cells[row_id]):
+                conflicted.append(row_id)
+                continue
+            changed = changed_cells(updates[row_id], base)
+            data.extend(_row_updates(header, row_num, changed))
+        if data:
+            with session.timed("batch_update"):
+                worksheet.batch_update(data)
+        return missing, conflicted
+
+    def write_appends(
+        self, appends: Dict[str, Dict[str, Any]], dedupe: bool = False
+    ) -> None:
+        session = self.session
+        worksheet = session.worksheet()
+        index = session.index
+        header = index.get_header(worksheet)
+
+        if dedupe:
+            # A fresh id column: the earlier attempt is not in the index.
+            index.rebuild(worksheet)
+            stored = [row_id for row_id in appends if row_id in index.rows]
+            rows, _ = index.locate_many(worksheet, stored)
+            data = [
+                update
+                for row_id, row_num in rows.items()
+                for update in _row_updates(header, row_num, appends[row_id])
+            ]
+            if data:
+                with session.timed("batch_update"):
+                    worksheet.batch_update(data)
+            appends = {i: r for i, r in appends.items() if i not in rows}
+            if not appends:
+                return
+
+        values = [
+            [row.get(col, "") for col in header] for row in appends.values()
+        ]
+        with session.timed("append_rows"):
+            worksheet.append_rows(values)
+        for row_id in appends:
+            index.on_append(row_id)
+
+    def write_notes(
+        self, entries: List[NoteEntry], dedupe: bool = False
+    ) -> None:
+        session = self.session
+        worksheet = session.notes_worksheet()
+
+        values = [note_entry_to_sheet(entry) for entry in entries]
+        if dedupe:
+            index = session.notes_index
+            index.refresh(worksheet)
+            ids = [entry.item_id for entry in entries]
+            stored, verified = self._fetch_notes(worksheet, index, ids)
+            if not verified:
+                index.rebuild(worksheet)
+                stored, _ = self._fetch_notes(worksheet, index, ids)
+            seen = {
+                tuple(note_entry_to_sheet(e))
+                for found in stored.values()
+                for e in found
+            }
+            values = [v for v in values if tuple(v) not in seen]
+            if not values:
+                return
+        # The notes index picks these rows up on its next refresh.
+        with session.timed("append_rows"):
+            worksheet.append_rows(values, table_range="A1")
+
+    def write_deletes(self, ids: List[str]) -> List[str]:
+        session = self.session
+        worksheet = session.worksheet()
+        index = session.index
+
+        rows, missing = index.locate_many(worksheet, ids)
+        # Bottom-up so earlier deletes don't shift later targets.
+        row_nums = sorted(rows.values(), reverse=True)
+        if not row_nums:
+            return missing
+        delete_requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": worksheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": n - 1,
+                        "endIndex": n,
+                    }
+                }
+            }
+            for n in row_nums
+        ]
+        with session.timed("delete_rows"):
+            worksheet.spreadsheet.batch_update({"requests": delete_requests})
+        for n in row_nums:
+            index.on_delete(n)
+        return missing
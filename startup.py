@@ -0,0 +1,127 @@
+"""
+Startup timing for RecToDo.
+
+    RECTODO_STARTUP_REPORT=1 python app.py
+
+prints, once the first load has finished, how long startup spent on each
+phase (imports, backend auth, fetching rows, parsing them) and when the
+window first painted, counted from the moment this module was imported
+(app.py imports it first).
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+_STARTED = time.perf_counter()
+
+# Backend calls that set up the connection (see SheetsSession), counted
+# as "auth" rather than "fetch"
+CONNECT_CALLS = ("authorize", "open_by_key", "open_by_name", "worksheet")
+
+# Report rows, in startup order
+PHASES = (
+    "import",
+    "read snapshot",
+    "auth",
+    "read mirror",
+    "fetch",
+    "parse",
+)
+
+
+class StartupReport:
+    """
+    Durations per phase plus milestones (seconds since start), recorded
+    from both the GUI thread and the I/O thread until finish().
+    """
+
+    def __init__(self, started: float = _STARTED):
+        self.started = started
+        self.phases: Dict[str, float] = {}
+        self.milestones: Dict[str, float] = {}
+        self.finished = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase name."""
+        if self.finished:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, time.perf_counter() - start)
+
+    def timed_iter(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Iterate items, adding the time spent fetching each to name."""
+        it = iter(items)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+
+    def mark(self, name: str) -> None:
+        """Record milestone name now (only its first occurrence)."""
+        with self._lock:
+            if not self.finished and name not in self.milestones:
+                self.milestones[name] = time.perf_counter() - self.started
+
+    def finish(self, call_stats: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Close the report. Connection calls in call_stats (the backend's
+        CallStats) move from "fetch", where they were made, to "auth".
+        Printed when RECTODO_STARTUP_REPORT is set.
+        """
+        if self.finished:
+            return
+        self.mark("loaded")
+        connect = sum(
+            s.total
+            for n, s in (call_stats or {}).items()
+            if n in CONNECT_CALLS
+        )
+        with self._lock:
+            self.finished = True
+            if connect:
+                self.phases["auth"] = connect
+                fetch = self.phases.get("fetch", 0.0)
+                self.phases["fetch"] = max(0.0, fetch - connect)
+        if os.environ.get("RECTODO_STARTUP_REPORT"):
+            print(self.format())
+
+    def format(self) -> str:
+        """The report as a small text table (milliseconds)."""
+        lines = [f"{'startup phase':<20}{'ms':>10}"]
+        names = [n for n in PHASES if n in self.phases]
+        names += [n for n in self.phases if n not in PHASES]
+        for name in names:
+            lines.append(f"{name:<20}{self.phases[name] * 1000:>10.1f}")
+        lines.append(f"{'milestone':<20}{'ms':>10}")
+        for name, at in sorted(self.milestones.items(), key=lambda m: m[1]):
+            lines.append(f"{name:<20}{at * 1000:>10.1f}")
+        return "\n".join(lines)
+
+    def _add(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            if not self.finished:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+
+_report: Optional[StartupReport] = None
+
+
+def get_startup_report() -> StartupReport:
+    global _report
+    if _report is None:
+        _report = StartupReport()
+    return _report
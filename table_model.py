@@ -2,24 +2,261 @@
 Qt table model for displaying pipeline items.
 """
 
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+import numpy as np
+from PySide6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+)
 from PySide6.QtGui import QColor
 
 from config import TABLE_COLUMNS
-from domain import PipelineItem
+from domain import EvaluationContext, PipelineItem, evaluation_context
+from pipeline_columns import PipelineColumns
+from search_index import MIN_GRAM_QUERY, TrigramIndex
 from utils import format_date_uk
 
 
+# Role used by the proxy for sorting (numbers sort as numbers)
+SORT_ROLE = Qt.UserRole
+
+_NO_DATE = 10**9  # sorts rows without a next check last
+
+# Shared, prebuilt colours: data() hands out these instances only.
+_PRIORITY_FOREGROUND = {
+    "green": QColor("#22863a"),
+    "yellow": QColor("#b08800"),
+    "red": QColor("#d73a49"),
+}
+_DEFAULT_FOREGROUND = QColor("#000000")
+_BACKGROUNDS: Dict[str, QColor] = {}
+
+
+def _background(hex_color: str) -> QColor:
+    color = _BACKGROUNDS.get(hex_color)
+    if color is None:
+        color = _BACKGROUNDS[hex_color] = QColor(hex_color)
+    return color
+
+
+def _fingerprint(item: PipelineItem, pending: bool) -> Tuple:
+    # Everything a row's rendering depends on.
+    return (
+        item.candidate_name,
+        item.client,
+        item.role,
+        item.stage,
+        item.last_action,
+        item.next_check_at,
+        item.status,
+        item.archived,
+        pending,
+    )
+
+
+class _RowRender(NamedTuple):
+    display: Tuple[str, ...]
+    sort: Tuple[Any, ...]
+    priority_foreground: QColor
+    background: QColor
+    pending: bool
+
+
 class PipelineTableModel(QAbstractTableModel):
-    """Table model backing the pipeline QTableView."""
+    """
+    Table model backing the pipeline QTableView.
+
+    The model lives as long as the window; set_items() turns a new item
+    list into row inserts, removes and dataChanged for rows whose content
+    changed, so selection and scroll position survive a refresh.
+
+    Each row's strings, sort keys and colours are worked out once against
+    the model's EvaluationContext and cached until the row changes or the
+    day rolls over (set_context()), so data() is a lookup.
+    """
 
     COLUMNS = TABLE_COLUMNS
 
-    def __init__(self, items: List[PipelineItem]):
+    PENDING_MARK = "⏳ "
+
+    def __init__(
+        self,
+        items: List[PipelineItem],
+        pending_ids: Optional[Iterable[str]] = None,
+    ):
         super().__init__()
-        self.items = items
+        self.items = list(items)
+        # Rows with writes that have not reached the sheet yet
+        self.pending_ids = set(pending_ids or ())
+        self.pending_tooltip = "Saving..."
+        self._rows: Dict[str, int] = {}
+        self._prints: List[Tuple] = []
+        self._render: List[Optional[_RowRender]] = []
+        self.search_index = TrigramIndex()
+        self.columns = PipelineColumns()
+        self.context = evaluation_context()
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._rows = {item.id: n for n, item in enumerate(self.items)}
+        self._prints = [
+            _fingerprint(i, i.id in self.pending_ids) for i in self.items
+        ]
+        self._render = [None] * len(self.items)
+        self.search_index.clear()
+        self.columns.clear()
+        for item in self.items:
+            self.search_index.add(item)
+            self.columns.add(item)
+
+    def append_items(self, items: List[PipelineItem]) -> None:
+        """Add rows at the end (used while a load is still streaming)."""
+        items = [i for i in items if i.id not in self._rows]
+        if not items:
+            return
+        first = len(self.items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        for n, item in enumerate(items, start=first):
+            self.items.append(item)
+            self._rows[item.id] = n
+            self._prints.append(
+                _fingerprint(item, item.id in self.pending_ids)
+            )
+            self._render.append(None)
+            self.search_index.add(item)
+            self.columns.add(item)
+        self.endInsertRows()
+
+    def set_items(
+        self,
+        items: Iterable[PipelineItem],
+        pending_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Bring the rows in line with items, emitting only the deltas."""
+        if pending_ids is not None:
+            self.pending_ids = set(pending_ids)
+        new_items = {item.id: item for item in items}
+
+        # Removals, bottom-up in contiguous runs.
+        gone = sorted(
+            (n for n, i in enumerate(self.items) if i.id not in new_items),
+            reverse=True,
+        )
+        while gone:
+            last = first = gone.pop(0)
+            while gone and gone[0] == first - 1:
+                first = gone.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for item in self.items[first : last + 1]:
+                self.search_index.remove(item.id)
+                self.columns.remove(item.id)
+            del self.items[first : last + 1]
+            del self._prints[first : last + 1]
+            del self._render[first : last + 1]
+            self.endRemoveRows()
+        self._rows = {item.id: n for n, item in enumerate(self.items)}
+
+        # Changes in place.
+        last_col = len(self.COLUMNS) - 1
+        for n, old in enumerate(self.items):
+            item = new_items[old.id]
+            fp = _fingerprint(item, item.id in self.pending_ids)
+            if item is not old or fp != self._prints[n]:
+                self.items[n] = item
+                self._prints[n] = fp
+                self._render[n] = None
+                self.search_index.update(item)
+                self.columns.update(item)
+                self.dataChanged.emit(
+                    self.index(n, 0), self.index(n, last_col)
+                )
+
+        self.append_items(
+            [i for i in new_items.values() if i.id not in self._rows]
+        )
+
+    def set_context(self, ctx: EvaluationContext) -> bool:
+        """
+        Evaluate rows against ctx from now on. If its date differs from
+        the current one, every cached row is dropped (due-in days and
+        priorities move at midnight) and True is returned.
+        """
+        if ctx.today == self.context.today:
+            self.context = ctx
+            return False
+        self.context = ctx
+        self._render = [None] * len(self.items)
+        if self.items:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.items) - 1, len(self.COLUMNS) - 1),
+            )
+        return True
+
+    def item_at(self, row: int) -> Optional[PipelineItem]:
+        if 0 <= row < len(self.items):
+            return self.items[row]
+        return None
+
+    def sort_key(self, row: int, column: int):
+        """What data(SORT_ROLE) returns, without the QVariant round trip."""
+        render = self._render[row] or self._build_render(row)
+        return render.sort[column]
+
+    def haystack(self, row: int) -> str:
+        """Lowercased candidate/client/role text of a row, for search."""
+        return self.search_index.haystack(self.items[row].id)
+
+    def _build_render(self, row: int) -> _RowRender:
+        item = self.items[row]
+        pending = item.id in self.pending_ids
+        days = self.context.days_until(item)
+        tier = self.context.tier(item)
+        name = item.candidate_name
+        display = (
+            self.PENDING_MARK + name if pending else name,
+            item.client,
+            item.role,
+            item.stage,
+            item.last_action_label,
+            format_date_uk(item.next_check_at),
+            "" if days is None else str(days),
+            tier.label,
+        )
+        next_check = item.next_check_at
+        sort = (
+            name.lower(),
+            item.client.lower(),
+            item.role.lower(),
+            item.stage.lower(),
+            display[4].lower(),
+            next_check.toordinal() if next_check else _NO_DATE,
+            _NO_DATE if days is None else days,
+            _NO_DATE if days is None else days,
+        )
+        render = _RowRender(
+            display=display,
+            sort=sort,
+            priority_foreground=_PRIORITY_FOREGROUND.get(
+                tier.priority, _DEFAULT_FOREGROUND
+            ),
+            background=_background(tier.color),
+            pending=pending,
+        )
+        self._render[row] = render
+        return render
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.items)
@@ -38,39 +275,155 @@ class PipelineTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        item = self.items[index.row()]
+        row = index.row()
+        render = self._render[row] or self._build_render(row)
         col = index.column()
 
         if role == Qt.DisplayRole:
-            if col == 0:
-                return item.candidate_name
-            if col == 1:
-                return item.client
-            if col == 2:
-                return item.role
-            if col == 3:
-                return item.stage
-            if col == 4:
-                return item.last_action_label
-            if col == 5:
-                return format_date_uk(item.next_check_at)
-            if col == 6:
-                days = item.days_until_next_check
-                return "" if days is None else str(days)
-            if col == 7:
-                return item.priority_label
-
+            return render.display[col]
         if role == Qt.ForegroundRole:
             if col == 7:
-                if item.priority == "green":
-                    return QColor("#22863a")
-                if item.priority == "yellow":
-                    return QColor("#b08800")
-                if item.priority == "red":
-                    return QColor("#d73a49")
-            return QColor("#000000")
-
+                return render.priority_foreground
+            return _DEFAULT_FOREGROUND
         if role == Qt.BackgroundRole:
-            return QColor(item.priority_color)
+            return render.background
+        if role == SORT_ROLE:
+            return render.sort[col]
+        if role == Qt.ToolTipRole and render.pending:
+            return self.pending_tooltip
 
         return None
+
+
+class PipelineFilterProxy(QSortFilterProxyModel):
+    """
+    Visible-now / overdue / search filter in front of PipelineTableModel.
+    Changing the filter only hides or shows rows; the source model and
+    its rows stay untouched.
+
+    A new query is resolved up front against the model's trigram index;
+    when it extends the previous query ("ann" -> "anna") only the
+    previous matches are re-checked (except on reaching three characters,
+    where the index is cheaper). The filter pass itself is then a set
+    lookup per row. While searching, name matches sort above client and
+    role matches.
+
+    Visibility and the overdue view likewise come from one vectorized
+    mask over the model's PipelineColumns, rebuilt by refilter(); rows
+    changed after that are checked one by one.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self.view_mode = "my"  # "my" or "overdue"
+        self.query = ""
+        self._matches: Set[str] = set()
+        self._ranks: Dict[str, int] = {}  # id -> field rank, filled lazily
+        self._resolved = False  # True while _matches is known to be exact
+        self._mask: Optional[np.ndarray] = None
+        self._mask_key: Optional[Tuple] = None
+
+    def set_view_mode(self, mode: str) -> None:
+        if mode != self.view_mode:
+            self.view_mode = mode
+            self.refilter()
+
+    def refilter(self) -> None:
+        """Re-run the filter over every row (view mode or day changed)."""
+        self._update_mask()
+        self.invalidateRowsFilter()
+
+    def _update_mask(self) -> None:
+        model = self.sourceModel()
+        columns, ctx = model.columns, model.context
+        key = (columns.version, ctx.today, self.view_mode)
+        if key == self._mask_key:
+            return
+        if self.view_mode == "overdue":
+            mask = columns.visible_mask(ctx) & columns.overdue_mask(ctx)
+        else:
+            mask = columns.visible_mask(ctx)
+        self._mask, self._mask_key = mask, key
+
+    def set_query(self, query: str) -> None:
+        query = query.strip().lower()
+        if query == self.query:
+            return
+        index = self.sourceModel().search_index
+        narrows = bool(self.query) and self.query in query
+        if narrows and (
+            len(query) < MIN_GRAM_QUERY or len(self.query) >= MIN_GRAM_QUERY
+        ):
+            # Re-check the last query's hits only.
+            matches = {i for i in self._matches if query in index.haystack(i)}
+        else:
+            # New, or the first query long enough for the trigram index
+            # (cheaper than re-checking every hit of a 1-2 letter query).
+            matches = index.search(query)
+        self.query = query
+        self._matches = matches
+        self._ranks = {}
+        self._resolved = True
+        self._update_mask()
+        # One filter pass plus a sort: lessThan ranks by the query, so
+        # invalidateRowsFilter() alone would leave rows in the old order.
+        self.invalidate()
+        self._resolved = False
+
+    def _query_matches(self, source_row: int, item: PipelineItem) -> bool:
+        if not self.query:
+            return True
+        if self._resolved:
+            return item.id in self._matches
+        # Rows added or edited since the query was set are checked here,
+        # keeping the match set current.
+        index = self.sourceModel().search_index
+        self._ranks.pop(item.id, None)
+        if self.query not in index.haystack(item.id):
+            self._matches.discard(item.id)
+            return False
+        self._matches.add(item.id)
+        return True
+
+    def _rank(self, item_id: str) -> int:
+        rank = self._ranks.get(item_id)
+        if rank is None:
+            index = self.sourceModel().search_index
+            rank = index.rank(item_id, self.query)
+            rank = self._ranks[item_id] = 9 if rank is None else rank
+        return rank
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        item = model.item_at(source_row)
+        if item is None:
+            return False
+        if not self._query_matches(source_row, item):
+            return False
+        columns, ctx = model.columns, model.context
+        if self._mask_key == (columns.version, ctx.today, self.view_mode):
+            return bool(self._mask[columns.slot(item.id)])
+        # Row changed since the mask was built.
+        if not ctx.is_visible(item):
+            return False
+        if self.view_mode == "overdue" and ctx.priority(item) != "red":
+            return False
+        return True
+
+    def lessThan(self, left, right):
+        if self.query:
+            model = self.sourceModel()
+            left_rank = self._rank(model.item_at(left.row()).id)
+            right_rank = self._rank(model.item_at(right.row()).id)
+            if left_rank != right_rank:
+                # Keep best matches on top whichever way the column sorts.
+                if self.sortOrder() == Qt.DescendingOrder:
+                    return left_rank > right_rank
+                return left_rank < right_rank
+        # Straight to the cached sort keys: a sort makes n log n calls.
+        model = self.sourceModel()
+        column = left.column()
+        return model.sort_key(left.row(), column) < model.sort_key(
+            right.row(), column
+        )
@@ -0,0 +1,120 @@
+"""Syncing the local mirror from the fake spreadsheet."""
+
+import pytest
+
+import data_loader
+from benchmarks.generator import make_sheet
+from domain import SHEET_COLUMNS, RowParser, filter_active
+from fake_sheets import FakeSheetsRepository
+from local_mirror import LocalMirror
+from repository import WriteQueue
+from sheets_repo import PIPELINE_TAB_NAME
+
+
+@pytest.fixture
+def backend(monkeypatch, tmp_path):
+    """(fake repository, mirror), patched into data_loader."""
+    repo = FakeSheetsRepository(rows=60, latency_ms=0, quota_error_rate=0)
+    mirror = LocalMirror(str(tmp_path / "mirror.sqlite3"))
+    queue = WriteQueue(repo)
+    monkeypatch.setattr(data_loader, "get_repository", lambda: repo)
+    monkeypatch.setattr(data_loader, "get_mirror", lambda: mirror)
+    monkeypatch.setattr(data_loader, "get_write_queue", lambda: queue)
+    return repo, mirror
+
+
+def mirrored(mirror, row_id, column):
+    rows = {r[0]: r for r in mirror.values()}
+    return rows[row_id][SHEET_COLUMNS.index(column)]
+
+
+def test_full_sync_picks_up_hand_edits_the_delta_misses(backend):
+    repo, mirror = backend
+    data_loader.sync_mirror()
+    grid = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME).grid
+    stage = grid[0].index("stage")
+    row_id = grid[5][0]
+    # Typed into the sheet by hand: updated_at stays as it was.
+    grid[5][stage] = "moved on"
+
+    data_loader.sync_mirror(full=False)
+    assert mirrored(mirror, row_id, "stage") != "moved on"
+
+    data_loader.sync_mirror(full=True)
+    assert mirrored(mirror, row_id, "stage") == "moved on"
+
+
+def test_sync_prunes_rows_deleted_from_the_sheet(backend):
+    repo, mirror = backend
+    data_loader.sync_mirror()
+    grid = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME).grid
+    row_id = grid.pop(7)[0]
+
+    data_loader.sync_mirror(full=True)
+    assert row_id not in mirror.ids()
+    assert len(mirror.ids()) == len(grid) - 1
+
+
+# ---- RowFilter ----
+
+FILTERS = [
+    data_loader.RowFilter(),
+    data_loader.RowFilter.for_owner("Aylin"),
+    data_loader.RowFilter(
+        owners=frozenset({"Kerem", "Deniz"}),
+        statuses=frozenset({"DONE", "ACTIVE"}),
+        include_archived=True,
+    ),
+    data_loader.RowFilter(owners=None, statuses=None, include_archived=True),
+]
+
+
+def keeps(row_filter, item):
+    """RowFilter's rule, on a parsed item."""
+    return (
+        (row_filter.owners is None or item.owner in row_filter.owners)
+        and (row_filter.statuses is None or item.status in row_filter.statuses)
+        and (row_filter.include_archived or not item.archived)
+    )
+
+
+@pytest.fixture
+def sheet():
+    header, rows = make_sheet(1000)
+    rows[3][0] = ""  # a row without an id is never loaded
+    rows[4][header.index("status")] = ""  # parses as ACTIVE
+    rows[5][header.index("archived")] = " true "
+    return header, rows
+
+
+@pytest.mark.parametrize("row_filter", FILTERS)
+def test_row_filter_matches_filtering_parsed_items(sheet, row_filter):
+    header, rows = sheet
+    items = [i for i in RowParser(header).parse_all(rows) if i.id]
+    expected = [i for i in items if keeps(row_filter, i)]
+
+    assert row_filter.select(header, rows) == expected
+    # Column order comes from the header.
+    order = list(reversed(header))
+    flipped = [list(reversed(r)) for r in rows]
+    assert row_filter.select(order, flipped) == expected
+
+
+def test_default_filter_is_filter_active(sheet):
+    header, rows = sheet
+    items = [i for i in RowParser(header).parse_all(rows) if i.id]
+    selected = data_loader.RowFilter().select(header, rows)
+    assert selected == filter_active(items)
+
+
+@pytest.mark.parametrize("row_filter", FILTERS)
+def test_load_items_from_the_mirror(backend, row_filter):
+    repo, mirror = backend
+    data_loader.sync_mirror()
+    grid = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME).grid
+    items = RowParser(grid[0]).parse_all(grid[1:])
+    expected = {i.id for i in items if keeps(row_filter, i)}
+
+    loaded = data_loader.load_items(row_filter)
+
+    assert {i.id for i in loaded} == expected
@@ -0,0 +1,103 @@
+"""Sheet rows to PipelineItems and back."""
+
+from datetime import date, datetime
+
+from benchmarks.generator import make_sheet
+from domain import (
+    SHEET_COLUMNS,
+    PipelineItem,
+    RowParser,
+    pipeline_item_from_sheet,
+    pipeline_item_to_sheet,
+)
+
+
+def _item(notes):
+    now = datetime(2026, 10, 16, 9, 30)
+    return PipelineItem(
+        "id-1",
+        "Kerem",
+        "Ann Lee",
+        "Acme",
+        "Developer",
+        "sent",
+        date(2026, 10, 1),
+        "SPOKE",
+        date(2026, 10, 15),
+        date(2026, 10, 20),
+        "ACTIVE",
+        notes,
+        now,
+        now,
+        False,
+    )
+
+
+def test_unloaded_notes_stay_unloaded():
+    # Journal bases are written without the lazy notes column.
+    row = pipeline_item_to_sheet(_item(None))
+    assert "notes" not in row
+    assert pipeline_item_from_sheet(row).notes is None
+
+
+def test_round_trip():
+    item = _item(None)
+    back = pipeline_item_from_sheet(pipeline_item_to_sheet(item))
+    assert pipeline_item_to_sheet(back) == pipeline_item_to_sheet(item)
+
+
+def test_notes_cell_is_kept():
+    row = pipeline_item_to_sheet(_item(None))
+    assert pipeline_item_from_sheet(dict(row, notes="")).notes == ""
+    assert pipeline_item_from_sheet(dict(row, notes="hi")).notes == "hi"
+
+
+def test_slots_follow_sheet_columns():
+    # RowParser builds items positionally from SHEET_COLUMNS.
+    assert tuple(PipelineItem.__slots__) == tuple(SHEET_COLUMNS)
+
+
+def _parse_both(header, rows):
+    fast = RowParser(header).parse_all(rows)
+    slow = [pipeline_item_from_sheet(dict(zip(header, r))) for r in rows]
+    return fast, slow
+
+
+def test_row_parser_matches_dict_parser():
+    header, rows = make_sheet(500)
+    fast, slow = _parse_both(header, rows)
+    assert fast == slow
+
+
+def test_row_parser_matches_on_odd_cells():
+    header = list(reversed(SHEET_COLUMNS))
+    stamp = "2026-10-16T09:30:00+02:00"
+    cells = {
+        "id": "id-1",
+        "owner": "Kerem",
+        "sent_at": "not a date",
+        "last_action": "",
+        "next_check_at": " 2026-10-20 ",
+        "status": "",
+        "notes": None,  # lazy column, not downloaded
+        "created_at": stamp,
+        "updated_at": "2026-10-16 09:30:00",
+        "archived": " yes ",
+    }
+    row = [cells.get(c, "") for c in header]
+    fast, slow = _parse_both(header, [row])
+    assert fast == slow
+    assert fast[0].status == "ACTIVE"
+    assert fast[0].notes is None
+    assert fast[0].archived
+
+
+def test_row_parser_pads_short_rows():
+    # get_values drops trailing empty cells.
+    header = list(SHEET_COLUMNS)
+    stamp = "2026-10-16T09:30:00"
+    row = ["id-1", "Kerem", "Ann Lee"] + [""] * 9 + [stamp, stamp]
+    fast = RowParser(header).parse(row)
+    slow = pipeline_item_from_sheet(dict(zip(header, row)))
+    assert fast == slow
+    assert not fast.archived
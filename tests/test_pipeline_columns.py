@@ -0,0 +1,91 @@
+"""PipelineColumns masks and KPIs against the per-item list functions."""
+
+import copy
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.generator import OWNERS, TODAY, make_items
+from data_loader import kpi_counts
+from domain import EvaluationContext, filter_visible
+from pipeline_columns import PipelineColumns
+
+DAYS = [TODAY + timedelta(days=d) for d in (-20, -1, 0, 1, 20)]
+
+
+@pytest.fixture
+def items():
+    return make_items(2000)
+
+
+def columns_of(items):
+    columns = PipelineColumns(capacity=16)  # grows a few times
+    for item in items:
+        columns.add(item)
+    return columns
+
+
+def picked(columns, mask, items):
+    return {i.id for i in items if mask[columns.slot(i.id)]}
+
+
+def check_parity(columns, items):
+    for today in DAYS:
+        ctx = EvaluationContext(today)
+        assert picked(columns, columns.visible_mask(ctx), items) == {
+            i.id for i in filter_visible(items, ctx)
+        }
+        assert picked(columns, columns.overdue_mask(ctx), items) == {
+            i.id for i in items if ctx.priority(i) == "red"
+        }
+        for name, mask in zip(
+            ("green", "yellow", "red"), columns.priority_masks(ctx)
+        ):
+            assert picked(columns, mask, items) == {
+                i.id for i in items if ctx.priority(i) == name
+            }
+        assert columns.kpi_counts(ctx) == kpi_counts(items, ctx)
+        for owner, _ in OWNERS + (("Nobody", 0),):
+            mine = [i for i in items if i.owner == owner]
+            assert columns.kpi_counts(ctx, owner) == kpi_counts(mine, ctx)
+
+
+def test_masks_match_list_functions(items):
+    check_parity(columns_of(items), items)
+
+
+def test_masks_follow_updates_and_removals(items):
+    columns = columns_of(items)
+    version = columns.version
+    for n in range(0, len(items), 7):
+        item = copy.copy(items[n])
+        item.status = {"ACTIVE": "SNOOZED", "SNOOZED": "DONE"}.get(
+            item.status, "ACTIVE"
+        )
+        item.next_check_at = None if item.next_check_at else TODAY
+        item.archived = not item.archived
+        columns.update(item)
+        items[n] = item
+    for item in items[::5]:
+        columns.remove(item.id)
+    items = [i for n, i in enumerate(items) if n % 5]
+    # New items reuse the freed slots.
+    size = columns._size
+    new = make_items(300, seed=2)
+    for item in new:
+        columns.add(item)
+    items += new
+
+    assert columns._size == size
+    assert columns.version > version
+    check_parity(columns, items)
+
+
+def test_clear(items):
+    columns = columns_of(items)
+    columns.clear()
+    assert columns.kpi_counts(EvaluationContext(TODAY)) == (0, 0, 0, 0)
+    fresh = items[:100]
+    for item in fresh:
+        columns.add(item)
+    check_parity(columns, fresh)
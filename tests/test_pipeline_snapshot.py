@@ -0,0 +1,86 @@
+"""Round trip and rejection of pipeline_snapshot files."""
+
+import copy
+from datetime import date
+
+import pytest
+
+from benchmarks.generator import make_sheet
+from domain import RowParser, pipeline_item_to_sheet
+import pipeline_snapshot
+from pipeline_snapshot import read_snapshot, write_snapshot
+
+
+@pytest.fixture
+def items():
+    header, rows = make_sheet(500, seed=7, today=date(2026, 10, 16))
+    items = RowParser(header).parse_all(rows)
+    for item in items:
+        item.notes = None  # a snapshot never holds notes
+    return items
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "snapshot.bin")
+
+
+def test_round_trip(items, path):
+    write_snapshot(items, "Kerem", "fake", 1_760_000_000.5, path)
+    snapshot = read_snapshot("Kerem", "fake", path)
+
+    assert snapshot is not None
+    assert snapshot.synced_at == 1_760_000_000.5
+    assert [pipeline_item_to_sheet(i) for i in snapshot.items] == [
+        pipeline_item_to_sheet(i) for i in items
+    ]
+    assert [i.updated_at for i in snapshot.items] == [
+        i.updated_at for i in items
+    ]
+
+
+def test_many_distinct_categories(items, path):
+    many = [copy.copy(items[n % len(items)]) for n in range(70_000)]
+    for n, item in enumerate(many):
+        item.client = f"Client {n}"
+    write_snapshot(many, "Kerem", "fake", None, path)
+    snapshot = read_snapshot("Kerem", "fake", path)
+
+    assert snapshot is not None and snapshot.synced_at is None
+    assert [i.client for i in snapshot.items] == [i.client for i in many]
+
+
+def test_empty(path):
+    write_snapshot([], "Kerem", "fake", None, path)
+    assert read_snapshot("Kerem", "fake", path).items == []
+
+
+@pytest.mark.parametrize(
+    "owner,backend", [("Aylin", "fake"), ("Kerem", "sheets")]
+)
+def test_other_owner_or_backend_is_ignored(items, path, owner, backend):
+    write_snapshot(items, "Kerem", "fake", None, path)
+    assert read_snapshot(owner, backend, path) is None
+
+
+def test_other_schema_version_is_ignored(items, path, monkeypatch):
+    monkeypatch.setattr(pipeline_snapshot, "SCHEMA_VERSION", 1)
+    write_snapshot(items, "Kerem", "fake", None, path)
+    monkeypatch.undo()
+    assert read_snapshot("Kerem", "fake", path) is None
+
+
+def test_damaged_file_is_ignored(items, path):
+    write_snapshot(items, "Kerem", "fake", None, path)
+    with open(path, "r+b") as f:
+        f.seek(-10, 2)
+        f.write(b"\xff" * 4)
+    assert read_snapshot("Kerem", "fake", path) is None
+
+    with open(path, "r+b") as f:
+        f.truncate(20)
+    assert read_snapshot("Kerem", "fake", path) is None
+
+
+def test_missing_file(path):
+    assert read_snapshot("Kerem", "fake", path) is None
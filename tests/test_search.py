@@ -0,0 +1,146 @@
+"""TrigramIndex and the search side of PipelineFilterProxy."""
+
+import copy
+from datetime import date, datetime
+
+import pytest
+
+from benchmarks.generator import make_sheet
+from domain import PipelineItem, RowParser
+from search_index import TrigramIndex
+
+QUERIES = ("a", "an", "ann", "anna", "smith", "acme ltd", "h a", "zzq")
+
+
+@pytest.fixture
+def items():
+    header, rows = make_sheet(300, seed=5, today=date(2026, 10, 16))
+    return RowParser(header).parse_all(rows)
+
+
+def scan(items, query):
+    return {
+        i.id
+        for i in items
+        if query in f"{i.candidate_name} {i.client} {i.role}".lower()
+    }
+
+
+def indexed(items):
+    index = TrigramIndex()
+    for item in items:
+        index.add(item)
+    return index
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_search_matches_a_scan(items, query):
+    assert indexed(items).search(query) == scan(items, query)
+
+
+def test_updates_and_removals_are_indexed(items):
+    index = indexed(items)
+    renamed = copy.copy(items[0])
+    renamed.candidate_name = "Zzqx Newname"
+    index.update(renamed)
+    index.remove(items[1].id)
+    current = [renamed] + items[2:]
+
+    for query in QUERIES + ("zzqx", "newname"):
+        assert index.search(query) == scan(current, query)
+
+
+def test_rank_prefers_name_over_client_over_role(items):
+    index = indexed(items)
+    item = copy.copy(items[0])
+    item.candidate_name, item.client, item.role = "Ann Lee", "Annex", "Dev"
+    index.update(item)
+
+    assert index.rank(item.id, "ann") == 0
+    assert index.rank(item.id, "annex") == 1
+    assert index.rank(item.id, "dev") == 2
+    assert index.rank(item.id, "lee annex") == 3
+    assert index.rank(item.id, "zzq") is None
+
+
+def _item(n, name, client):
+    now = datetime(2026, 10, 16)
+    return PipelineItem(
+        str(n),
+        "Kerem",
+        name,
+        client,
+        "Developer",
+        "sent",
+        None,
+        None,
+        None,
+        date.today(),
+        "ACTIVE",
+        None,
+        now,
+        now,
+        False,
+    )
+
+
+@pytest.fixture
+def proxy(qapp):
+    from table_model import PipelineFilterProxy, PipelineTableModel
+
+    model = PipelineTableModel(
+        [
+            _item(1, "Bob", "Annex"),
+            _item(2, "Carl", "Hanna"),
+            _item(3, "Zed Anna", "Initech"),
+            _item(4, "Ann", "Globex"),
+        ]
+    )
+    proxy = PipelineFilterProxy()
+    proxy.setSourceModel(model)
+    proxy.sort(0)
+    proxy.model = model  # keep the source alive
+    return proxy
+
+
+def names(proxy):
+    return [proxy.index(r, 0).data() for r in range(proxy.rowCount())]
+
+
+def test_query_ranks_name_matches_first(proxy):
+    proxy.set_query("ann")
+    assert names(proxy) == ["Ann", "Zed Anna", "Bob", "Carl"]
+    proxy.set_query("")
+    assert names(proxy) == ["Ann", "Bob", "Carl", "Zed Anna"]
+
+
+def test_extending_query_rechecks_previous_matches_only(proxy, monkeypatch):
+    index = proxy.model.search_index
+    proxy.set_query("ann")
+    searched = []
+    monkeypatch.setattr(index, "search", lambda q: searched.append(q))
+
+    proxy.set_query("anna")
+
+    assert searched == []
+    assert names(proxy) == ["Zed Anna", "Carl"]
+
+
+def test_query_change_filters_each_row_once(qapp):
+    from table_model import PipelineFilterProxy, PipelineTableModel
+
+    class CountingProxy(PipelineFilterProxy):
+        def filterAcceptsRow(self, row, parent):
+            calls.append(row)
+            return super().filterAcceptsRow(row, parent)
+
+    calls = []
+    model = PipelineTableModel([_item(n, f"Ann {n}", "X") for n in range(4)])
+    proxy = CountingProxy()
+    proxy.setSourceModel(model)
+    proxy.sort(0)
+    calls.clear()
+
+    proxy.set_query("ann")
+    assert proxy.rowCount() == 4
+    assert sorted(calls) == [0, 1, 2, 3]
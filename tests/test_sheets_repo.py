@@ -0,0 +1,153 @@
+"""SheetsRepository reads and writes over the fake spreadsheet."""
+
+import contextlib
+
+import pytest
+
+from fake_sheets import FakeSheetsRepository
+from sheets_repo import MAX_RANGES_PER_GET, PIPELINE_TAB_NAME, RowIndex
+
+
+@pytest.fixture
+def repo():
+    return FakeSheetsRepository(rows=299, latency_ms=0, quota_error_rate=0)
+
+
+def grid(repo):
+    return repo.spreadsheet.worksheet(PIPELINE_TAB_NAME).grid
+
+
+def blank_row(repo, row_num):
+    row = grid(repo)[row_num - 1]
+    row[:] = [""] * len(row)
+
+
+@pytest.mark.parametrize("blank", [101, 100, 102])
+def test_iter_pages_reads_past_a_blank_row_at_a_page_end(repo, blank):
+    blank_row(repo, blank)  # rows 2..101 are the first page
+    expected = [r[0] for r in grid(repo)[1:] if r[0]]
+
+    pages = list(repo.iter_pages(page_size=100))
+    ids = [r[0] for page in pages for r in page if r[0]]
+
+    assert ids == expected
+    rows = repo.session.index.rows
+    assert all(grid(repo)[rows[i] - 1][0] == i for i in expected)
+    assert repo.session.index.last_row == len(grid(repo))
+
+
+def test_write_after_paged_load_hits_the_right_row(repo):
+    blank_row(repo, 101)
+    list(repo.iter_pages(page_size=100))
+    header = grid(repo)[0]
+    before = [list(r) for r in grid(repo)]
+    target = grid(repo)[250]
+    row = dict(zip(header, target), stage="moved on")
+
+    missing, conflicted = repo.write_updates({target[0]: row}, {})
+
+    assert (missing, conflicted) == ([], [])
+    before[250][header.index("stage")] = "moved on"
+    assert grid(repo) == before
+
+
+def test_update_checks_are_chunked(repo, monkeypatch):
+    worksheet = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME)
+    sizes = []
+    batch_get = worksheet.batch_get
+
+    def counting_batch_get(ranges, **kwargs):
+        sizes.append(len(ranges))
+        return batch_get(ranges, **kwargs)
+
+    monkeypatch.setattr(worksheet, "batch_get", counting_batch_get)
+    header = grid(repo)[0]
+    rows = {r[0]: dict(zip(header, r)) for r in grid(repo)[1:251]}
+    updates = {i: dict(r, stage="moved on") for i, r in rows.items()}
+
+    missing, conflicted = repo.write_updates(updates, rows)
+
+    assert (missing, conflicted) == ([], [])
+    assert sizes and max(sizes) <= MAX_RANGES_PER_GET
+    assert sum(sizes) == 2 * len(rows)  # id and updated_at per row
+    stage = header.index("stage")
+    assert all(r[stage] == "moved on" for r in grid(repo)[1:251])
+
+
+# ---- RowIndex ----
+
+
+@pytest.fixture
+def rebuilds(repo, monkeypatch):
+    """Count the id-column reads (index rebuilds) of the pipeline tab."""
+    worksheet = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME)
+    count = [0]
+    col_values = worksheet.col_values
+
+    def counting_col_values(col):
+        count[0] += 1
+        return col_values(col)
+
+    monkeypatch.setattr(worksheet, "col_values", counting_col_values)
+    return count
+
+
+def check_index(repo):
+    index = repo.session.index
+    ids = [r[0] for r in grid(repo)[1:]]
+    assert index.rows == {i: n for n, i in enumerate(ids, start=2) if i}
+    assert index.last_row == len(grid(repo))
+
+
+def test_row_index_load_skips_blank_ids():
+    index = RowIndex(lambda name: contextlib.nullcontext())
+    index.load(["a", "", "b", "a", ""])
+    assert index.rows == {"a": 2, "b": 4}
+    assert index.last_row == 5
+
+
+def test_locate_many_reuses_the_index(repo, rebuilds):
+    worksheet = repo.session.worksheet()
+    index = repo.session.index
+    ids = [r[0] for r in grid(repo)[1:]]
+
+    found, missing = index.locate_many(worksheet, [ids[0], "nope"])
+    assert found == {ids[0]: 2} and missing == ["nope"]
+    found, missing = index.locate_many(worksheet, [ids[10], ids[200]])
+
+    assert found == {ids[10]: 12, ids[200]: 202} and missing == []
+    # One build, then one more for the unknown id; none for known ones.
+    assert rebuilds[0] == 2
+
+
+def test_locate_many_rebuilds_when_rows_move(repo, rebuilds):
+    worksheet = repo.session.worksheet()
+    index = repo.session.index
+    target = grid(repo)[50][0]
+    index.locate_many(worksheet, [target])
+    # Someone inserts a row by hand above the target.
+    grid(repo).insert(1, ["by-hand"] + [""] * (len(grid(repo)[0]) - 1))
+
+    found, missing = index.locate_many(worksheet, [target])
+
+    assert found == {target: 52} and missing == []
+    assert rebuilds[0] == 2
+    check_index(repo)
+
+
+def test_appends_and_deletes_keep_the_index_in_step(repo, rebuilds):
+    header = grid(repo)[0]
+    list(repo.iter_pages(page_size=100))
+    new = {
+        f"new-{n}": dict(zip(header, grid(repo)[1]), id=f"new-{n}")
+        for n in range(3)
+    }
+
+    repo.write_appends(new)
+    check_index(repo)
+    gone = [grid(repo)[n][0] for n in (5, 6, 120, 300)]
+    assert repo.write_deletes(gone + ["nope"]) == ["nope"]
+
+    check_index(repo)
+    assert not set(gone) & {r[0] for r in grid(repo)}
+    assert rebuilds[0] == 1  # only for the id that is not there
@@ -0,0 +1,156 @@
+"""PipelineTableModel: id-keyed deltas and cached row rendering."""
+
+import copy
+from datetime import date, timedelta
+
+import pytest
+from PySide6.QtCore import Qt
+
+from benchmarks.generator import make_sheet
+from domain import EvaluationContext, RowParser
+from table_model import SORT_ROLE, PipelineTableModel
+
+TODAY = date(2026, 10, 16)
+ROLES = (Qt.DisplayRole, Qt.BackgroundRole, SORT_ROLE, Qt.ToolTipRole)
+
+
+@pytest.fixture
+def items():
+    header, rows = make_sheet(50, seed=3, today=TODAY)
+    return RowParser(header).parse_all(rows)
+
+
+def make_model(items, pending_ids=()):
+    model = PipelineTableModel(items, pending_ids)
+    model.set_context(EvaluationContext(TODAY))
+    return model
+
+
+def cells(model):
+    return [
+        [
+            model.data(model.index(row, col), role)
+            for col in range(model.columnCount())
+            for role in ROLES
+        ]
+        for row in range(model.rowCount())
+    ]
+
+
+class Signals:
+    """Row inserts, removes and changed rows a model emits."""
+
+    def __init__(self, model):
+        self.inserted, self.removed, self.changed = [], [], set()
+        model.rowsInserted.connect(
+            lambda _, first, last: self.inserted.append((first, last))
+        )
+        model.rowsRemoved.connect(
+            lambda _, first, last: self.removed.append((first, last))
+        )
+        model.dataChanged.connect(self._on_changed)
+
+    def _on_changed(self, top_left, bottom_right, roles=()):
+        self.changed.update(range(top_left.row(), bottom_right.row() + 1))
+
+
+def test_set_items_emits_only_the_deltas(qapp, items):
+    model = make_model(items)
+    cells(model)  # fill the render cache
+    signals = Signals(model)
+
+    moved = copy.copy(items[10])
+    moved.stage = "moved on"
+    new = copy.copy(items[0])
+    new.id, new.candidate_name = "new-1", "Zed New"
+    kept = [i for n, i in enumerate(items) if n not in (3, 4, 5, 20)]
+    update = [moved if i.id == moved.id else i for i in kept] + [new]
+
+    model.set_items(reversed(update))
+
+    assert signals.removed == [(20, 20), (3, 5)]
+    assert signals.inserted == [(len(kept), len(kept))]
+    # Row 10 is row 7 once rows 3-5 are gone.
+    assert signals.changed == {7}
+    assert [i.id for i in model.items] == [i.id for i in update]
+    assert cells(model) == cells(make_model(update))
+
+
+def test_set_items_keeps_search_and_columns_in_step(qapp, items):
+    model = make_model(items)
+    renamed = copy.copy(items[1])
+    renamed.candidate_name = "Zzqx Renamed"
+    update = [renamed] + items[2:]
+
+    model.set_items(update)
+
+    assert model.search_index.search("zzqx") == {renamed.id}
+    assert model.search_index.search(items[0].candidate_name.lower()) == {
+        i.id
+        for i in update
+        if items[0].candidate_name.lower() in i.candidate_name.lower()
+    }
+    fresh = make_model(update)
+    assert model.columns.kpi_counts(model.context) == (
+        fresh.columns.kpi_counts(fresh.context)
+    )
+
+
+def test_append_items_skips_known_rows(qapp, items):
+    model = make_model(items[:30])
+    signals = Signals(model)
+
+    model.append_items(items[20:])
+
+    assert signals.inserted == [(30, len(items) - 1)]
+    assert [i.id for i in model.items] == [i.id for i in items]
+
+
+# ---- Render cache ----
+
+
+def test_rows_render_once(qapp, items, monkeypatch):
+    model = make_model(items)
+    built = []
+    build = model._build_render
+    monkeypatch.setattr(
+        model, "_build_render", lambda row: built.append(row) or build(row)
+    )
+
+    cells(model)
+    cells(model)
+
+    assert sorted(built) == list(range(len(items)))
+
+
+def test_changed_rows_render_again(qapp, items):
+    model = make_model(items)
+    cells(model)
+    moved = copy.copy(items[4])
+    moved.stage = "moved on"
+    update = [moved if i is items[4] else i for i in items]
+
+    model.set_items(update, pending_ids=[items[9].id])
+
+    assert model.data(model.index(4, 3)) == "moved on"
+    name = model.data(model.index(9, 0))
+    assert name == model.PENDING_MARK + items[9].candidate_name
+    assert model.data(model.index(9, 0), Qt.ToolTipRole)
+    assert model.data(model.index(8, 0), Qt.ToolTipRole) is None
+    assert cells(model) == cells(make_model(update, [items[9].id]))
+
+
+def test_new_day_drops_the_cache(qapp, items):
+    model = make_model(items)
+    before = cells(model)
+    signals = Signals(model)
+
+    assert not model.set_context(EvaluationContext(TODAY))
+    assert cells(model) == before and not signals.changed
+
+    tomorrow = TODAY + timedelta(days=1)
+    assert model.set_context(EvaluationContext(tomorrow))
+    assert signals.changed == set(range(len(items)))
+    fresh = PipelineTableModel(items)
+    fresh.set_context(EvaluationContext(tomorrow))
+    assert cells(model) == cells(fresh) != before
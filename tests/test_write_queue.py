@@ -0,0 +1,161 @@
+"""
+WriteQueue and WriteJournal against the fake Sheets backend: failed
+flushes, replay after a crash, and updated_at conflicts.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from domain import NoteEntry
+from fake_sheets import FakeSheetsRepository
+from repository import FlushError, WriteQueue
+from sheets_repo import PIPELINE_TAB_NAME
+from write_journal import WriteJournal
+
+STAMP = "2026-10-16T10:00:00"
+
+
+@pytest.fixture
+def repo():
+    return FakeSheetsRepository(rows=50, latency_ms=0, quota_error_rate=0)
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "journal.sqlite3")
+
+
+def sheet_rows(repo):
+    """The pipeline tab as {id: {column: cell}}."""
+    grid = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME).get_values()
+    header = grid[0]
+    return {
+        row[0]: dict(zip(header, row + [""] * (len(header) - len(row))))
+        for row in grid[1:]
+    }
+
+
+def first_row(repo):
+    row = next(iter(sheet_rows(repo).values()))
+    row.pop("notes")  # list loads leave the lazy column out
+    return row
+
+
+def set_cell(repo, row_id, column, value):
+    worksheet = repo.spreadsheet.worksheet(PIPELINE_TAB_NAME)
+    grid = worksheet.grid
+    grid[[r[0] for r in grid].index(row_id)][grid[0].index(column)] = value
+
+
+def new_row(row_id):
+    return {
+        "id": row_id,
+        "owner": "Kerem",
+        "candidate_name": "New Candidate",
+        "client": "Acme",
+        "role": "Developer",
+        "stage": "sent",
+        "status": "ACTIVE",
+        "updated_at": STAMP,
+    }
+
+
+def test_flush_writes_only_changed_cells(repo, journal_path):
+    base = first_row(repo)
+    queue = WriteQueue(repo, WriteJournal(journal_path))
+    queue.update(base["id"], dict(base, stage="offer", updated_at=STAMP), base)
+
+    assert queue.flush() == {base["id"]}
+    stored = sheet_rows(repo)[base["id"]]
+    assert (stored["stage"], stored["updated_at"]) == ("offer", STAMP)
+    assert stored["candidate_name"] == base["candidate_name"]
+    assert len(WriteJournal(journal_path).records()) == 0
+
+
+def test_failed_flush_keeps_writes_queued_and_journaled(repo, journal_path):
+    base = first_row(repo)
+    queue = WriteQueue(repo, WriteJournal(journal_path))
+    queue.update(base["id"], dict(base, stage="offer", updated_at=STAMP), base)
+    queue.append(new_row("new-1"))
+
+    repo.spreadsheet.quota_error_rate = 1.0
+    with pytest.raises(FlushError) as failure:
+        queue.flush()
+    assert repo.is_transient(failure.value.cause)
+    assert failure.value.failed_ids == {base["id"], "new-1"}
+    assert queue.pending_ids() == {base["id"], "new-1"}
+    assert len(WriteJournal(journal_path).records()) == 2
+
+    repo.spreadsheet.quota_error_rate = 0.0
+    queue.flush()
+    rows = sheet_rows(repo)
+    assert rows[base["id"]]["stage"] == "offer"
+    assert "new-1" in rows
+    assert not queue.pending_ids()
+    assert len(WriteJournal(journal_path).records()) == 0
+
+
+def test_replay_after_crash_does_not_duplicate(repo, journal_path):
+    note = NoteEntry("new-1", datetime(2026, 10, 16, 10, 0), "first call")
+    queue = WriteQueue(repo, WriteJournal(journal_path))
+    queue.append(new_row("new-1"))
+    queue.append_note(note)
+    # The writes reached the sheet, then the app died before the ack.
+    repo.write_appends({"new-1": new_row("new-1")})
+    repo.write_notes([note])
+
+    replayed = WriteQueue(repo, WriteJournal(journal_path))
+    assert replayed.pending_ids() == {"new-1"}
+    replayed.flush()
+
+    ids = [r[0] for r in repo.spreadsheet.worksheet(PIPELINE_TAB_NAME).grid]
+    assert ids.count("new-1") == 1
+    assert repo.notes(["new-1"])["new-1"] == "[2026-10-16T10:00:00] first call"
+    assert len(WriteJournal(journal_path).records()) == 0
+
+
+def test_replay_restores_queue_order_and_merges(repo, journal_path):
+    base = first_row(repo)
+    queue = WriteQueue(repo, WriteJournal(journal_path))
+    queue.append(new_row("new-1"))
+    queue.update("new-1", dict(new_row("new-1"), stage="offer"))
+    queue.append(new_row("new-2"))
+    queue.delete("new-2")
+    queue.delete(base["id"])
+
+    replayed = WriteQueue(repo, WriteJournal(journal_path))
+    assert replayed.pending_ids() == {"new-1", base["id"]}
+    replayed.flush()
+    rows = sheet_rows(repo)
+    assert rows["new-1"]["stage"] == "offer"
+    assert "new-2" not in rows
+    assert base["id"] not in rows
+
+
+def test_conflicting_update_is_skipped(repo, journal_path):
+    base = first_row(repo)
+    set_cell(repo, base["id"], "stage", "interview")
+    set_cell(repo, base["id"], "updated_at", "2026-10-16T09:30:00")
+
+    queue = WriteQueue(repo, WriteJournal(journal_path))
+    queue.update(base["id"], dict(base, stage="offer", updated_at=STAMP), base)
+    queue.flush()
+
+    assert queue.conflicts == [base["id"]]
+    assert sheet_rows(repo)[base["id"]]["stage"] == "interview"
+    assert len(WriteJournal(journal_path).records()) == 0
+
+
+def test_blank_stored_stamp_is_not_a_conflict(repo, journal_path):
+    # A row added by hand: the parser gave it a stand-in stamp.
+    base = first_row(repo)
+    set_cell(repo, base["id"], "updated_at", "")
+    base["updated_at"] = "2026-10-16T09:00:00"
+
+    queue = WriteQueue(repo, WriteJournal(journal_path))
+    queue.update(base["id"], dict(base, stage="offer", updated_at=STAMP), base)
+    queue.flush()
+
+    assert queue.conflicts == []
+    assert sheet_rows(repo)[base["id"]]["stage"] == "offer"
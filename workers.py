@@ -0,0 +1,109 @@
+"""
+Background execution of storage backend calls for RecToDo.
+"""
+
+from typing import Any, Callable, Iterable, Optional, Set
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+class _TaskSignals(QObject):
+    item = Signal(object, object)
+    done = Signal(object, object)
+    failed = Signal(object, object)
+
+
+class _Task(QRunnable):
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        args: tuple,
+        on_done: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[Exception], None]],
+        on_item: Optional[Callable[[Any], None]] = None,
+    ):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_item = on_item
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+            if self.on_item is not None:
+                # Generator: hand over each value as soon as it exists.
+                for value in result:
+                    self.signals.item.emit(self, value)
+                result = None
+        except Exception as exc:
+            self.signals.failed.emit(self, exc)
+        else:
+            self.signals.done.emit(self, result)
+
+
+class SheetIO(QObject):
+    """
+    Runs repository calls on one background thread, in submission order.
+
+    A single thread keeps the backend's shared state (for Sheets: the
+    session and row index) consistent without extra locking; callbacks
+    are delivered on the GUI thread.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._tasks: Set[_Task] = set()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self._start(_Task(fn, args, on_done, on_error))
+
+    def stream(
+        self,
+        fn: Callable[..., Iterable[Any]],
+        *args: Any,
+        on_item: Callable[[Any], None],
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Like submit(), for a generator; on_item gets each value."""
+        self._start(_Task(fn, args, on_done, on_error, on_item))
+
+    def _start(self, task: _Task) -> None:
+        task.setAutoDelete(False)
+        self._tasks.add(task)
+        # Slots on this object run on the GUI thread (queued connection).
+        task.signals.item.connect(self._deliver_item)
+        task.signals.done.connect(self._finish_done)
+        task.signals.failed.connect(self._finish_failed)
+        self.pool.start(task)
+
+    @Slot(object, object)
+    def _deliver_item(self, task: _Task, value: Any) -> None:
+        task.on_item(value)
+
+    @Slot(object, object)
+    def _finish_done(self, task: _Task, result: Any) -> None:
+        self._tasks.discard(task)
+        if task.on_done is not None:
+            task.on_done(result)
+
+    @Slot(object, object)
+    def _finish_failed(self, task: _Task, exc: Exception) -> None:
+        self._tasks.discard(task)
+        if task.on_error is not None:
+            task.on_error(exc)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until queued calls have finished (used on exit)."""
+        return self.pool.waitForDone(msecs)
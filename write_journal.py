@@ -0,0 +1,85 @@
+"""
+Durable journal of queued writes for RecToDo.
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+JOURNAL_PATH = "rectodo_journal.sqlite3"
+
+
+class WriteJournal:
+    """
+    Append-only log of the mutations in the write queue (update, append,
+    delete, note), written and synced to disk before the mutation is
+    queued. Each record has an idempotency key; once the backend has
+    confirmed a mutation its records are acknowledged by key and removed.
+    Whatever is still in the journal on the next start (after a crash, a
+    closed laptop or a day offline) is replayed into the queue.
+    """
+
+    def __init__(self, path: str = JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS journal ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "key TEXT NOT NULL UNIQUE, "
+                "kind TEXT NOT NULL, "
+                "row_id TEXT NOT NULL, "
+                "payload TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections as in local_mirror; FULL sync so a
+        # record is on disk before append() returns.
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                conn.execute("PRAGMA synchronous=FULL")
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def append(self, kind: str, row_id: str, payload: Dict[str, Any]) -> str:
+        """Record one mutation; returns its idempotency key."""
+        key = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO journal (key, kind, row_id, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (key, kind, row_id, json.dumps(payload)),
+            )
+        return key
+
+    def ack(self, keys: Iterable[str]) -> None:
+        """Drop the records of mutations the backend has confirmed."""
+        keys = list(keys)
+        if not keys:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM journal WHERE key = ?", [(k,) for k in keys]
+            )
+
+    def records(self) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+        """
+        Unacknowledged records, oldest first, as
+        (key, kind, row_id, payload) tuples.
+        """
+        with self._connect() as conn:
+            return [
+                (key, kind, row_id, json.loads(payload))
+                for key, kind, row_id, payload in conn.execute(
+                    "SELECT key, kind, row_id, payload FROM journal "
+                    "ORDER BY seq"
+                )
+            ]